@@ -16,7 +16,7 @@ from sc2.client import Client
 import sc2
 from sc2.player import Computer, Human
 from sc2.protocol import ConnectionAlreadyClosed
-from sharpy.tools import LoggingUtility
+from sharpy.tools import LoggingUtility, ImportReport
 
 
 def run_ladder_game(bot):
@@ -30,8 +30,13 @@ def run_ladder_game(bot):
     parser.add_argument("--ComputerDifficulty", type=str, nargs="?", help="Computer difficulty")
     parser.add_argument("--OpponentId", type=str, nargs="?", help="Opponent ID")
     parser.add_argument("--RealTime", action="store_true", help="real time flag")
+    parser.add_argument("--ImportReport", action="store_true", help="Write import times of the bot to data folder")
     args, unknown = parser.parse_known_args()
 
+    if args.ImportReport:
+        import_report(bot)
+        return None, None
+
     if args.GamePort is None or args.StartPort is None:
         return stand_alone_game(bot), None
 
@@ -76,6 +81,19 @@ def run_ladder_game(bot):
     return result, args.OpponentId
 
 
+def import_report(bot):
+    """
+    Measures import times of the bot module and writes them to data/import_times.txt
+    """
+    report = ImportReport([type(bot.ai).__module__])
+    report.measure()
+    path = os.path.join("data", "import_times.txt")
+    report.write(path)
+    for line in report.lines(20):
+        print(line)
+    print(f"Import report written to {path}")
+
+
 # Modified version of sc2.main._join_game to allow custom host and port, and to not spawn an additional sc2process (thanks to alkurbatov for fix)
 async def join_ladder_game(
     host, port, players, realtime, portconfig, save_replay_as=None, step_time_limit=None, game_time_limit=None
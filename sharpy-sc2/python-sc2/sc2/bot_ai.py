@@ -7,6 +7,8 @@ import warnings
 from collections import Counter
 from typing import Any, Dict, List, Optional, Set, Tuple, Union, TYPE_CHECKING
 from contextlib import suppress
+
+import numpy as np
 from s2clientprotocol import sc2api_pb2 as sc_pb
 
 from .cache import property_cache_forever, property_cache_once_per_frame, property_cache_once_per_frame_no_copy
@@ -50,6 +52,22 @@ if TYPE_CHECKING:
     from .game_info import GameInfo, Ramp
     from .client import Client
 
+# Categories of own unit types, used to sort units into Units collections in _prepare_units
+UNIT, WORKER, LARVA, STRUCTURE, TOWNHALL, GAS, TECHLAB, REACTOR = range(8)
+TECHLAB_TYPES: Set[UnitTypeId] = {
+    UnitTypeId.TECHLAB,
+    UnitTypeId.BARRACKSTECHLAB,
+    UnitTypeId.FACTORYTECHLAB,
+    UnitTypeId.STARPORTTECHLAB,
+}
+REACTOR_TYPES: Set[UnitTypeId] = {
+    UnitTypeId.REACTOR,
+    UnitTypeId.BARRACKSREACTOR,
+    UnitTypeId.FACTORYREACTOR,
+    UnitTypeId.STARPORTREACTOR,
+}
+WORKER_TYPES: Set[UnitTypeId] = {UnitTypeId.DRONE, UnitTypeId.DRONEBURROWED, UnitTypeId.SCV, UnitTypeId.PROBE}
+
 
 class BotAI(DistanceCalculation):
     """Base class for bots."""
@@ -71,6 +89,13 @@ class BotAI(DistanceCalculation):
         # Select if the Unit.command should return UnitCommand objects. Set this to True if your bot uses 'self.do(unit(ability, target))'
         if not hasattr(self, "unit_command_uses_self_do"):
             self.unit_command_uses_self_do: bool = False
+        # Select if Unit objects are reused between frames. Each unit tag then has two Unit objects that are
+        # rebound to new data in turns, so the Unit objects of the previous frame stay intact for events.
+        # Do not enable this if your bot compares Unit objects stored for more than one frame to current units.
+        if not hasattr(self, "reuse_unit_objects"):
+            self.reuse_unit_objects: bool = False
+        self._unit_pool: Dict[int, Unit] = {}
+        self._unit_pool_spare: Dict[int, Unit] = {}
         # This value will be set to True by main.py in self._prepare_start if game is played in realtime (if true, the bot will have limited time per step)
         self.realtime: bool = False
         self.all_units: Units = Units([], self)
@@ -308,29 +333,7 @@ class BotAI(DistanceCalculation):
         # Distance we group resources by
         resource_spread_threshold: float = 8.5
         geysers: Units = self.vespene_geyser
-        # Create a group for every resource
-        resource_groups: List[List[Unit]] = [
-            [resource]
-            for resource in self.resources
-            if resource.name != "MineralField450"  # dont use low mineral count patches
-        ]
-        # Loop the merging process as long as we change something
-        merged_group = True
-        while merged_group:
-            merged_group = False
-            # Check every combination of two groups
-            for group_a, group_b in itertools.combinations(resource_groups, 2):
-                # Check if any pair of resource of these groups is closer than threshold together
-                if any(
-                    resource_a.distance_to(resource_b) <= resource_spread_threshold
-                    for resource_a, resource_b in itertools.product(group_a, group_b)
-                ):
-                    # Remove the single groups and add the merged group
-                    resource_groups.remove(group_a)
-                    resource_groups.remove(group_b)
-                    resource_groups.append(group_a + group_b)
-                    merged_group = True
-                    break
+        resource_groups: List[List[Unit]] = self._group_resources(resource_spread_threshold)
         # Distance offsets we apply to center of each resource group to find expansion position
         offset_range = 7
         offsets = [
@@ -338,8 +341,11 @@ class BotAI(DistanceCalculation):
             for x, y in itertools.product(range(-offset_range, offset_range + 1), repeat=2)
             if math.hypot(x, y) <= 8
         ]
-        # Dict we want to return
-        centers = {}
+        offsets_array = np.array(offsets, dtype=np.float64)
+        placement_grid: np.ndarray = self._game_info.placement_grid.data_numpy
+        height, width = placement_grid.shape
+        # Numpy distances may differ from math.hypot in the last bits, values this close are checked again exactly
+        tolerance = 1e-6
         # For every resource group:
         for resources in resource_groups:
             # Possible expansion points
@@ -348,27 +354,92 @@ class BotAI(DistanceCalculation):
             # coordinates because bases have size 5.
             center_x = int(sum(resource.position.x for resource in resources) / amount) + 0.5
             center_y = int(sum(resource.position.y for resource in resources) / amount) + 0.5
-            possible_points = (Point2((offset[0] + center_x, offset[1] + center_y)) for offset in offsets)
-            # Filter out points that are too near
+            points = offsets_array + (center_x, center_y)
+            positions = np.array([resource.position for resource in resources], dtype=np.float64)
+            thresholds = np.array([7 if resource in geysers else 6 for resource in resources])
+            # Distances from every possible point to every resource, shape (points, resources)
+            distances = np.hypot(
+                points[:, 0, np.newaxis] - positions[np.newaxis, :, 0],
+                points[:, 1, np.newaxis] - positions[np.newaxis, :, 1],
+            )
+            # Check if point can be built on
+            tiles = np.floor(points).astype(int)
+            inside = (tiles[:, 0] >= 0) & (tiles[:, 0] < width) & (tiles[:, 1] >= 0) & (tiles[:, 1] < height)
+            buildable = np.zeros(len(points), dtype=bool)
+            buildable[inside] = placement_grid[tiles[inside, 1], tiles[inside, 0]] == 1
+            # Check if all resources have enough space to point
+            margins = (distances - thresholds).min(axis=1)
+            valid = buildable & (margins > tolerance)
+            for index in np.flatnonzero(buildable & (np.abs(margins) <= tolerance)):
+                point = Point2((offsets[index][0] + center_x, offsets[index][1] + center_y))
+                valid[index] = all(
+                    point.distance_to(resource) > (7 if resource in geysers else 6) for resource in resources
+                )
+            # Choose best fitting point, only points that are close to the best score need an exact comparison
+            scores = distances.sum(axis=1)
+            if valid.any():
+                valid &= scores <= scores[valid].min() + tolerance
             possible_points = (
-                point
-                for point in possible_points
-                # Check if point can be built on
-                if self._game_info.placement_grid[point.rounded] == 1
-                # Check if all resources have enough space to point
-                and all(point.distance_to(resource) > (7 if resource in geysers else 6) for resource in resources)
+                Point2((offsets[index][0] + center_x, offsets[index][1] + center_y)) for index in np.flatnonzero(valid)
             )
-            # Choose best fitting point
             result: Point2 = min(
                 possible_points, key=lambda point: sum(point.distance_to(resource) for resource in resources)
             )
-            centers[result] = resources
             # Put all expansion locations in a list
             self._expansion_positions_list.append(result)
             # Maps all resource positions to the expansion position
             for resource in resources:
                 self._resource_location_to_expansion_position_dict[resource.position] = result
 
+    def _group_resources(self, threshold: float) -> List[List[Unit]]:
+        """ Groups resources that are closer than threshold to any resource of the group.
+
+        Gives the same groups in the same order as merging the first two groups of every combination of groups
+        that are close enough, until no more groups can be merged. """
+        resources: List[Unit] = [
+            resource
+            for resource in self.resources
+            if resource.name != "MineralField450"  # dont use low mineral count patches
+        ]
+        if not resources:
+            return []
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            from scipy.spatial import cKDTree
+
+        # Pairs of resources that are close enough, the tree only finds candidates and they are checked exactly
+        tree = cKDTree(np.array([resource.position for resource in resources], dtype=np.float64))
+        neighbours: Dict[int, Set[int]] = {index: set() for index in range(len(resources))}
+        for index_a, index_b in tree.query_pairs(threshold + 0.01):
+            if resources[index_a].distance_to(resources[index_b]) <= threshold:
+                neighbours[index_a].add(index_b)
+                neighbours[index_b].add(index_a)
+
+        groups: Dict[int, List[Unit]] = {index: [resource] for index, resource in enumerate(resources)}
+        order: List[int] = list(range(len(resources)))
+        next_group = len(resources)
+        while True:
+            # First group in the list that has a neighbour is merged with the neighbour that is first in the list,
+            # merged group is added to the end of the list
+            group_a = next((group for group in order if neighbours[group]), None)
+            if group_a is None:
+                break
+            positions = {group: index for index, group in enumerate(order)}
+            group_b = min(neighbours[group_a], key=positions.__getitem__)
+            merged = next_group
+            next_group += 1
+            groups[merged] = groups.pop(group_a) + groups.pop(group_b)
+            merged_neighbours = (neighbours.pop(group_a) | neighbours.pop(group_b)) - {group_a, group_b}
+            for group in merged_neighbours:
+                neighbours[group] -= {group_a, group_b}
+                neighbours[group].add(merged)
+            neighbours[merged] = merged_neighbours
+            order.remove(group_a)
+            order.remove(group_b)
+            order.append(merged)
+        return [groups[group] for group in order]
+
     @property
     def units_created(self) -> Counter:
         """ Returns a Counter for all your units and buildings you have created so far.
@@ -1499,16 +1570,17 @@ class BotAI(DistanceCalculation):
             logger.error(f"Error: {r} (action: {action})")
         return r
 
-    async def _do_actions(self, actions: List[UnitCommand], prevent_double: bool = True):
+    async def _do_actions(self, actions: List[UnitCommand], prevent_double: bool = True, wait: bool = True):
         """ Used internally by main.py automatically, use self.do() instead!
 
         :param actions:
-        :param prevent_double: """
+        :param prevent_double:
+        :param wait: When False, the actions are sent without waiting for the result and None is returned """
         if not actions:
             return None
         if prevent_double:
             actions = list(filter(self.prevent_double_actions, actions))
-        result = await self._client.actions(actions)
+        result = await self._client.actions(actions, wait=wait)
         return result
 
     def prevent_double_actions(self, action) -> bool:
@@ -1635,6 +1707,27 @@ class BotAI(DistanceCalculation):
             self.enemy_race: Race = Race(self._game_info.player_races[3 - self.player_id])
 
         self._distances_override_functions(self.distance_calculation_method)
+        # Categories of own unit types and whether unit types are structures by unit type value
+        self._own_unit_categories: Dict[int, int] = {}
+        self._structure_types: Dict[int, bool] = {}
+
+    def _own_unit_category(self, unit: Unit) -> int:
+        unit_id = unit.type_id
+        if unit.is_structure:
+            if unit_id in race_townhalls[self.race]:
+                return TOWNHALL
+            if unit_id in ALL_GAS:
+                return GAS
+            if unit_id in TECHLAB_TYPES:
+                return TECHLAB
+            if unit_id in REACTOR_TYPES:
+                return REACTOR
+            return STRUCTURE
+        if unit_id in WORKER_TYPES:
+            return WORKER
+        if unit_id == UnitTypeId.LARVA:
+            return LARVA
+        return UNIT
 
     def _prepare_first_step(self):
         """First step extra preparations. Must not be called before _prepare_step."""
@@ -1653,9 +1746,7 @@ class BotAI(DistanceCalculation):
         # Set attributes from new state before on_step."""
         self.state: GameState = state  # See game_state.py
         # update pathing grid, which unfortunately is in GameInfo instead of GameState
-        self._game_info.pathing_grid: PixelMap = PixelMap(
-            proto_game_info.game_info.start_raw.pathing_grid, in_bits=True, mirrored=False
-        )
+        self._game_info._update_pathing_grid(proto_game_info.game_info.start_raw.pathing_grid)
         # Required for events, needs to be before self.units are initialized so the old units are stored
         self._units_previous_map: Dict[int:Unit] = {unit.tag: unit for unit in self.units}
         self._structures_previous_map: Dict[int:Unit] = {structure.tag: structure for structure in self.structures}
@@ -1709,7 +1800,13 @@ class BotAI(DistanceCalculation):
         self.techlab_tags: Set[int] = set()
         self.reactor_tags: Set[int] = set()
 
-        worker_types: Set[UnitTypeId] = {UnitTypeId.DRONE, UnitTypeId.DRONEBURROWED, UnitTypeId.SCV, UnitTypeId.PROBE}
+        own_categories = self._own_unit_categories
+        structure_types = self._structure_types
+        reuse_unit_objects = self.reuse_unit_objects
+        if reuse_unit_objects:
+            # Objects of the previous frame are left untouched, objects from two frames ago are rebound
+            unit_pool: Dict[int, Unit] = {}
+            spare_units = self._unit_pool_spare
 
         index: int = 0
         for unit in self.state.observation_raw.units:
@@ -1721,7 +1818,15 @@ class BotAI(DistanceCalculation):
                 if unit_type in FakeEffectID:
                     self.state.effects.add(EffectData(unit, fake=True))
                     continue
-                unit_obj = Unit(unit, self, distance_calculation_index=index)
+                if reuse_unit_objects:
+                    unit_obj = spare_units.pop(unit.tag, None)
+                    if unit_obj is None:
+                        unit_obj = Unit(unit, self, distance_calculation_index=index)
+                    else:
+                        unit_obj._rebind(unit, distance_calculation_index=index)
+                    unit_pool[unit.tag] = unit_obj
+                else:
+                    unit_obj = Unit(unit, self, distance_calculation_index=index)
                 index += 1
                 self.all_units.append(unit_obj)
                 if unit.display_type == IS_PLACEHOLDER:
@@ -1747,42 +1852,41 @@ class BotAI(DistanceCalculation):
                 # Alliance.Self.value = 1
                 elif alliance == 1:
                     self.all_own_units.append(unit_obj)
-                    unit_id = unit_obj.type_id
-                    if unit_obj.is_structure:
+                    category = own_categories.get(unit_type, None)
+                    if category is None:
+                        category = own_categories[unit_type] = self._own_unit_category(unit_obj)
+                    if category >= STRUCTURE:
                         self.structures.append(unit_obj)
-                        if unit_id in race_townhalls[self.race]:
+                        if category == TOWNHALL:
                             self.townhalls.append(unit_obj)
-                        elif unit_id in ALL_GAS or unit_obj.vespene_contents:
+                        elif category == GAS or (category == STRUCTURE and unit_obj.vespene_contents):
                             # TODO: remove "or unit_obj.vespene_contents" when a new linux client newer than version 4.10.0 is released
                             self.gas_buildings.append(unit_obj)
-                        elif unit_id in {
-                            UnitTypeId.TECHLAB,
-                            UnitTypeId.BARRACKSTECHLAB,
-                            UnitTypeId.FACTORYTECHLAB,
-                            UnitTypeId.STARPORTTECHLAB,
-                        }:
+                        elif category == TECHLAB:
                             self.techlab_tags.add(unit_obj.tag)
-                        elif unit_id in {
-                            UnitTypeId.REACTOR,
-                            UnitTypeId.BARRACKSREACTOR,
-                            UnitTypeId.FACTORYREACTOR,
-                            UnitTypeId.STARPORTREACTOR,
-                        }:
+                        elif category == REACTOR:
                             self.reactor_tags.add(unit_obj.tag)
                     else:
                         self.units.append(unit_obj)
-                        if unit_id in worker_types:
+                        if category == WORKER:
                             self.workers.append(unit_obj)
-                        elif unit_id == UnitTypeId.LARVA:
+                        elif category == LARVA:
                             self.larva.append(unit_obj)
                 # Alliance.Enemy.value = 4
                 elif alliance == 4:
                     self.all_enemy_units.append(unit_obj)
-                    if unit_obj.is_structure:
+                    is_structure = structure_types.get(unit_type, None)
+                    if is_structure is None:
+                        is_structure = structure_types[unit_type] = unit_obj.is_structure
+                    if is_structure:
                         self.enemy_structures.append(unit_obj)
                     else:
                         self.enemy_units.append(unit_obj)
 
+        if reuse_unit_objects:
+            self._unit_pool_spare = self._unit_pool
+            self._unit_pool = unit_pool
+
         # Force distance calculation and caching on all units using scipy pdist or cdist
         if self.distance_calculation_method == 1:
             _ = self._pdist
@@ -1801,7 +1905,7 @@ class BotAI(DistanceCalculation):
         self._total_steps_iterations += 1
         # Commit and clear bot actions
         if self.actions:
-            await self._do_actions(self.actions)
+            await self._do_actions(self.actions, wait=not self._client.pipeline_requests)
             self.actions.clear()
         # Clear set of unit tags that were given an order this frame by self.do()
         self.unit_tags_received_action.clear()
@@ -41,6 +41,9 @@ class Client(Protocol):
 
         self._renderer = None
         self.raw_affects_selection = False
+        # Send actions, debug draw and step without waiting for their responses to save round trips to SC2.
+        # When not playing in realtime, game info is also requested together with the observation.
+        self.pipeline_requests = False
 
     @property
     def in_game(self):
@@ -144,8 +147,12 @@ class Client(Protocol):
         return result
 
     async def step(self, step_size: int = None):
-        """ EXPERIMENTAL: Change self._client.game_step during the step function to increase or decrease steps per second """
+        """ EXPERIMENTAL: Change self._client.game_step during the step function to increase or decrease steps per second
+        When requests are pipelined, the step is not waited for and None is returned. """
         step_size = step_size or self.game_step
+        if self.pipeline_requests:
+            await self._send_detached(step=sc_pb.RequestStep(count=step_size))
+            return None
         return await self._execute(step=sc_pb.RequestStep(count=step_size))
 
     async def get_game_data(self) -> GameData:
@@ -178,17 +185,24 @@ class Client(Protocol):
         result = await self._execute(game_info=sc_pb.RequestGameInfo())
         return GameInfo(result.game_info)
 
-    async def actions(self, actions, return_successes=False):
+    async def actions(self, actions, return_successes=False, wait=True):
+        """
+        :param actions:
+        :param return_successes:
+        :param wait: When False, the actions are sent without waiting for the response and None is returned """
         if not actions:
             return None
         elif not isinstance(actions, list):
             actions = [actions]
 
+        request = sc_pb.RequestAction(actions=(sc_pb.Action(action_raw=a) for a in combine_actions(actions)))
+        if not wait:
+            await self._send_detached(ignore_errors=True, action=request)
+            return None
+
         # On realtime=True, might get an error here: sc2.protocol.ProtocolError: ['Not in a game']
         try:
-            res = await self._execute(
-                action=sc_pb.RequestAction(actions=(sc_pb.Action(action_raw=a) for a in combine_actions(actions)))
-            )
+            res = await self._execute(action=request)
         except ProtocolError as e:
             return []
         if return_successes:
@@ -555,8 +569,8 @@ class Client(Protocol):
             if debug_hash != self._debug_hash_tuple_last_iteration:
                 # Something has changed, either more or less is to be drawn, or a position of a drawing changed (e.g. when drawing on a moving unit)
                 self._debug_hash_tuple_last_iteration = debug_hash
-                await self._execute(
-                    debug=sc_pb.RequestDebug(
+                await self._execute_debug(
+                    sc_pb.RequestDebug(
                         debug=[
                             debug_pb.DebugCommand(
                                 draw=debug_pb.DebugDraw(
@@ -581,8 +595,8 @@ class Client(Protocol):
         elif self._debug_draw_last_frame:
             # Clear drawing if we drew last frame but nothing to draw this frame
             self._debug_hash_tuple_last_iteration = (0, 0, 0, 0)
-            await self._execute(
-                debug=sc_pb.RequestDebug(
+            await self._execute_debug(
+                sc_pb.RequestDebug(
                     debug=[
                         debug_pb.DebugCommand(draw=debug_pb.DebugDraw(text=None, lines=None, boxes=None, spheres=None))
                     ]
@@ -590,6 +604,12 @@ class Client(Protocol):
             )
             self._debug_draw_last_frame = False
 
+    async def _execute_debug(self, request: sc_pb.RequestDebug):
+        if self.pipeline_requests:
+            await self._send_detached(debug=request)
+        else:
+            await self._execute(debug=request)
+
     async def debug_leave(self):
         await self._execute(debug=sc_pb.RequestDebug(debug=[debug_pb.DebugCommand(end_game=debug_pb.DebugEndGame())]))
 
@@ -10,13 +10,17 @@ from math import pow
 import numpy as np
 import warnings
 
-with warnings.catch_warnings():
-    warnings.simplefilter("ignore")
-    from scipy.spatial.distance import pdist, cdist
-
 from typing import Dict, Tuple, Iterable, Generator
 
 
+def _distance_functions():
+    """ Imports scipy on first use instead of on startup, importing it takes a noticeable amount of time. """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        from scipy.spatial.distance import pdist, cdist
+    return pdist, cdist
+
+
 class DistanceCalculation:
     def __init__(self):
         self.state: GameState = None
@@ -54,6 +58,7 @@ class DistanceCalculation:
         )
         assert len(positions_array) == self._units_count
         # See performance benchmarks
+        pdist, _ = _distance_functions()
         self._cached_pdist = pdist(positions_array, "sqeuclidean")
 
         return self._cached_pdist
@@ -68,6 +73,7 @@ class DistanceCalculation:
         )
         assert len(positions_array) == self._units_count
         # See performance benchmarks
+        _, cdist = _distance_functions()
         self._cached_cdist = cdist(positions_array, positions_array, "sqeuclidean")
 
         return self._cached_cdist
@@ -80,6 +86,7 @@ class DistanceCalculation:
             (-1, 2)
         )
         # See performance benchmarks
+        _, cdist = _distance_functions()
         self._cached_cdist = cdist(positions_array, positions_array, "sqeuclidean")
 
         return self._cached_cdist
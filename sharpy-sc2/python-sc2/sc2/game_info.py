@@ -230,8 +230,9 @@ class GameInfo:
         self.local_map_path: str = self._proto.local_map_path
         self.map_size: Size = Size.from_proto(self._proto.start_raw.map_size)
 
-        # self.pathing_grid[point]: if 0, point is not pathable, if 1, point is pathable
-        self.pathing_grid: PixelMap = PixelMap(self._proto.start_raw.pathing_grid, in_bits=True, mirrored=False)
+        # Pathing grid is decoded on first access
+        self._pathing_grid_proto = self._proto.start_raw.pathing_grid
+        self._pathing_grid: Optional[PixelMap] = None
         # self.terrain_height[point]: returns the height in range of 0 to 255 at that point
         self.terrain_height: PixelMap = PixelMap(self._proto.start_raw.terrain_height, mirrored=False)
         # self.placement_grid[point]: if 0, point is not placeable, if 1, point is pathable
@@ -246,6 +247,22 @@ class GameInfo:
         self.start_locations: List[Point2] = [Point2.from_proto(sl) for sl in self._proto.start_raw.start_locations]
         self.player_start_location: Point2 = None  # Filled later by BotAI._prepare_first_step
 
+    @property
+    def pathing_grid(self) -> PixelMap:
+        """ self.pathing_grid[point]: if 0, point is not pathable, if 1, point is pathable """
+        if self._pathing_grid is None:
+            self._pathing_grid = PixelMap(self._pathing_grid_proto, in_bits=True, mirrored=False)
+        return self._pathing_grid
+
+    @pathing_grid.setter
+    def pathing_grid(self, pathing_grid: PixelMap):
+        self._pathing_grid = pathing_grid
+
+    def _update_pathing_grid(self, proto):
+        """ Replaces the pathing grid with the one in proto, it is decoded on next access. """
+        self._pathing_grid_proto = proto
+        self._pathing_grid = None
+
     def _find_ramps_and_vision_blockers(self) -> Tuple[List[Ramp], Set[Point2]]:
         """ Calculate points that are pathable but not placeable.
         Then divide them into ramp points if not all points around the points are equal height
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import Any, Dict, List, Optional, Set, Tuple, Union, TYPE_CHECKING
 
+from .cache import property_cache_forever
 from .constants import FakeEffectID, FakeEffectRadii, IS_MINE, IS_ENEMY
 from .data import Alliance, DisplayType
 from .ids.effect_id import EffectId
@@ -131,6 +132,23 @@ class EffectData:
         return f"{self.id} with radius {self.radius} at {self.positions}"
 
 
+# Pixel maps of the latest observation and their data, reused while the data stays the same
+_previous_maps: Dict[str, Tuple[bytes, PixelMap]] = {}
+
+
+def _pixel_map(name: str, proto, in_bits: bool = False) -> PixelMap:
+    """ Returns pixel map of the previous observation if its data has not changed, data of these maps is read-only. """
+    data: bytes = proto.data
+    previous = _previous_maps.get(name)
+    if previous is not None and previous[0] == data and previous[1].width == proto.size.x:
+        return previous[1]
+
+    pixel_map = PixelMap(proto, in_bits=in_bits, mirrored=False)
+    pixel_map.data_numpy.flags.writeable = False
+    _previous_maps[name] = (data, pixel_map)
+    return pixel_map
+
+
 class GameState:
     def __init__(self, response_observation):
         """
@@ -152,23 +170,40 @@ class GameState:
         self.psionic_matrix: PsionicMatrix = PsionicMatrix.from_proto(self.observation_raw.player.power_sources)
         self.game_loop: int = self.observation.game_loop  # 22.4 per second on faster game speed
 
-        # https://github.com/Blizzard/s2client-proto/blob/33f0ecf615aa06ca845ffe4739ef3133f37265a9/s2clientprotocol/score.proto#L31
-        self.score: ScoreDetails = ScoreDetails(self.observation.score)
         self.abilities = self.observation.abilities  # abilities of selected units
-        self.upgrades: Set[UpgradeId] = {UpgradeId(upgrade) for upgrade in self.observation_raw.player.upgrade_ids}
 
         # Set of unit tags that died this step
         self.dead_units: Set[int] = {dead_unit_tag for dead_unit_tag in self.observation_raw.event.dead_units}
-        # self.visibility[point]: 0=Hidden, 1=Fogged, 2=Visible
-        self.visibility: PixelMap = PixelMap(self.observation_raw.map_state.visibility, mirrored=False)
-        # self.creep[point]: 0=No creep, 1=creep
-        self.creep: PixelMap = PixelMap(self.observation_raw.map_state.creep, in_bits=True, mirrored=False)
-
-        # Effects like ravager bile shot, lurker attack, everything in effect_id.py
-        self.effects: Set[EffectData] = {EffectData(effect) for effect in self.observation_raw.effects}
-        """ Usage:
+
+    # Score, upgrades, map states and effects are decoded on first access, many steps never use them
+
+    @property_cache_forever
+    def score(self) -> ScoreDetails:
+        # https://github.com/Blizzard/s2client-proto/blob/33f0ecf615aa06ca845ffe4739ef3133f37265a9/s2clientprotocol/score.proto#L31
+        return ScoreDetails(self.observation.score)
+
+    @property_cache_forever
+    def upgrades(self) -> Set[UpgradeId]:
+        return {UpgradeId(upgrade) for upgrade in self.observation_raw.player.upgrade_ids}
+
+    @property_cache_forever
+    def visibility(self) -> PixelMap:
+        """ self.visibility[point]: 0=Hidden, 1=Fogged, 2=Visible """
+        return _pixel_map("visibility", self.observation_raw.map_state.visibility)
+
+    @property_cache_forever
+    def creep(self) -> PixelMap:
+        """ self.creep[point]: 0=No creep, 1=creep """
+        return _pixel_map("creep", self.observation_raw.map_state.creep, in_bits=True)
+
+    @property_cache_forever
+    def effects(self) -> Set[EffectData]:
+        """ Effects like ravager bile shot, lurker attack, everything in effect_id.py
+
+        Usage:
         for effect in self.state.effects:
             if effect.id == EffectId.RAVAGERCORROSIVEBILECP:
                 positions = effect.positions
                 # dodge the ravager biles
         """
+        return {EffectData(effect) for effect in self.observation_raw.effects}
@@ -190,6 +190,7 @@ async def _play_game_ai(client, player_id, ai, realtime, step_time_limit, game_t
     iteration = 0
     while True:
         if iteration != 0:
+            pending_game_info = None
             if realtime:
                 # On realtime=True, might get an error here: sc2.protocol.ProtocolError: ['Not in a game']
                 try:
@@ -204,6 +205,10 @@ async def _play_game_ai(client, player_id, ai, realtime, step_time_limit, game_t
                 except ProtocolError:
                     pass
             else:
+                if client.pipeline_requests:
+                    # Game is not stepped before the next step request, so game info can be requested together with
+                    # the observation and both are answered in one round trip
+                    pending_game_info = await client._send(game_info=sc_pb.RequestGameInfo())
                 state = await client.observation()
             # check game result every time we get the observation
             if client._game_result:
@@ -215,12 +220,15 @@ async def _play_game_ai(client, player_id, ai, realtime, step_time_limit, game_t
                     return client._game_result[player_id]
                 return client._game_result[player_id]
             gs = GameState(state.observation)
-            logger.debug(f"Score: {gs.score.score}")
+            logger.opt(lazy=True).debug("Score: {}", lambda: gs.score.score)
 
             if game_time_limit and (gs.game_loop * 0.725 * (1 / 16)) > game_time_limit:
                 await ai.on_end(Result.Tie)
                 return Result.Tie
-            proto_game_info = await client._execute(game_info=sc_pb.RequestGameInfo())
+            if pending_game_info is not None:
+                proto_game_info = await client._receive(pending_game_info)
+            else:
+                proto_game_info = await client._execute(game_info=sc_pb.RequestGameInfo())
             ai._prepare_step(gs, proto_game_info)
 
         logger.debug(f"Running AI step, it={iteration} {gs.game_loop * 0.725 * (1 / 16):.2f}s")
@@ -379,7 +387,7 @@ async def _play_replay(client, ai, realtime=False, player_id=0):
                     return client._game_result[player_id]
                 return client._game_result[player_id]
             gs = GameState(state.observation)
-            logger.debug(f"Score: {gs.score.score}")
+            logger.opt(lazy=True).debug("Score: {}", lambda: gs.score.score)
 
             proto_game_info = await client._execute(game_info=sc_pb.RequestGameInfo())
             ai._prepare_step(gs, proto_game_info)
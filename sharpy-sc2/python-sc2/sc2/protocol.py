@@ -1,6 +1,8 @@
 import asyncio
 
 import sys
+from collections import deque
+from typing import Deque, Optional
 
 from s2clientprotocol import sc2api_pb2 as sc_pb
 from aiohttp import ClientWebSocketResponse
@@ -20,6 +22,23 @@ class ConnectionAlreadyClosed(ProtocolError):
     pass
 
 
+class PendingResponse:
+    """Response to a request that has been sent, but whose response may not have been read yet."""
+
+    __slots__ = ("response", "error", "detached", "ignore_errors")
+
+    def __init__(self, detached: bool = False, ignore_errors: bool = False):
+        self.response: Optional[sc_pb.Response] = None
+        self.error: Optional[ProtocolError] = None
+        # Nobody waits for the response of a detached request
+        self.detached = detached
+        self.ignore_errors = ignore_errors
+
+    @property
+    def done(self) -> bool:
+        return self.response is not None or self.error is not None
+
+
 class Protocol:
     def __init__(self, ws):
         """
@@ -29,9 +48,14 @@ class Protocol:
         assert ws
         self._ws: ClientWebSocketResponse = ws
         self._status: Status = None
-
-    async def __request(self, request):
-        logger.debug(f"Sending request: {request !r}")
+        # SC2 answers requests in the order they were sent, responses that have not been read yet
+        self._pending: Deque[PendingResponse] = deque()
+        # Errors of detached requests are raised by the next request that waits for its response
+        self._detached_error: Optional[ProtocolError] = None
+
+    async def __send(self, request) -> None:
+        # Formatting the whole request is expensive with observations and actions, only do it when debug is logged
+        logger.opt(lazy=True).debug("Sending request: {}", lambda: repr(request))
         try:
             await self._ws.send_bytes(request.SerializeToString())
         except TypeError:
@@ -39,6 +63,7 @@ class Protocol:
             raise ConnectionAlreadyClosed("Connection already closed.")
         logger.debug(f"Request sent")
 
+    async def __receive(self) -> sc_pb.Response:
         response = sc_pb.Response()
         try:
             response_bytes = await self._ws.receive_bytes()
@@ -62,11 +87,7 @@ class Protocol:
         logger.debug(f"Response received")
         return response
 
-    async def _execute(self, **kwargs):
-        assert len(kwargs) == 1, "Only one request allowed"
-
-        response = await self.__request(sc_pb.Request(**kwargs))
-
+    def _check_response(self, response: sc_pb.Response) -> sc_pb.Response:
         new_status = Status(response.status)
         if new_status != self._status:
             logger.info(f"Client status changed to {new_status} (was {self._status})")
@@ -78,6 +99,58 @@ class Protocol:
 
         return response
 
+    async def _send(self, **kwargs) -> PendingResponse:
+        """
+        Sends the request without waiting for the response.
+        Read the response with _receive, requests sent in between are pipelined this way.
+        """
+        assert len(kwargs) == 1, "Only one request allowed"
+        await self.__send(sc_pb.Request(**kwargs))
+        pending = PendingResponse()
+        self._pending.append(pending)
+        return pending
+
+    async def _send_detached(self, ignore_errors: bool = False, **kwargs) -> None:
+        """
+        Sends the request without ever waiting for its response, e.g. actions, debug draw or step.
+        The response is read when a later request waits for its response.
+        Unless ignore_errors is set, an error in the response is raised from that later request.
+        """
+        assert len(kwargs) == 1, "Only one request allowed"
+        await self.__send(sc_pb.Request(**kwargs))
+        self._pending.append(PendingResponse(detached=True, ignore_errors=ignore_errors))
+
+    async def _receive(self, pending: PendingResponse) -> sc_pb.Response:
+        """Reads responses in the order the requests were sent until the response to pending has been read."""
+        while not pending.done:
+            current = self._pending[0]
+            try:
+                response = await self.__receive()
+            except asyncio.CancelledError:
+                # The response was read, so that the following responses stay in order
+                self._pending.popleft()
+                current.error = ProtocolError("Request was cancelled")
+                raise
+            self._pending.popleft()
+
+            try:
+                current.response = self._check_response(response)
+            except ProtocolError as error:
+                current.error = error
+                if current.detached and not current.ignore_errors and self._detached_error is None:
+                    self._detached_error = error
+
+        if self._detached_error is not None:
+            error = self._detached_error
+            self._detached_error = None
+            raise error
+        if pending.error is not None:
+            raise pending.error
+        return pending.response
+
+    async def _execute(self, **kwargs):
+        return await self._receive(await self._send(**kwargs))
+
     async def ping(self):
         result = await self._execute(ping=sc_pb.RequestPing())
         return result
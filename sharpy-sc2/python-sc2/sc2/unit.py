@@ -110,6 +110,16 @@ class Unit:
         # Index used in the 2D numpy array to access the 2D distance between two units
         self.distance_calculation_index: int = distance_calculation_index
 
+    def _rebind(self, proto_data, distance_calculation_index: int = -1):
+        """ Updates the object with the data of the same unit on a new frame, used when unit objects are reused.
+
+        :param proto_data:
+        :param distance_calculation_index: """
+        self._proto = proto_data
+        self.cache.clear()
+        self.game_loop = self._bot_object.state.game_loop
+        self.distance_calculation_index = distance_calculation_index
+
     def __repr__(self) -> str:
         """ Returns string of this form: Unit(name='SCV', tag=4396941328). """
         return f"Unit(name={self.name !r}, tag={self.tag})"
@@ -0,0 +1,134 @@
+from __future__ import annotations
+import math
+from typing import Dict, Generator, List, Sequence, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .unit import Unit
+
+# Distances from different distance functions may differ by rounding, candidate areas are grown by this much
+MARGIN = 0.01
+
+
+class UnitGrid:
+    """
+    Spatial hash of units. Units are bucketed by position into square cells, so that distance queries only need to
+    check the units in the cells around the query position.
+
+    The grid returns candidate units by their index in the units sequence, callers check the exact distance
+    condition on the candidates, so that results are identical to checking all units.
+    """
+
+    def __init__(self, units: Sequence[Unit], game_loop: int, cell_size: float = 8):
+        """
+        :param units:
+        :param game_loop: game loop the unit positions are from
+        :param cell_size: """
+        self.units = units
+        self.count = len(units)
+        self.game_loop = game_loop
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        self._max_radius: float = -1
+
+        inverse = 1 / cell_size
+        cells = self.cells
+        for index, unit in enumerate(units):
+            x, y = unit.position_tuple
+            key = (math.floor(x * inverse), math.floor(y * inverse))
+            cell = cells.get(key, None)
+            if cell is None:
+                cells[key] = [index]
+            else:
+                cell.append(index)
+
+        columns = [key[0] for key in cells]
+        rows = [key[1] for key in cells]
+        self.min_cell = (min(columns, default=0), min(rows, default=0))
+        self.max_cell = (max(columns, default=0), max(rows, default=0))
+
+    @property
+    def max_radius(self) -> float:
+        """ Largest radius of the units, calculated on first use. """
+        if self._max_radius < 0:
+            self._max_radius = max((unit.radius for unit in self.units), default=0)
+        return self._max_radius
+
+    def candidates(self, position: Tuple[float, float], distance: float) -> List[int]:
+        """ Returns indices of units that may be closer than distance to position, in ascending order.
+
+        :param position:
+        :param distance: """
+        distance += MARGIN
+        inverse = 1 / self.cell_size
+        x, y = position[0], position[1]
+        x0 = max(math.floor((x - distance) * inverse), self.min_cell[0])
+        x1 = min(math.floor((x + distance) * inverse), self.max_cell[0])
+        y0 = max(math.floor((y - distance) * inverse), self.min_cell[1])
+        y1 = min(math.floor((y + distance) * inverse), self.max_cell[1])
+
+        cells = self.cells
+        result: List[int] = []
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(cells):
+            # Query area is larger than the area with units, check the cells with units instead
+            for (cell_x, cell_y), indices in cells.items():
+                if x0 <= cell_x <= x1 and y0 <= cell_y <= y1:
+                    result.extend(indices)
+        else:
+            for cell_x in range(x0, x1 + 1):
+                for cell_y in range(y0, y1 + 1):
+                    indices = cells.get((cell_x, cell_y), None)
+                    if indices:
+                        result.extend(indices)
+        result.sort()
+        return result
+
+    def rings(self, position: Tuple[float, float]) -> Generator[Tuple[float, List[int]], None, None]:
+        """ Yields indices of units in growing square rings of cells around position.
+        Each item also contains the distance from position within which all units have been yielded.
+        The last item has infinite distance.
+
+        :param position: """
+        inverse = 1 / self.cell_size
+        x, y = position[0], position[1]
+        center_x = math.floor(x * inverse)
+        center_y = math.floor(y * inverse)
+        # Distance from position to the edges of its own cell
+        edge = min(
+            x - center_x * self.cell_size,
+            (center_x + 1) * self.cell_size - x,
+            y - center_y * self.cell_size,
+            (center_y + 1) * self.cell_size - y,
+        )
+        last_ring = max(
+            abs(center_x - self.min_cell[0]),
+            abs(center_x - self.max_cell[0]),
+            abs(center_y - self.min_cell[1]),
+            abs(center_y - self.max_cell[1]),
+        )
+
+        # Rings closer than the cells with units are empty
+        first_ring = max(
+            0,
+            self.min_cell[0] - center_x,
+            center_x - self.max_cell[0],
+            self.min_cell[1] - center_y,
+            center_y - self.max_cell[1],
+        )
+
+        cells = self.cells
+        for ring in range(first_ring, last_ring + 1):
+            indices: List[int] = []
+            if ring == 0:
+                indices.extend(cells.get((center_x, center_y), ()))
+            else:
+                for cell_x in range(center_x - ring, center_x + ring + 1):
+                    indices.extend(cells.get((cell_x, center_y - ring), ()))
+                    indices.extend(cells.get((cell_x, center_y + ring), ()))
+                for cell_y in range(center_y - ring + 1, center_y + ring):
+                    indices.extend(cells.get((center_x - ring, cell_y), ()))
+                    indices.extend(cells.get((center_x + ring, cell_y), ()))
+
+            if ring == last_ring:
+                yield math.inf, indices
+            else:
+                yield max(0, ring * self.cell_size + edge - MARGIN), indices
@@ -8,6 +8,7 @@ from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union, Gener
 from .ids.unit_typeid import UnitTypeId
 from .position import Point2, Point3
 from .unit import Unit
+from .unit_grid import UnitGrid
 import numpy as np
 
 warnings.simplefilter("once")
@@ -16,6 +17,10 @@ if TYPE_CHECKING:
     from .bot_ai import BotAI
 
 
+# Distance queries on Units with at least this many units use a spatial index
+GRID_MIN_UNITS = 24
+
+
 class Units(list):
     """A collection of Unit objects. Makes it easy to select units by selectors."""
 
@@ -30,10 +35,62 @@ class Units(list):
         """
         super().__init__(units)
         self._bot_object = bot_object
+        # Spatial index for distance queries, see _unit_grid
+        self._grid: Optional[UnitGrid] = None
+        self._grid_queried_loop: int = -1
 
     def __call__(self, *args, **kwargs):
         return UnitSelection(self, *args, **kwargs)
 
+    # Appending changes the length, which invalidates the spatial index. Other changes invalidate it explicitly.
+    def __setitem__(self, key, value):
+        self._grid = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._grid = None
+        super().__delitem__(key)
+
+    def insert(self, index, unit):
+        self._grid = None
+        super().insert(index, unit)
+
+    def remove(self, unit):
+        self._grid = None
+        super().remove(unit)
+
+    def pop(self, index=-1):
+        self._grid = None
+        return super().pop(index)
+
+    def clear(self):
+        self._grid = None
+        super().clear()
+
+    def sort(self, *args, **kwargs):
+        self._grid = None
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self._grid = None
+        super().reverse()
+
+    def _unit_grid(self) -> Optional[UnitGrid]:
+        """ Returns the spatial index of the units for distance queries, or None if the units should be scanned instead.
+        Building the index costs about as much as one scan, so it is built on the second query in the same game loop
+        and only for larger groups. """
+        if len(self) < GRID_MIN_UNITS or self._bot_object is None:
+            return None
+        game_loop = self._bot_object.state.game_loop
+        grid = self._grid
+        if grid is not None and grid.game_loop == game_loop and grid.count == len(self):
+            return grid
+        if self._grid_queried_loop != game_loop:
+            self._grid_queried_loop = game_loop
+            return None
+        self._grid = UnitGrid(self, game_loop)
+        return self._grid
+
     def __iter__(self) -> Generator[Unit, None, None]:
         return (item for item in super().__iter__())
 
@@ -158,6 +215,15 @@ class Units(list):
 
         :param unit:
         :param bonus_distance: """
+        grid = self._unit_grid()
+        if grid is not None:
+            attack_range = max(unit.ground_range, unit.air_range)
+            distance = unit.radius + grid.max_radius + attack_range + bonus_distance
+            return self.subgroup(
+                target
+                for target in (self[index] for index in grid.candidates(unit.position_tuple, distance))
+                if unit.target_in_range(target, bonus_distance=bonus_distance)
+            )
         return self.filter(lambda x: unit.target_in_range(x, bonus_distance=bonus_distance))
 
     def closest_distance_to(self, position: Union[Unit, Point2, Point3]) -> float:
@@ -174,6 +240,10 @@ class Units(list):
 
         :param position: """
         assert self, "Units object is empty"
+        grid = self._unit_grid()
+        if grid is not None:
+            unit, distance = self._closest_in_grid(grid, position)
+            return distance
         if isinstance(position, Unit):
             return min(self._bot_object._distance_squared_unit_to_unit(unit, position) for unit in self) ** 0.5
         return min(self._bot_object._distance_units_to_pos(self, position))
@@ -211,6 +281,10 @@ class Units(list):
 
         :param position: """
         assert self, "Units object is empty"
+        grid = self._unit_grid()
+        if grid is not None:
+            unit, distance = self._closest_in_grid(grid, position)
+            return unit
         if isinstance(position, Unit):
             return min(
                 (unit1 for unit1 in self),
@@ -220,6 +294,28 @@ class Units(list):
         distances = self._bot_object._distance_units_to_pos(self, position)
         return min(((unit, dist) for unit, dist in zip(self, distances)), key=lambda my_tuple: my_tuple[1])[0]
 
+    def _closest_in_grid(self, grid: UnitGrid, position: Union[Unit, Point2, Point3]) -> Tuple[Unit, float]:
+        """ Returns the closest unit and its distance using the same distance functions as closest_to.
+        Of units with equal distance, the first one in this Units object is returned. """
+        is_unit = isinstance(position, Unit)
+        best_index = -1
+        # Squared distance when position is a unit
+        best_value = math.inf
+        for covered_distance, indices in grid.rings(self._position_tuple(position)):
+            if indices:
+                units = [self[index] for index in indices]
+                if is_unit:
+                    values = (self._bot_object._distance_squared_unit_to_unit(unit, position) for unit in units)
+                else:
+                    values = self._bot_object._distance_units_to_pos(units, position)
+                for index, value in zip(indices, values):
+                    if value < best_value or (value == best_value and index < best_index):
+                        best_index = index
+                        best_value = value
+            if best_value < (covered_distance ** 2 if is_unit else covered_distance):
+                break
+        return self[best_index], best_value ** 0.5 if is_unit else best_value
+
     def furthest_to(self, position: Union[Unit, Point2, Point3]) -> Unit:
         """
         Returns the furhest unit (from this Units object) to the target unit or position.
@@ -259,15 +355,19 @@ class Units(list):
         """
         if not self:
             return self
+        units = self
+        grid = self._unit_grid()
+        if grid is not None:
+            units = [self[index] for index in grid.candidates(self._position_tuple(position), distance)]
         if isinstance(position, Unit):
             distance_squared = distance ** 2
             return self.subgroup(
                 unit
-                for unit in self
+                for unit in units
                 if self._bot_object._distance_squared_unit_to_unit(unit, position) < distance_squared
             )
-        distances = self._bot_object._distance_units_to_pos(self, position)
-        return self.subgroup(unit for unit, dist in zip(self, distances) if dist < distance)
+        distances = self._bot_object._distance_units_to_pos(units, position)
+        return self.subgroup(unit for unit, dist in zip(units, distances) if dist < distance)
 
     def further_than(self, distance: Union[int, float], position: Union[Unit, Point2, Point3]) -> Units:
         """
@@ -286,15 +386,32 @@ class Units(list):
         """
         if not self:
             return self
+        grid = self._unit_grid()
+        if grid is not None:
+            # Units outside the candidate cells are further away, so only the candidates need to be checked
+            near = grid.candidates(self._position_tuple(position), distance)
+            further = self._further_than_mask(distance, position, [self[index] for index in near])
+            close = {index for index, is_further in zip(near, further) if not is_further}
+            return self.subgroup(unit for index, unit in enumerate(self) if index not in close)
+        further = self._further_than_mask(distance, position, self)
+        return self.subgroup(unit for unit, is_further in zip(self, further) if is_further)
+
+    def _further_than_mask(
+        self, distance: Union[int, float], position: Union[Unit, Point2, Point3], units: Iterable[Unit]
+    ) -> Generator[bool, None, None]:
         if isinstance(position, Unit):
             distance_squared = distance ** 2
-            return self.subgroup(
-                unit
-                for unit in self
-                if distance_squared < self._bot_object._distance_squared_unit_to_unit(unit, position)
+            return (
+                distance_squared < self._bot_object._distance_squared_unit_to_unit(unit, position) for unit in units
             )
-        distances = self._bot_object._distance_units_to_pos(self, position)
-        return self.subgroup(unit for unit, dist in zip(self, distances) if distance < dist)
+        distances = self._bot_object._distance_units_to_pos(units, position)
+        return (distance < dist for dist in distances)
+
+    @staticmethod
+    def _position_tuple(position: Union[Unit, Point2, Point3]) -> Tuple[float, float]:
+        if isinstance(position, Unit):
+            return position.position_tuple
+        return position[0], position[1]
 
     def in_distance_between(
         self, position: Union[Unit, Point2, Tuple[float, float]], distance1: float, distance2: float
@@ -387,6 +504,17 @@ class Units(list):
             else:
                 return self.subgroup([])
 
+        other_grid = other_units._unit_grid() if isinstance(other_units, Units) else None
+        if other_grid is not None:
+            return self.subgroup(
+                self_unit
+                for self_unit in self
+                if any(
+                    self._bot_object._distance_squared_unit_to_unit(self_unit, other_units[index]) < distance_squared
+                    for index in other_grid.candidates(self_unit.position_tuple, distance)
+                )
+            )
+
         return self.subgroup(
             self_unit
             for self_unit in self
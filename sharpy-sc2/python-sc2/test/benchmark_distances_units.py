@@ -14,6 +14,14 @@ from scipy.spatial.distance import cdist, pdist, squareform
 import pytest
 from hypothesis import strategies as st, given, settings
 from typing import List, Dict, Set, Tuple, Any, Optional, Union
+from types import SimpleNamespace
+
+from s2clientprotocol import sc2api_pb2 as sc_pb
+import sc2.units
+from sc2.game_state import GameState
+from sc2.units import Units
+
+from test_pickled_data import get_map_specific_bots
 
 
 def distance_matrix_scipy_cdist(ps):
@@ -136,3 +144,52 @@ def test_distance_matrix_scipy_pdist_squared(benchmark):
 
 # Run this file using
 # pipenv run pytest test/test_benchmark_distances_units.py --benchmark-compare
+
+
+# Benchmarks of Units distance queries with and without the spatial index, on units of a pickled map
+QUERIES = 100
+
+
+def bot_with_units(count: int):
+    bot = next(get_map_specific_bots())
+    observation = sc_pb.ResponseObservation()
+    observation.CopyFrom(bot.state.response_observation)
+    # Distances between all units are cached per game loop
+    observation.observation.game_loop += 1
+    raw_units = observation.observation.raw_data.units
+    own = [unit for unit in raw_units if unit.alliance == 1]
+    area = bot.game_info.playable_area
+    rng = random.Random(count)
+    for index in range(count):
+        unit = raw_units.add()
+        unit.CopyFrom(own[index % len(own)])
+        unit.tag = 0x20000000 + index
+        unit.pos.x = rng.uniform(area.x, area.right)
+        unit.pos.y = rng.uniform(area.y, area.top)
+    bot._prepare_step(GameState(observation), SimpleNamespace(game_info=bot._game_info._proto))
+    return bot
+
+
+def run_queries(bot, count: int):
+    units = Units(bot.all_units[-count:], bot)
+    rng = random.Random(1)
+    targets = [units[rng.randrange(count)] for _ in range(QUERIES)]
+    points = [target.position.offset((3, 3)) for target in targets]
+
+    def queries():
+        for target, point in zip(targets, points):
+            units.closer_than(8, target)
+            units.closest_to(point)
+
+    return queries
+
+
+@pytest.mark.parametrize("count", [50, 200, 500])
+def test_units_queries_scan(benchmark, monkeypatch, count):
+    monkeypatch.setattr(sc2.units, "GRID_MIN_UNITS", 10 ** 9)
+    benchmark(run_queries(bot_with_units(count), count))
+
+
+@pytest.mark.parametrize("count", [50, 200, 500])
+def test_units_queries_grid(benchmark, count):
+    benchmark(run_queries(bot_with_units(count), count))
@@ -0,0 +1,31 @@
+import sys, os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from test_pickled_data import get_map_specific_bots
+from test_expansion_locations import find_expansion_locations, find_expansion_locations_reference
+
+"""
+Times expansion location calculation on all maps in "python-sc2/test/pickle_data". Run with
+pipenv run pytest test/benchmark_expansion_locations.py
+"""
+
+bots = list(get_map_specific_bots())
+
+
+def run_all_maps(function):
+    def run():
+        for bot in bots:
+            function(bot)
+
+    return run
+
+
+def test_expansion_locations_reference(benchmark):
+    benchmark.pedantic(run_all_maps(find_expansion_locations_reference), rounds=3)
+
+
+def test_expansion_locations(benchmark):
+    benchmark.pedantic(run_all_maps(find_expansion_locations), rounds=3)
@@ -0,0 +1,87 @@
+import sys, os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import itertools
+import math
+from typing import Dict, List, Tuple
+
+from sc2.bot_ai import BotAI
+from sc2.position import Point2
+from sc2.unit import Unit
+from sc2.units import Units
+
+from test_pickled_data import get_map_specific_bots
+
+"""
+Compares expansion locations to the original implementation that merges resource groups pair by pair, on all maps in
+"python-sc2/test/pickle_data". Run with
+pipenv run pytest test/test_expansion_locations.py
+"""
+
+
+def find_expansion_locations_reference(bot: BotAI) -> Tuple[List[Point2], Dict[Point2, Point2]]:
+    """ The original BotAI._find_expansion_locations, returns expansion list and resource to expansion dict. """
+    resource_spread_threshold: float = 8.5
+    geysers: Units = bot.vespene_geyser
+    resource_groups: List[List[Unit]] = [
+        [resource] for resource in bot.resources if resource.name != "MineralField450"
+    ]
+    merged_group = True
+    while merged_group:
+        merged_group = False
+        for group_a, group_b in itertools.combinations(resource_groups, 2):
+            if any(
+                resource_a.distance_to(resource_b) <= resource_spread_threshold
+                for resource_a, resource_b in itertools.product(group_a, group_b)
+            ):
+                resource_groups.remove(group_a)
+                resource_groups.remove(group_b)
+                resource_groups.append(group_a + group_b)
+                merged_group = True
+                break
+    offset_range = 7
+    offsets = [
+        (x, y)
+        for x, y in itertools.product(range(-offset_range, offset_range + 1), repeat=2)
+        if math.hypot(x, y) <= 8
+    ]
+    expansions: List[Point2] = []
+    resource_expansions: Dict[Point2, Point2] = {}
+    for resources in resource_groups:
+        amount = len(resources)
+        center_x = int(sum(resource.position.x for resource in resources) / amount) + 0.5
+        center_y = int(sum(resource.position.y for resource in resources) / amount) + 0.5
+        possible_points = (Point2((offset[0] + center_x, offset[1] + center_y)) for offset in offsets)
+        possible_points = (
+            point
+            for point in possible_points
+            if bot._game_info.placement_grid[point.rounded] == 1
+            and all(point.distance_to(resource) > (7 if resource in geysers else 6) for resource in resources)
+        )
+        result: Point2 = min(
+            possible_points, key=lambda point: sum(point.distance_to(resource) for resource in resources)
+        )
+        expansions.append(result)
+        for resource in resources:
+            resource_expansions[resource.position] = result
+    return expansions, resource_expansions
+
+
+def find_expansion_locations(bot: BotAI) -> Tuple[List[Point2], Dict[Point2, Point2]]:
+    bot._expansion_positions_list.clear()
+    bot._resource_location_to_expansion_position_dict.clear()
+    bot._find_expansion_locations()
+    return bot._expansion_positions_list, bot._resource_location_to_expansion_position_dict
+
+
+def test_expansion_locations_match_reference_on_all_maps():
+    maps = 0
+    for bot in get_map_specific_bots():
+        expected_list, expected_dict = find_expansion_locations_reference(bot)
+        expansions, resource_expansions = find_expansion_locations(bot)
+        map_name = bot.game_info.map_name
+        assert expansions == expected_list, map_name
+        assert resource_expansions == expected_dict, map_name
+        maps += 1
+    assert maps > 0
@@ -6,6 +6,7 @@ from sc2.game_data import GameData
 from sc2.game_info import GameInfo
 from sc2.game_info import Ramp
 from sc2.game_state import GameState
+from sc2.pixel_map import PixelMap
 from sc2.bot_ai import BotAI
 from sc2.units import Units
 from sc2.unit import Unit
@@ -25,6 +26,7 @@ from hypothesis import given, event, settings, strategies as st
 
 from typing import Iterable
 import time
+from types import SimpleNamespace
 
 
 """
@@ -456,6 +458,29 @@ def test_game_state():
     assert not state.effects
 
 
+def test_reused_unit_objects():
+    bot: BotAI = next(get_map_specific_bots())
+    collections = ["units", "workers", "structures", "townhalls", "mineral_field", "vespene_geyser", "destructables"]
+    expected = {name: sorted(getattr(bot, name).tags) for name in collections}
+    raw_observation = bot.state.response_observation
+    # _prepare_step only reads the pathing grid from the proto game info
+    proto_game_info = SimpleNamespace(game_info=bot._game_info._proto)
+
+    bot.reuse_unit_objects = True
+    frames = []
+    for _ in range(3):
+        bot._prepare_step(state=GameState(raw_observation), proto_game_info=proto_game_info)
+        frames.append({unit.tag: unit for unit in bot.all_units})
+        for name in collections:
+            assert sorted(getattr(bot, name).tags) == expected[name]
+
+    # Objects of the previous frame are kept intact, objects from two frames ago are reused
+    for tag, unit in frames[2].items():
+        assert unit is frames[0][tag]
+        assert unit is not frames[1][tag]
+        assert bot._units_previous_map.get(tag, frames[1][tag]) is frames[1][tag]
+
+
 def test_pixelmap():
     bot: BotAI = random_bot_object
     # TODO
@@ -980,5 +1005,30 @@ def test_position_rect(x, y, w, h):
     assert rect.offset((1, 1)) == Rect((x + 1, y + 1, w, h))
 
 
+def test_game_state_decodes_lazily_and_reuses_unchanged_maps():
+    bot: BotAI = random_bot_object
+    raw_observation = bot.state.response_observation
+    map_state = raw_observation.observation.raw_data.map_state
+
+    state = GameState(raw_observation)
+    assert "_cache_creep" not in state.__dict__
+    creep = PixelMap(map_state.creep, in_bits=True, mirrored=False)
+    visibility = PixelMap(map_state.visibility, mirrored=False)
+    assert (state.creep.data_numpy == creep.data_numpy).all()
+    assert (state.visibility.data_numpy == visibility.data_numpy).all()
+    assert state.upgrades == {UpgradeId(upgrade) for upgrade in raw_observation.observation.raw_data.player.upgrade_ids}
+
+    # Same data in the next observation reuses the decoded maps
+    next_state = GameState(raw_observation)
+    assert next_state.creep is state.creep
+    assert next_state.visibility is state.visibility
+
+    # Pathing grid is decoded again after it has been replaced
+    pathing_grid = bot.game_info.pathing_grid
+    bot.game_info._update_pathing_grid(bot.game_info._proto.start_raw.pathing_grid)
+    assert bot.game_info.pathing_grid is not pathing_grid
+    assert (bot.game_info.pathing_grid.data_numpy == pathing_grid.data_numpy).all()
+
+
 if __name__ == "__main__":
     test_unit()
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+from s2clientprotocol import sc2api_pb2 as sc_pb
+
+from sc2.protocol import Protocol, ProtocolError
+
+
+class QueueWebSocket:
+    """Answers requests in order, like SC2 does, but only after all previously sent requests have been answered."""
+
+    def __init__(self, errors=()):
+        self.requests = []
+        self.received = 0
+        self.errors = set(errors)
+
+    async def send_bytes(self, data):
+        request = sc_pb.Request()
+        request.ParseFromString(data)
+        self.requests.append(request)
+
+    async def receive_bytes(self):
+        request = self.requests[self.received]
+        self.received += 1
+        response = sc_pb.Response(status=3, id=self.received)
+        name = request.WhichOneof("request")
+        if name in self.errors:
+            response.error.append(f"{name} failed")
+        else:
+            getattr(response, name).SetInParent()
+        return response.SerializeToString()
+
+
+def run(coroutine):
+    return asyncio.get_event_loop().run_until_complete(coroutine)
+
+
+def test_pipelined_requests_are_sent_before_responses_are_read():
+    ws = QueueWebSocket()
+    protocol = Protocol(ws)
+
+    async def step():
+        await protocol._send_detached(action=sc_pb.RequestAction())
+        await protocol._send_detached(step=sc_pb.RequestStep(count=4))
+        game_info = await protocol._send(game_info=sc_pb.RequestGameInfo())
+        observation = await protocol._execute(observation=sc_pb.RequestObservation())
+        assert len(ws.requests) == 4
+        return observation, await protocol._receive(game_info)
+
+    observation, game_info = run(step())
+    assert observation.HasField("observation")
+    assert game_info.HasField("game_info")
+    assert ws.received == 4
+
+
+def test_detached_request_error_is_raised_from_next_request():
+    protocol = Protocol(QueueWebSocket(errors={"step", "action"}))
+
+    async def step():
+        await protocol._send_detached(ignore_errors=True, action=sc_pb.RequestAction())
+        await protocol._send_detached(step=sc_pb.RequestStep(count=4))
+        await protocol._execute(observation=sc_pb.RequestObservation())
+
+    with pytest.raises(ProtocolError, match="step failed"):
+        run(step())
+    assert not protocol._pending
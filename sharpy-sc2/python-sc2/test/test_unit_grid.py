@@ -0,0 +1,40 @@
+import os
+import random
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sc2.position import Point2
+from sc2.units import Units, GRID_MIN_UNITS
+
+from test_pickled_data import get_map_specific_bots
+
+
+def test_grid_queries_return_same_units_as_scanning():
+    bot = next(get_map_specific_bots())
+    units = bot.all_units
+    assert len(units) >= GRID_MIN_UNITS
+    area = bot.game_info.playable_area
+    rng = random.Random(1)
+
+    def scanned() -> Units:
+        # A new Units object scans on its first query
+        return Units(list(units), bot)
+
+    positions = [units[rng.randrange(len(units))] for _ in range(20)]
+    positions += [
+        Point2((rng.uniform(area.x, area.right), rng.uniform(area.y, area.top))) for _ in range(20)
+    ]
+    for position in positions:
+        for distance in (0.5, 5, 12, 40):
+            assert units.closer_than(distance, position) == scanned().closer_than(distance, position)
+            assert units.further_than(distance, position) == scanned().further_than(distance, position)
+        assert units.closest_to(position) is scanned().closest_to(position)
+        assert units.closest_distance_to(position) == scanned().closest_distance_to(position)
+
+    group = bot.workers
+    for distance in (1, 8):
+        assert group.in_distance_of_group(units, distance) == group.in_distance_of_group(scanned(), distance)
+    for unit in bot.workers:
+        assert units.in_attack_range_of(unit, 3) == scanned().in_attack_range_of(unit, 3)
+    assert units._grid is not None
@@ -37,6 +37,13 @@ class Sc2Map:
         self._overlord_spots = self._map.overlord_spots
         return self._overlord_spots
 
+    @overlord_spots.setter
+    def overlord_spots(self, spots: List[Tuple[float, float]]):
+        """
+        Sets overlord spots that have been calculated earlier for the same map, so they are not calculated again.
+        """
+        self._overlord_spots = spots
+
     @property
     def chokes(self) -> List[Choke]:
         if self._chokes is not None:
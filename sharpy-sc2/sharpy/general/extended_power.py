@@ -1,10 +1,18 @@
-from typing import Union, List, Set
+from typing import Union, List, Set, Tuple, Optional, TYPE_CHECKING
+
+import numpy as np
 
 from sc2 import UnitTypeId
 from sc2.unit import Unit
 
 from sharpy.general.unit_feature import UnitFeature
 
+if TYPE_CHECKING:
+    from sharpy.managers.unit_value import UnitValue, UnitData
+
+# Unit count from which add_units sums power vectors with numpy instead of adding units one by one
+VECTORIZE_THRESHOLD = 12
+
 # This is more of a power to surround our units, less of an melee
 # It requires units to be fast enough to actually surround a army
 # grouping up vs ultralisk isn't a very good idea with their splash damage.
@@ -45,6 +53,39 @@ siege = {
 }
 
 
+def power_vector(unit_type: UnitTypeId, unit_data: "Optional[UnitData]") -> Tuple[float, ...]:
+    """
+    Creates the power vector of the unit type that ExtendedPower sums.
+
+    Columns are combat value, multipliers of unit power for air presence, ground presence, ground power,
+    melee power, surround power, siege power, air power and stealth power, then flat air power and detector count
+    that are added once per added unit type regardless of power.
+    """
+    if unit_data is None:
+        return 1.0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0
+
+    features = unit_data.features
+    flying = UnitFeature.Flying in features
+    hits_ground = UnitFeature.HitsGround in features
+    shoots_air = UnitFeature.ShootsAir in features
+    # Exception to the rule due to weak attack
+    sentry = unit_type == UnitTypeId.SENTRY
+
+    return (
+        unit_data.combat_value,
+        float(flying),
+        float(not flying),
+        float(hits_ground),
+        float(hits_ground and unit_type in melee),
+        float(hits_ground and unit_type in surround),
+        float(unit_type in siege),
+        float(shoots_air and not sentry),
+        float(UnitFeature.Cloak in features),
+        0.5 if shoots_air and sentry else 0,
+        float(UnitFeature.Detector in features),
+    )
+
+
 class ExtendedPower:
     def is_enough_for(self, enemies: "ExtendedPower", our_percentage: float = 1.1) -> bool:
         # reduce some variable from air / ground power so that we don't fight against 100 roach with
@@ -93,102 +134,73 @@ class ExtendedPower:
         return 0
 
     def add_units(self, units: Union[List[Unit], Set[Unit]]):
+        if len(units) < VECTORIZE_THRESHOLD:
+            for unit in units:
+                self.add_unit(unit)
+            return
+
+        rows = self.values.power_rows
+        health_percentage = self.values.health_percentage
+        indices = []
+        health = []
         for unit in units:
-            self.add_unit(unit)
+            indices.append(rows.get(unit.type_id, 0))
+            health.append(health_percentage(unit))
+
+        vectors = self.values.power_table[indices]
+        powers = vectors[:, 0] * health
+        sums = powers @ vectors[:, 1:9]
+        flat = vectors[:, 9:].sum(axis=0)
+
+        self.power += float(powers.sum())
+        self.air_presence += float(sums[0])
+        self.ground_presence += float(sums[1])
+        self.ground_power += float(sums[2])
+        self.melee_power += float(sums[3])
+        self.surround_power += float(sums[4])
+        self.air_power += float(sums[6] + flat[0])
+        self.stealth_power += float(sums[7])
+        self.detectors += int(flat[1])
+
+        # Siege power is the power of the last siege unit, same as when adding units one by one
+        siege_indices = np.flatnonzero(vectors[:, 6])
+        if len(siege_indices) > 0:
+            self.siege_power = float(powers[siege_indices[-1]])
 
     def add_unit(self, unit: Union[Unit, UnitTypeId], count=1):
-        unit_type: UnitTypeId
-
         if type(unit) is Unit:
-            pwr = self.values.power(unit)
-            unit_type = unit.type_id
+            self._add_vector(self.values.power_vector(unit.type_id), self.values.health_percentage(unit) * count, 1)
         else:
             assert isinstance(unit, UnitTypeId)
-            pwr = self.values.power_by_type(unit, 1)
-            unit_type = unit
-
-        pwr *= count
-        self.power += pwr
-
-        unit_data = self.values.unit_data.get(unit_type, None)
-        if unit_data is None:
-            self.ground_presence += pwr
-        else:
-            features = unit_data.features
-
-            if UnitFeature.Flying in features:
-                self.air_presence += pwr
-            else:
-                self.ground_presence += pwr
-
-            if UnitFeature.HitsGround in features:
-                self.ground_power += pwr
-                if unit_type in melee:
-                    self.melee_power += pwr
-                if unit_type in surround:
-                    self.surround_power += pwr
-            if UnitFeature.ShootsAir in features:
-                if unit_type == UnitTypeId.SENTRY:
-                    # Exception to the rule due to weak attack
-                    self.air_power += 0.5
-                else:
-                    self.air_power += pwr
-
-            if unit_type in siege:
-                self.siege_power = pwr
-
-            if UnitFeature.Cloak in features:
-                self.stealth_power += pwr
-
-            if UnitFeature.Detector in features:
-                self.detectors += 1
+            self._add_vector(self.values.power_vector(unit), count, 1)
 
     def subtract_unit(self, unit: Union[Unit, UnitTypeId], count=1):
-        unit_type: UnitTypeId
-
         if type(unit) is Unit:
-            pwr = self.values.power(unit)
-            unit_type = unit.type_id
+            self._add_vector(self.values.power_vector(unit.type_id), -self.values.health_percentage(unit) * count, -1)
         else:
             assert isinstance(unit, UnitTypeId)
-            pwr = self.values.power_by_type(unit, 1)
-            unit_type = unit
+            self._add_vector(self.values.power_vector(unit), -count, -1)
 
-        pwr *= count
-        self.power -= pwr
-
-        unit_data = self.values.unit_data.get(unit_type, None)
-        if unit_data is None:
-            self.ground_presence -= pwr
-        else:
-            features = unit_data.features
-
-            if UnitFeature.Flying in features:
-                self.air_presence -= pwr
+    def _add_vector(self, vector: Tuple[float, ...], health: float, sign: int):
+        """
+        Adds power of the unit type multiplied by health, flat values are added once with the sign.
+        """
+        pwr = vector[0] * health
+        self.power += pwr
+        self.air_presence += pwr * vector[1]
+        self.ground_presence += pwr * vector[2]
+        self.ground_power += pwr * vector[3]
+        self.melee_power += pwr * vector[4]
+        self.surround_power += pwr * vector[5]
+        if vector[6]:
+            if sign > 0:
+                # Siege power is the power of the latest siege unit added
+                self.siege_power = pwr
             else:
-                self.ground_presence -= pwr
-
-            if UnitFeature.HitsGround in features:
-                self.ground_power -= pwr
-                if unit_type in melee:
-                    self.melee_power -= pwr
-                if unit_type in surround:
-                    self.surround_power -= pwr
-            if UnitFeature.ShootsAir in features:
-                if unit_type == UnitTypeId.SENTRY:
-                    # Exception to the rule due to weak attack
-                    self.air_power -= 0.5
-                else:
-                    self.air_power -= pwr
-
-            if unit_type in siege:
-                self.siege_power -= pwr
-
-            if UnitFeature.Cloak in features:
-                self.stealth_power -= pwr
-
-            if UnitFeature.Detector in features:
-                self.detectors -= 1
+                self.siege_power += pwr
+        self.air_power += pwr * vector[7] + sign * vector[9]
+        self.stealth_power += pwr * vector[8]
+        self.detectors += sign * int(vector[10])
 
     def add_power(self, extended_power: "ExtendedPower"):
         self.power += extended_power.power
@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+
+import pytest
+from sc2 import UnitTypeId
+
+from sharpy.managers.unit_value import UnitValue
+from .extended_power import ExtendedPower, VECTORIZE_THRESHOLD
+
+unit_values = UnitValue()
+
+TYPES = [
+    UnitTypeId.ZEALOT,
+    UnitTypeId.SENTRY,
+    UnitTypeId.STALKER,
+    UnitTypeId.OBSERVER,
+    UnitTypeId.COLOSSUS,
+    UnitTypeId.BANSHEE,
+    UnitTypeId.MUTALISK,
+    UnitTypeId.SIEGETANKSIEGED,
+    UnitTypeId.LARVA,
+]
+
+
+def create_unit(type_id: UnitTypeId, health: float, health_max: float) -> SimpleNamespace:
+    return SimpleNamespace(type_id=type_id, health=health, health_max=health_max, shield=0, shield_max=0)
+
+
+def fields(power: ExtendedPower) -> list:
+    return [
+        power.power,
+        power.air_presence,
+        power.ground_presence,
+        power.air_power,
+        power.ground_power,
+        power.melee_power,
+        power.surround_power,
+        power.siege_power,
+        power.detectors,
+        power.stealth_power,
+    ]
+
+
+class TestExtendedPower:
+    def test_add_unit_returns_power_by_unit_features(self):
+        power = ExtendedPower(unit_values)
+        power.add_unit(UnitTypeId.ZEALOT, 2)
+        power.add_unit(UnitTypeId.SENTRY)
+        power.add_unit(UnitTypeId.OBSERVER)
+
+        zealots = unit_values.power_by_type(UnitTypeId.ZEALOT) * 2
+        assert power.surround_power == pytest.approx(zealots)
+        assert power.melee_power == pytest.approx(zealots)
+        assert power.air_power == pytest.approx(0.5)
+        assert power.detectors == 1
+
+        power.subtract_unit(UnitTypeId.ZEALOT, 2)
+        assert power.surround_power == pytest.approx(0)
+
+    def test_add_unit_replaces_siege_power_and_adds_flat_values_once(self):
+        power = ExtendedPower(unit_values)
+        power.add_unit(UnitTypeId.SIEGETANKSIEGED, 3)
+        power.add_unit(UnitTypeId.SIEGETANKSIEGED)
+        power.add_unit(UnitTypeId.SENTRY, 2)
+        power.add_unit(UnitTypeId.OBSERVER, 2)
+
+        assert power.siege_power == pytest.approx(unit_values.power_by_type(UnitTypeId.SIEGETANKSIEGED))
+        assert power.air_power == pytest.approx(0.5)
+        assert power.detectors == 1
+
+        power.subtract_unit(UnitTypeId.SIEGETANKSIEGED)
+        assert power.siege_power == pytest.approx(0)
+
+    def test_add_units_returns_same_power_as_adding_units_one_by_one(self):
+        units = [create_unit(TYPES[i % len(TYPES)], 100, 100) for i in range(VECTORIZE_THRESHOLD * 3)]
+        expected = ExtendedPower(unit_values)
+        for unit in units:
+            expected.add_unit(unit.type_id)
+
+        power = ExtendedPower(unit_values)
+        power.add_units(units)
+        assert fields(power) == pytest.approx(fields(expected))
+
+    def test_add_units_returns_power_reduced_by_health(self):
+        units = [create_unit(UnitTypeId.STALKER, 0, 80)] * VECTORIZE_THRESHOLD
+        power = ExtendedPower(unit_values)
+        power.add_units(units)
+        assert power.power == pytest.approx(unit_values.power_by_type(UnitTypeId.STALKER, 0.5) * VECTORIZE_THRESHOLD)
@@ -0,0 +1,99 @@
+from typing import Dict, List, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from sc2.position import Point2
+from sc2.unit import Unit
+from sharpy import sc2math
+
+if TYPE_CHECKING:
+    from sharpy.managers import UnitValue
+
+
+class GroupStats:
+    """Statistics of a single unit group, calculated by GroupStatistics."""
+
+    def __init__(self, center: Point2, median: Point2, average_speed: float, total_distance: float, area: float):
+        self.center = center
+        self.median = median
+        self.average_speed = average_speed
+        # Sum of unit distances to center, distance of units with energy counts double
+        self.total_distance = total_distance
+        # Sum of unit radius squared plus 5
+        self.area_by_circles = area
+
+
+class GroupStatistics:
+    """
+    Calculates centers, medians, spread and average speed of all unit groups at once.
+
+    Center of a group is the ground unit closest to the geometric median of the group, or the median itself when
+    the group has no ground units, same as CombatUnits calculates it for a single group.
+    Median calculation starts from last call's median of the group that had the same lowest unit tag,
+    which usually converges in a couple of iterations.
+    """
+
+    def __init__(self, accuracy: float = 0.5):
+        self.accuracy = accuracy
+        self._medians: Dict[int, np.ndarray] = {}
+
+    def calculate(self, units: Sequence[Unit], groups: np.ndarray, unit_values: "UnitValue") -> List[GroupStats]:
+        """
+        @param units: units of all groups
+        @param groups: group index of each unit, numbered from 0 without gaps
+        @param unit_values: used for unit speeds
+        """
+        if len(units) == 0:
+            self._medians.clear()
+            return []
+
+        positions = np.array([unit.position for unit in units], dtype=np.float64)
+        tags = np.array([unit.tag for unit in units], dtype=np.int64)
+        ground = np.array([not unit.is_flying for unit in units], dtype=bool)
+        speeds = np.array([unit_values.real_speed(unit) for unit in units], dtype=np.float64)
+        weights = np.array([2 if unit.energy_percentage >= 0.4 else 1 for unit in units], dtype=np.float64)
+        radii = np.array([unit.radius for unit in units], dtype=np.float64)
+
+        groups = np.asarray(groups, dtype=np.intp)
+        count = int(groups.max()) + 1
+        sizes = np.bincount(groups, minlength=count)
+
+        keys = np.full(count, np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(keys, groups, tags)
+        keys = keys.tolist()
+
+        start = np.stack((np.bincount(groups, positions[:, 0], count), np.bincount(groups, positions[:, 1], count)), -1)
+        start /= sizes[:, np.newaxis]
+        for index, key in enumerate(keys):
+            previous = self._medians.get(key)
+            if previous is not None:
+                start[index] = previous
+
+        medians = sc2math.geometric_medians(positions, groups, count, start, self.accuracy)
+        self._medians = {key: median for key, median in zip(keys, medians)}
+
+        # Closest ground unit to the median, first unit wins ties like Units.closest_to
+        centers: List[Point2] = [Point2(median) for median in medians.tolist()]
+        ground_indices = np.flatnonzero(ground)
+        if len(ground_indices) > 0:
+            deltas = positions[ground_indices] - medians[groups[ground_indices]]
+            distances = np.einsum("ij,ij->i", deltas, deltas)
+            order = ground_indices[np.lexsort((distances, groups[ground_indices]))]
+            ordered_groups = groups[order]
+            first = np.ones(len(order), dtype=bool)
+            first[1:] = ordered_groups[1:] != ordered_groups[:-1]
+            for group, index in zip(ordered_groups[first].tolist(), order[first].tolist()):
+                centers[group] = units[index].position
+
+        center_array = np.array(centers, dtype=np.float64)
+        deltas = positions - center_array[groups]
+        total_distances = np.bincount(groups, np.hypot(deltas[:, 0], deltas[:, 1]) * weights, count)
+        areas = np.bincount(groups, radii ** 2, count) + 5
+        average_speeds = np.bincount(groups, speeds, count) / sizes
+
+        return [
+            GroupStats(centers[index], Point2(medians[index].tolist()), speed, distance, area)
+            for index, (speed, distance, area) in enumerate(
+                zip(average_speeds.tolist(), total_distances.tolist(), areas.tolist())
+            )
+        ]
@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from sc2.position import Point2
+from sharpy import sc2math
+from .group_statistics import GroupStatistics
+
+
+def mock_units(count: int, groups: int, seed: int):
+    random = np.random.RandomState(seed)
+    centers = random.uniform(0, 150, (groups, 2))
+    labels = np.arange(count) % groups
+    positions = centers[labels] + random.normal(0, 3, (count, 2))
+    units = [
+        SimpleNamespace(
+            position=Point2(position),
+            tag=1000 + index,
+            is_flying=random.rand() < 0.3,
+            energy_percentage=random.rand(),
+            radius=random.uniform(0.3, 1),
+            speed=random.uniform(2, 5),
+        )
+        for index, position in enumerate(positions.tolist())
+    ]
+    return units, labels
+
+
+unit_values = SimpleNamespace(real_speed=lambda unit: unit.speed)
+
+
+class TestGroupStatistics:
+    def test_geometric_medians_returns_same_medians_as_geometric_median(self):
+        units, labels = mock_units(200, 12, seed=1)
+        positions = np.array([unit.position for unit in units])
+        # Group where all points are the same
+        positions[labels == 3] = (20, 30)
+
+        medians = sc2math.geometric_medians(positions, labels, 12, eps=1e-5)
+
+        for group in range(12):
+            expected = sc2math.geometric_median(positions[labels == group], 1e-5)
+            assert np.allclose(medians[group], expected, atol=1e-9)
+
+    def test_calculate_returns_same_stats_as_single_group(self):
+        units, labels = mock_units(150, 10, seed=2)
+        statistics = GroupStatistics()
+
+        stats = statistics.calculate(units, labels, unit_values)
+
+        assert len(stats) == 10
+        for group, group_stats in enumerate(stats):
+            group_units = [unit for unit, label in zip(units, labels) if label == group]
+            positions = np.array([unit.position for unit in group_units])
+            median = Point2(sc2math.geometric_median(positions, 0.5))
+            center = median
+            ground_units = [unit for unit in group_units if not unit.is_flying]
+            if ground_units:
+                center = min(ground_units, key=lambda unit: unit.position.distance_to(median)).position
+
+            total_distance = sum(
+                unit.position.distance_to(center) * (2 if unit.energy_percentage >= 0.4 else 1) for unit in group_units
+            )
+            assert group_stats.center == center
+            assert group_stats.median == median
+            assert abs(group_stats.total_distance - total_distance) < 1e-9
+            assert abs(group_stats.area_by_circles - 5 - sum(unit.radius ** 2 for unit in group_units)) < 1e-9
+            assert abs(group_stats.average_speed - sum(unit.speed for unit in group_units) / len(group_units)) < 1e-9
+
+    def test_calculate_starts_from_previous_median(self):
+        units, labels = mock_units(60, 3, seed=3)
+        statistics = GroupStatistics(accuracy=1e-5)
+        first = statistics.calculate(units, labels, unit_values)
+
+        for unit in units:
+            unit.position = unit.position.offset((0.1, 0))
+        second = statistics.calculate(units, labels, unit_values)
+
+        for before, after in zip(first, second):
+            assert after.median.distance_to(before.median.offset((0.1, 0))) < 1e-3
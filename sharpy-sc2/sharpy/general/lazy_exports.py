@@ -0,0 +1,27 @@
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Creates module level __getattr__ and __dir__ functions for a package, that import the exported names
+    from their modules on first use instead of when the package is imported.
+
+    @param package: name of the package, __name__ in the package __init__
+    @param exports: exported names and the modules they are defined in, relative to the package
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Store the value in the package, so that it is found without calling __getattr__ again
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
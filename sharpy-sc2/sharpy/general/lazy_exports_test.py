@@ -0,0 +1,48 @@
+import sys
+
+import pytest
+
+PACKAGE_INIT = """from sharpy.general.lazy_exports import lazy_exports
+
+_exports = {"Value": ".values"}
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
+"""
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    folder = tmp_path / "lazy_package"
+    folder.mkdir()
+    (folder / "__init__.py").write_text(PACKAGE_INIT)
+    (folder / "values.py").write_text("Value = 5\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "lazy_package"
+    for name in ["lazy_package", "lazy_package.values"]:
+        sys.modules.pop(name, None)
+
+
+class TestLazyExports:
+    def test_module_is_imported_on_first_use(self, package):
+        module = __import__(package)
+        assert "lazy_package.values" not in sys.modules
+
+        assert module.Value == 5
+        assert "lazy_package.values" in sys.modules
+
+    def test_star_import_imports_exports(self, package):
+        names = {}
+        exec(f"from {package} import *", names)
+
+        assert names["Value"] == 5
+
+    def test_unknown_name_raises_attribute_error(self, package):
+        module = __import__(package)
+
+        with pytest.raises(AttributeError):
+            module.Missing
+
+    def test_dir_lists_exports(self, package):
+        module = __import__(package)
+
+        assert "Value" in dir(module)
@@ -0,0 +1,62 @@
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Tuple
+
+from sc2.position import Point2
+
+
+class PathCache:
+    """
+    Least recently used cache for path finding results.
+
+    Start and end positions are quantized to cells of size quantization, so that queries between nearly
+    identical points share the same result. The cache is cleared whenever the version given to it changes.
+    """
+
+    def __init__(self, max_size: int = 512, quantization: float = 1):
+        self.max_size = max_size
+        self.quantization = quantization
+        self.version: Hashable = None
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[Tuple, Any]" = OrderedDict()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if total == 0:
+            return 0
+        return self.hits / total
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self):
+        self._cache.clear()
+
+    def get(self, version: Hashable, kind: Hashable, start: Point2, end: Point2, func: Callable[[], Any]) -> Any:
+        """
+        Returns cached result for the path query or calculates it with func.
+
+        @param version: version of the grid that the path is searched from, cache is cleared when it changes
+        @param kind: type of the query, e.g. map type
+        @param func: function that calculates the result when it is not cached
+        """
+        if version != self.version:
+            self._cache.clear()
+            self.version = version
+
+        q = self.quantization
+        key = (kind, int(start[0] // q), int(start[1] // q), int(end[0] // q), int(end[1] // q))
+
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = func()
+        self._cache[key] = result
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return result
@@ -0,0 +1,48 @@
+from sc2.position import Point2
+from .path_cache import PathCache
+
+
+class TestPathCache:
+    def test_nearby_queries_share_result(self):
+        cache = PathCache()
+        calls = []
+
+        def find():
+            calls.append(1)
+            return [(1, 1), (2, 2)], 1.41
+
+        first = cache.get(0, None, Point2((10.1, 10.2)), Point2((30.5, 30.5)), find)
+        second = cache.get(0, None, Point2((10.9, 10.7)), Point2((30.1, 30.9)), find)
+
+        assert first is second
+        assert len(calls) == 1
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.hit_rate == 0.5
+
+    def test_version_change_clears_cache(self):
+        cache = PathCache()
+        cache.get(0, None, Point2((1, 1)), Point2((5, 5)), lambda: ([], 0))
+        cache.get(1, None, Point2((1, 1)), Point2((5, 5)), lambda: ([], 0))
+
+        assert cache.misses == 2
+        assert len(cache) == 1
+
+    def test_kinds_are_cached_separately(self):
+        cache = PathCache()
+        ground = cache.get(0, "ground", Point2((1, 1)), Point2((5, 5)), lambda: ([(0, 0)], 1))
+        air = cache.get(0, "air", Point2((1, 1)), Point2((5, 5)), lambda: ([(1, 1)], 2))
+
+        assert ground != air
+
+    def test_least_recently_used_is_evicted(self):
+        cache = PathCache(max_size=2)
+        cache.get(0, None, Point2((1, 1)), Point2((5, 5)), lambda: ([], 1))
+        cache.get(0, None, Point2((2, 2)), Point2((5, 5)), lambda: ([], 2))
+        # Touch the first one so that the second one is evicted
+        cache.get(0, None, Point2((1, 1)), Point2((5, 5)), lambda: ([], 1))
+        cache.get(0, None, Point2((3, 3)), Point2((5, 5)), lambda: ([], 3))
+
+        assert len(cache) == 2
+        assert cache.get(0, None, Point2((1, 1)), Point2((5, 5)), lambda: ([], -1)) == ([], 1)
+        assert cache.get(0, None, Point2((2, 2)), Point2((5, 5)), lambda: ([], -1)) == ([], -1)
@@ -0,0 +1,119 @@
+from typing import Optional, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from scipy.spatial import cKDTree
+
+
+def connected_labels(count: int, pairs: np.ndarray) -> np.ndarray:
+    """
+    Labels connected components of the graph defined by pairs with union-find.
+    Labels are numbered in the order of first appearance, so the unit at index 0 is always in group 0.
+
+    @param count: number of nodes
+    @param pairs: (n, 2) array of node index pairs that are connected
+    """
+    parents = np.arange(count)
+
+    if len(pairs) > 0:
+        a = pairs[:, 0]
+        b = pairs[:, 1]
+        while True:
+            # Union: hook the larger root under the smaller root
+            root_a = parents[a]
+            root_b = parents[b]
+            differ = root_a != root_b
+            if not differ.any():
+                break
+            root_a = root_a[differ]
+            root_b = root_b[differ]
+            parents[np.maximum(root_a, root_b)] = np.minimum(root_a, root_b)
+            # Find: compress the paths so that every node points directly to its root
+            while True:
+                grand_parents = parents[parents]
+                if np.array_equal(grand_parents, parents):
+                    break
+                parents = grand_parents
+
+    # Roots are the smallest index of each component, renumber them in the order of appearance
+    _, inverse = np.unique(parents, return_inverse=True)
+    return inverse.astype(np.intp)
+
+
+class UnitClustering:
+    """
+    Single-linkage clustering of unit positions, equal to DBSCAN with min_samples=1.
+
+    Units closer than or equal to distance are in the same group, as are units linked with a chain of such units.
+    Pairs are found with KD-tree radius queries and joined with union-find.
+    When the same units have moved less than move_threshold since the last full clustering, the groups formed by
+    pairs that are certainly still linked are reused and only the pairs whose distance was close to
+    the group distance are checked again.
+    """
+
+    def __init__(self, distance: float, move_threshold: float = 1):
+        self.distance = distance
+        self.move_threshold = move_threshold
+        self.full_updates = 0
+        self.incremental_updates = 0
+        self._tags: Optional[np.ndarray] = None
+        self._anchor: Optional[np.ndarray] = None
+        # Groups formed by the pairs that stay linked as long as units move less than move_threshold
+        self._certain_labels: np.ndarray = np.empty(0, dtype=np.intp)
+        self._certain_count = 0
+        # Pairs that may become linked or unlinked
+        self._uncertain_pairs: np.ndarray = np.empty((0, 2), dtype=np.intp)
+
+    def labels(
+        self, positions: np.ndarray, tags: Optional[np.ndarray] = None, tree: Optional["cKDTree"] = None
+    ) -> np.ndarray:
+        """
+        Returns group label for each position, labels are numbered in the order of first appearance.
+
+        @param positions: (n, 2) array of unit positions
+        @param tags: unit tags in the same order, required for incremental updates
+        @param tree: KD-tree that has been built from positions, e.g. UnitCacheManager.enemy_tree
+        """
+        count = len(positions)
+        if count == 0:
+            self._tags = None
+            return np.empty(0, dtype=np.intp)
+
+        if tags is not None and self._can_update(positions, tags):
+            self.incremental_updates += 1
+            pairs = self._uncertain_pairs
+            deltas = positions[pairs[:, 0]] - positions[pairs[:, 1]]
+            linked = np.einsum("ij,ij->i", deltas, deltas) <= self.distance * self.distance
+            # Join the groups formed by certain pairs with the uncertain pairs that are currently linked
+            merged = connected_labels(self._certain_count, self._certain_labels[pairs[linked]])
+            return merged[self._certain_labels]
+
+        self.full_updates += 1
+        if tree is None:
+            from scipy import spatial
+
+            tree = spatial.cKDTree(positions)
+
+        margin = 2 * self.move_threshold if tags is not None else 0
+        pairs = tree.query_pairs(self.distance + margin, output_type="ndarray")
+
+        if tags is None:
+            self._tags = None
+            return connected_labels(count, pairs)
+
+        deltas = positions[pairs[:, 0]] - positions[pairs[:, 1]]
+        distances = np.sqrt(np.einsum("ij,ij->i", deltas, deltas))
+        self._tags = np.array(tags, copy=True)
+        self._anchor = np.array(positions, copy=True)
+        self._certain_labels = connected_labels(count, pairs[distances <= self.distance - margin])
+        self._certain_count = int(self._certain_labels.max()) + 1
+        self._uncertain_pairs = pairs[distances > self.distance - margin]
+        return connected_labels(count, pairs[distances <= self.distance])
+
+    def _can_update(self, positions: np.ndarray, tags: np.ndarray) -> bool:
+        if self._tags is None or len(self._tags) != len(tags) or not np.array_equal(self._tags, tags):
+            return False
+
+        moved = positions - self._anchor
+        return np.einsum("ij,ij->i", moved, moved).max() < self.move_threshold * self.move_threshold
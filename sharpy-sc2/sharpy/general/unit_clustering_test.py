@@ -0,0 +1,56 @@
+import numpy as np
+
+from .unit_clustering import UnitClustering, connected_labels
+
+
+def reference_labels(positions: np.ndarray, distance: float) -> np.ndarray:
+    """Flood fill single-linkage clustering, labels in order of first appearance."""
+    count = len(positions)
+    labels = np.full(count, -1)
+    label = 0
+    for i in range(count):
+        if labels[i] >= 0:
+            continue
+        labels[i] = label
+        stack = [i]
+        while stack:
+            j = stack.pop()
+            near = np.where(np.hypot(*(positions - positions[j]).T) <= distance)[0]
+            for k in near:
+                if labels[k] < 0:
+                    labels[k] = label
+                    stack.append(k)
+        label += 1
+    return labels
+
+
+def random_positions(count: int, seed: int) -> np.ndarray:
+    random = np.random.RandomState(seed)
+    centers = random.uniform(0, 150, (max(1, count // 10), 2))
+    return (centers[random.randint(0, len(centers), count)] + random.normal(0, 4, (count, 2))).astype(np.float32)
+
+
+class TestUnitClustering:
+    def test_connected_labels_returns_labels_in_order_of_appearance(self):
+        pairs = np.array([[3, 4], [1, 4], [2, 5]])
+        assert connected_labels(6, pairs).tolist() == [0, 1, 2, 1, 1, 2]
+
+    def test_labels_returns_same_groups_as_reference(self):
+        for seed in range(5):
+            positions = random_positions(100, seed)
+            labels = UnitClustering(7).labels(positions)
+            assert labels.tolist() == reference_labels(positions, 7).tolist()
+
+    def test_incremental_labels_follow_moving_units(self):
+        random = np.random.RandomState(1)
+        positions = random_positions(60, 1)
+        tags = np.arange(60, dtype=np.int64)
+        clustering = UnitClustering(7, move_threshold=1)
+
+        for frame in range(20):
+            positions = positions + random.uniform(-0.2, 0.2, positions.shape).astype(np.float32)
+            labels = clustering.labels(positions, tags)
+            assert labels.tolist() == reference_labels(positions, 7).tolist()
+
+        assert clustering.incremental_updates > 0
+        assert clustering.full_updates > 1
@@ -1,4 +1,5 @@
 import logging
+import os
 import string
 import sys
 from configparser import ConfigParser
@@ -11,7 +12,10 @@ from sharpy.managers import *
 from sharpy.managers.enemy_units_manager import EnemyUnitsManager
 from sharpy.mapping.heat_map import HeatMap
 from sharpy.mapping.map import MapInfo
+from sharpy.mapping.map_analysis import MapAnalysis
 from sharpy.general.extended_ramp import ExtendedRamp
+from sharpy.managers.data_manager import DATA_FOLDER
+from sharpy.tools import StepProfiler
 from sc2 import Race
 from sc2.constants import *
 from sc2.data import Result
@@ -44,6 +48,8 @@ class Knowledge:
         self.unit_values: UnitValue = UnitValue()
 
         self.rush_distance = 0
+        # Map analysis that is stored on disk when map cache is enabled
+        self.map_analysis: Optional[MapAnalysis] = None
 
         self._all_own: Units = None
 
@@ -55,6 +61,9 @@ class Knowledge:
         # Event listeners
         self._on_unit_destroyed_listeners: List[Callable] = list()
 
+        # Opt-in per frame timing of managers and acts
+        self.profiler: StepProfiler = StepProfiler()
+
         # Managers
         self.unit_cache: UnitCacheManager = UnitCacheManager()
         self.zone_manager: ZoneManager = ZoneManager()
@@ -65,6 +74,7 @@ class Knowledge:
         self.roles: UnitRoleManager = UnitRoleManager()
         self.build_detector: BuildDetector = BuildDetector()
         self.pathing_manager: PathingManager = PathingManager()
+        self.pathing_query_manager: PathingQueryManager = PathingQueryManager()
         self.enemy_army_predicter = EnemyArmyPredicter()
         self.lost_units_manager: LostUnitsManager = LostUnitsManager()
         self.game_analyzer: GameAnalyzer = GameAnalyzer()
@@ -91,6 +101,7 @@ class Knowledge:
             self.unit_cache,
             self.action_handler,
             self.pathing_manager,
+            self.pathing_query_manager,
             self.zone_manager,
             self.enemy_units_manager,
             self.cooldown_manager,
@@ -135,6 +146,10 @@ class Knowledge:
         self.is_chat_allowed = self.config["general"].getboolean("chat")
         self._debug = self.config["general"].getboolean("debug")
 
+        if self.config["general"].getboolean("profile"):
+            self.profiler.enabled = True
+            self.profiler.max_frames = self.config["general"].getint("profile_frames", fallback=2000)
+
         self.my_race: Race = self.ai.race
         self.enemy_race: Race = self.ai.enemy_race
         self.enemy_worker_type = self.unit_values.get_worker_type(self.enemy_race)
@@ -243,7 +258,7 @@ class Knowledge:
         self.gather_point = self.base_ramp.top_center.towards(self.base_ramp.bottom_center, -4)
         start = self.base_ramp.top_center
         end = self.enemy_base_ramp.top_center
-        self.rush_distance = await self.ai._client.query_pathing(start, end)
+        self.rush_distance = await self.pathing_query_manager.query(start, end, static=True)
         self._print(f"rush distance: {self.rush_distance}", stats=False)
 
     async def update(self, iteration: int):
@@ -287,8 +302,13 @@ class Knowledge:
 
         self.iteration = iteration
 
-        for manager in self.managers:
-            await manager.update()
+        if self.profiler.enabled:
+            for manager in self.managers:
+                with self.profiler.measure("update/" + type(manager).__name__):
+                    await manager.update()
+        else:
+            for manager in self.managers:
+                await manager.update()
 
         if not self.supply_blocked and self.ai.supply_left == 0:
             self.supply_blocked = True
@@ -498,6 +518,13 @@ class Knowledge:
         for manager in self.managers:
             await manager.on_end(game_result)
 
+        if self.profiler.enabled:
+            self.profiler.report(lambda msg: self.print(msg, "Profiler", stats=False))
+            if self.config["general"].getboolean("profile_dump"):
+                file_name = DATA_FOLDER + os.sep + f"profile-{self.ai.opponent_id}-{self.ai.player_id}.txt"
+                self.profiler.dump(file_name)
+                self._print(f"Profile written to {file_name}", stats=False)
+
     # region Knowledge event handlers
 
     # todo: if this is useful, it should be refactored as a more general solution
@@ -588,8 +615,13 @@ class Knowledge:
         return h
 
     async def post_update(self):
-        for manager in self.managers:
-            await manager.post_update()
+        if self.profiler.enabled:
+            for manager in self.managers:
+                with self.profiler.measure("post_update/" + type(manager).__name__):
+                    await manager.post_update()
+        else:
+            for manager in self.managers:
+                await manager.post_update()
 
         # if self.debug:
         #     await self.ai._client.send_debug()
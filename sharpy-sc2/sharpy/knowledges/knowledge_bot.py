@@ -1,4 +1,5 @@
 import logging
+import os
 import sys
 import threading
 from abc import abstractmethod
@@ -6,6 +7,8 @@ from abc import abstractmethod
 from sc2.units import Units
 from sharpy.knowledges import Knowledge
 from sharpy.managers import ManagerBase
+from sharpy.mapping.map_analysis import MapAnalysis
+from sharpy.mapping.map_cache import MAP_DATA_FOLDER, map_key
 from config import get_config, get_version
 from sc2 import BotAI, Result, Optional, UnitTypeId, List
 from sc2.unit import Unit
@@ -34,16 +37,40 @@ class KnowledgeBot(BotAI):
         self.last_game_loop = -1
         self.distance_calculation_method = 0
         self.unit_command_uses_self_do = True
+        self.map_analysis_file: Optional[str] = None
 
     async def real_init(self):
         self.knowledge.pre_start(self, self.configure_managers())
         await self.knowledge.start()
+        self._save_map_analysis()
         self.plan = await self.create_plan()
         if self.start_plan:
             await self.plan.start(self.knowledge)
 
         self._log_start()
 
+    def _prepare_first_step(self):
+        if not self.config["general"].getboolean("map_cache"):
+            super()._prepare_first_step()
+            return
+
+        self.map_analysis_file = os.path.join(MAP_DATA_FOLDER, map_key(self.game_info) + "-analysis.npz")
+        analysis = MapAnalysis()
+        if analysis.load(self.map_analysis_file) and analysis.apply(self):
+            self._time_before_step: float = time.perf_counter()
+        else:
+            super()._prepare_first_step()
+            analysis = MapAnalysis.from_bot(self)
+        self.knowledge.map_analysis = analysis
+
+    def _save_map_analysis(self):
+        analysis = self.knowledge.map_analysis
+        if analysis is not None and self.map_analysis_file is not None:
+            try:
+                analysis.save(self.map_analysis_file)
+            except OSError:
+                self.knowledge.print("Map analysis could not be saved", "MapAnalysis", stats=False)
+
     def configure_managers(self) -> Optional[List[ManagerBase]]:
         """
         Override this for custom manager usage.
@@ -89,6 +116,7 @@ class KnowledgeBot(BotAI):
         # This is only needed for real time, but we don't really know whether the game is real time or not.
         await self.start_first_worker()
         self._client.game_step = int(self.config["general"]["game_step_size"])
+        self._client.pipeline_requests = bool(self.config["general"].getboolean("pipeline_requests"))
 
         if self.realtime_split:
             # Split workers
@@ -123,16 +151,20 @@ class KnowledgeBot(BotAI):
             self.last_game_loop = self.state.game_loop
 
             ns_step = time.perf_counter_ns()
-            await self.knowledge.update(iteration)
+            profiler = self.knowledge.profiler
+            with profiler.measure("update"):
+                await self.knowledge.update(iteration)
             await self.pre_step_execute()
             await self.plan.execute()
 
-            await self.knowledge.post_update()
+            with profiler.measure("post_update"):
+                await self.knowledge.post_update()
 
             if self.knowledge.debug:
                 await self.plan.debug_draw()
 
             ns_step = time.perf_counter_ns() - ns_step
+            profiler.end_frame()
             ms_step = ns_step / 1000 / 1000
 
             if ms_step > 100:
@@ -172,6 +204,8 @@ class KnowledgeBot(BotAI):
     async def on_end(self, game_result: Result):
         if self.knowledge.ai is not None:
             await self.knowledge.on_end(game_result)
+            # Overlord spots are calculated when they are first needed, which may be after start
+            self._save_map_analysis()
 
     def _log_start(self):
         def log(message):
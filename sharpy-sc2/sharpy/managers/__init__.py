@@ -10,6 +10,7 @@ from .lostunitsmanager import LostUnitsManager
 from .previousunitsmanager import PreviousUnitsManager
 from .build_detector import BuildDetector
 from .pathing_manager import PathingManager
+from .pathing_query_manager import PathingQueryManager
 from .game_analyzer import GameAnalyzer
 from .group_combat_manager import GroupCombatManager
 from .data_manager import DataManager
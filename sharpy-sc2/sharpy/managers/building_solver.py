@@ -1,6 +1,7 @@
 import enum
 import logging
 import math
+import os
 from math import floor
 from typing import Dict, List, Optional, Tuple, Set
 
@@ -24,6 +25,7 @@ import sc2
 from sharpy.managers.manager_base import ManagerBase
 from sc2.position import Point2, Point3
 from sharpy.general.extended_ramp import RampPosition
+from sharpy.mapping.map_cache import MAP_DATA_FOLDER, map_key
 
 from .grids import *
 
@@ -37,18 +39,9 @@ class WallType(enum.IntEnum):
     TerranMainDepots = (5,)
 
 
-def is_empty(cell: GridArea) -> bool:
-    return cell.Area == BuildArea.Empty
-
-
-def is_free(cell: GridArea) -> bool:
-    return cell.Area == BuildArea.Empty or cell.Area == BuildArea.BuildingPadding
-
-
-def fill_padding(cell: GridArea, point: Point2 = None) -> GridArea:
-    if cell.Area == BuildArea.Empty:
-        cell.Area = BuildArea.BuildingPadding
-    return cell
+NOT_HARD_WALL_AREAS = area_filter([BuildArea.NotBuildable, BuildArea.HighRock], inverse=True)
+# Increase when the solver changes, so that layouts solved by older versions are not loaded
+LAYOUT_VERSION = 1
 
 
 class WallFinder:
@@ -73,25 +66,55 @@ class WallFinder:
         self.score = score
 
     def query(self, grid: BuildGrid, position: Point2, zone: ZoneArea):
-        def is_not_hard_wall(cell: GridArea) -> bool:
-            if cell.Area == BuildArea.NotBuildable or cell.Area == BuildArea.HighRock:
-                return False
-            return True
-
         # and cell.ZoneIndex == zone
 
         # Both checks need to match with hard wall
         for check in self.checks:
-            if grid.query_area(position + check, BlockerType.Building3x3, is_not_hard_wall):
+            if grid.query_area_in(position + check, BlockerType.Building3x3, NOT_HARD_WALL_AREAS):
                 return False
 
         # All buildings must be buildable:
         for building in self.buildings:
-            if not grid.query_area(position + building, BlockerType.Building3x3, is_empty):
+            if not grid.query_area_in(position + building, BlockerType.Building3x3, EMPTY_AREAS):
                 return False
 
         return True
 
+    def query_all(
+        self, grid: BuildGrid, positions: List[Point2], empty: np.ndarray, not_hard_wall: np.ndarray, zone: ZoneArea
+    ) -> np.ndarray:
+        """
+        Runs query for all positions at once, returns boolean array of the results.
+
+        @param empty: grid.query_rects_in(-1, -1, 3, 3, EMPTY_AREAS), i.e. 3x3 area at each cell is empty
+        @param not_hard_wall: grid.query_rects_in(-1, -1, 3, 3, NOT_HARD_WALL_AREAS)
+        """
+        # Offsets are whole cells, so the 3x3 area of position + offset is at floor(position) + offset
+        xs = np.array([floor(position.x) for position in positions], dtype=np.int32)
+        ys = np.array([floor(position.y) for position in positions], dtype=np.int32)
+        offsets = self.checks + self.buildings
+        inside = (
+            (xs + min(offset.x for offset in offsets) >= 0)
+            & (xs + max(offset.x for offset in offsets) < grid.width)
+            & (ys + min(offset.y for offset in offsets) >= 0)
+            & (ys + max(offset.y for offset in offsets) < grid.height)
+        )
+
+        x = xs[inside]
+        y = ys[inside]
+        found = np.ones(len(x), dtype=bool)
+        for check in self.checks:
+            found &= ~not_hard_wall[x + int(check.x), y + int(check.y)]
+        for building in self.buildings:
+            found &= empty[x + int(building.x), y + int(building.y)]
+
+        result = np.zeros(len(positions), dtype=bool)
+        result[inside] = found
+        # Areas at the edge of the grid are clipped, query those one by one
+        for index in np.nonzero(~inside)[0]:
+            result[index] = self.query(grid, positions[index], zone)
+        return result
+
     def positions(self, position: Point2) -> List[Point2]:
         list = []
         for building in self.buildings:
@@ -110,6 +133,9 @@ class BuildingSolver(ManagerBase):
 
         self.wall_buildings: List[Point2] = []
         self.wall_pylons: List[Point2] = []
+        # Solved layouts are stored per map, spawn, race and wall type when map cache is enabled
+        self.layout_file: Optional[str] = None
+        self._map_key: Optional[str] = None
 
         self.wall_finders_v = [
             # Pure vertical walls
@@ -184,6 +210,9 @@ class BuildingSolver(ManagerBase):
         self.color_zone(self.knowledge.expansion_zones[1], ZoneArea.OwnNaturalZone)
         self.color_zone(self.knowledge.expansion_zones[2], ZoneArea.OwnThirdZone)
 
+        if self.knowledge.config["general"].getboolean("map_cache"):
+            self._map_key = map_key(self.ai.game_info)
+
     async def update(self):
         if self.knowledge.iteration == 0:
             await self.solve_grid()
@@ -201,28 +230,22 @@ class BuildingSolver(ManagerBase):
                 client.debug_box_out(c1, c2)
 
             correction = Point2((0, 1))
-            for x in range(0, self.grid.width - 1):
-                for y in range(0, self.grid.height - 1):
-                    cell: GridArea = self.grid.get(x, y)
-                    color = None
-                    if cell.Area == BuildArea.Building:
-                        color = self.grid.building_color
-                    elif cell.Area == BuildArea.TownHall:
-                        color = self.grid.townhall_color
-                    elif cell.Area == BuildArea.Pylon:
-                        color = self.grid.pylon_color
-                    elif cell.Area == BuildArea.Mineral:
-                        color = self.grid.mineral_color
-                    elif cell.Area == BuildArea.Gas:
-                        color = self.grid.gas_color
-                    # elif cell.Area == BuildArea.Empty:
-                    #    color = self.grid.gas_color
-
-                    if color:
-                        z = self.knowledge.get_z(Point2((x, y)) + correction)
-                        c1 = Point3((x, y, z))
-                        c2 = Point3((x + 1, y + 1, z + 1))
-                        client.debug_box_out(c1, c2, color)
+            colors = {
+                BuildArea.Building: self.grid.building_color,
+                BuildArea.TownHall: self.grid.townhall_color,
+                BuildArea.Pylon: self.grid.pylon_color,
+                BuildArea.Mineral: self.grid.mineral_color,
+                BuildArea.Gas: self.grid.gas_color,
+            }
+            areas = self.grid.areas[: self.grid.width - 1, : self.grid.height - 1]
+            for area, color in colors.items():
+                for x, y in zip(*np.nonzero(areas == area.value)):
+                    x = int(x)
+                    y = int(y)
+                    z = self.knowledge.get_z(Point2((x, y)) + correction)
+                    c1 = Point3((x, y, z))
+                    c2 = Point3((x + 1, y + 1, z + 1))
+                    client.debug_box_out(c1, c2, color)
 
     async def solve_grid(self):
         if self.wall_type == WallType.Auto:
@@ -238,6 +261,16 @@ class BuildingSolver(ManagerBase):
             elif self.knowledge.my_race == Race.Terran:
                 self.wall_type = WallType.TerranMainDepots
 
+        if self._map_key is not None:
+            self.layout_file = os.path.join(
+                MAP_DATA_FOLDER, f"{self._map_key}-buildings-{self.knowledge.my_race.name}-{self.wall_type.name}.npz",
+            )
+            if self.load_layout(self.layout_file):
+                self.print(f"Loaded building layout from {self.layout_file}", stats=False, log_level=logging.DEBUG)
+                if self.debug:
+                    self.grid.save("buildGrid.bmp")
+                return
+
         if self.wall_type == WallType.ProtossNaturalOneUnit:
             if not await self.natural_wall():
                 self.zerg_wall()
@@ -252,9 +285,77 @@ class BuildingSolver(ManagerBase):
 
         self.solve_buildings()
 
+        if self.layout_file is not None:
+            try:
+                self.save_layout(self.layout_file)
+            except OSError:
+                self.print("Building layout could not be saved", stats=False)
+
         if self.debug:
             self.grid.save("buildGrid.bmp")
 
+    def load_layout(self, file_name: str) -> bool:
+        """Loads solved building layout from the file, returns true if the file was found and could be read."""
+        if not os.path.isfile(file_name):
+            return False
+
+        try:
+            with np.load(file_name, allow_pickle=False) as data:
+                if int(data["version"]) != LAYOUT_VERSION or data["areas"].shape != self.grid.areas.shape:
+                    return False
+
+                positions: Dict[BuildArea, List[Point2]] = {}
+                for area in BuildArea:
+                    key = f"positions_{area.name}"
+                    if key in data:
+                        positions[area] = self._to_points(data[key])
+                zealot = self._to_points(data["zealot"])
+                wall_buildings = self._to_points(data["wall_buildings"])
+                wall_pylons = self._to_points(data["wall_pylons"])
+                areas = data["areas"]
+                building_indices = data["building_indices"]
+        except (OSError, ValueError, KeyError):
+            return False
+
+        self.grid.areas[:, :] = areas
+        self.grid.building_indices[:, :] = building_indices
+        self._building_positions = positions
+        self.zealot_position = zealot[0] if zealot else None
+        self.wall_buildings = wall_buildings
+        self.wall_pylons = wall_pylons
+        return True
+
+    def save_layout(self, file_name: str):
+        """Writes the solved building layout to the file."""
+        folder = os.path.dirname(file_name)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        arrays = {f"positions_{area.name}": self._to_array(points) for area, points in self._building_positions.items()}
+        zealot = [self.zealot_position] if self.zealot_position is not None else []
+        with open(file_name, "wb") as handle:
+            np.savez_compressed(
+                handle,
+                version=np.array(LAYOUT_VERSION),
+                areas=self.grid.areas,
+                building_indices=self.grid.building_indices,
+                zealot=self._to_array(zealot),
+                wall_buildings=self._to_array(self.wall_buildings),
+                wall_pylons=self._to_array(self.wall_pylons),
+                **arrays,
+            )
+
+    @staticmethod
+    def _to_array(points: List[Point2]) -> np.ndarray:
+        return np.array([(point.x, point.y) for point in points], dtype=np.float64).reshape(-1, 2)
+
+    @staticmethod
+    def _to_points(array: np.ndarray) -> List[Point2]:
+        # Solver places 2x2 buildings at whole cells, keep those as integers like the solver does
+        return [
+            Point2(tuple(int(value) if value.is_integer() else float(value) for value in row)) for row in array.tolist()
+        ]
+
     def terran_depot_wall(self):
         main: Zone = self.knowledge.own_main_zone
         if main.ramp.ramp.depot_in_middle:
@@ -288,54 +389,55 @@ class BuildingSolver(ManagerBase):
         if self.ai.start_location.x < self.ai.game_info.map_center.x:
             x_range = range(-18, 18)[::-1]
             action = self.pylon_pair_reversed
+            # Rectangles that the action checks as (x, y, width, height, area filter) relative to the position
+            action_rects = [(0, 0, 2, 2, EMPTY_AREAS), (-3, 0, 3, 3, EMPTY_AREAS)]
         else:
             action = self.pylon_pair_normal
+            action_rects = [(0, 0, 2, 2, EMPTY_AREAS), (2, 0, 3, 3, EMPTY_AREAS)]
 
         y_range = range(-18, 18)
         if self.ai.start_location.y < self.ai.game_info.map_center.y:
             y_range = range(-18, 18)[::-1]
 
         if self.knowledge.my_race == Race.Terran:
-            for x in x_range:
-                for y in y_range:
-                    pos = Point2((x + center.x, y + center.y))
-                    area: GridArea = self.grid[pos]
-
-                    if area is None or area.ZoneIndex != zone_color:
-                        continue
-
-                    self.terran_massive_grid(pos)
-
-            for x in x_range:
-                for y in y_range:
-                    pos = Point2((x + center.x, y + center.y))
-                    area: GridArea = self.grid[pos]
-
-                    if area is None or area.ZoneIndex != zone_color:
-                        continue
-
-                    self.terran_grid(pos)
+            passes = [
+                (self.terran_massive_grid, [(0, 0, 7, 8, EMPTY_AREAS)]),
+                (self.terran_grid, [(0, 0, 6, 5, EMPTY_AREAS)]),
+            ]
         else:
+            passes = []
             if zone_color == ZoneArea.OwnMainZone:
-                for x in x_range:
-                    for y in y_range:
-                        pos = Point2((x + center.x, y + center.y))
-                        area: GridArea = self.grid[pos]
-
-                        if area is None or area.ZoneIndex != zone_color:
-                            continue
-
-                        self.massive_grid(pos)
-
-            for x in x_range:
-                for y in y_range:
-                    pos = Point2((x + center.x, y + center.y))
-                    area: GridArea = self.grid[pos]
-
-                    if area is None or area.ZoneIndex != zone_color:
-                        continue
-
-                    action(pos)
+                massive_rects = [(0, 0, 6, 9, EMPTY_AREAS), (-2, 4, 2, 2, FREE_AREAS), (6, 4, 2, 2, FREE_AREAS)]
+                passes.append((self.massive_grid, massive_rects))
+            passes.append((action, action_rects))
+
+        for grid_action, rects in passes:
+            for pos in self.zone_candidates(center, x_range, y_range, zone_color, rects):
+                grid_action(pos)
+
+    def zone_candidates(
+        self, center: Point2, x_range: range, y_range: range, zone_color: ZoneArea, rects: List[tuple]
+    ) -> List[Point2]:
+        """
+        Returns positions in the zone around center where all rectangles currently match their area filters,
+        in the order of x_range and y_range.
+        Filling the grid only ever makes cells less free, so positions that don't pass now are never built to
+        and the grid actions only need to check the remaining candidates again.
+
+        @param rects: list of (x, y, width, height, area filter) relative to the position
+        """
+        grid = self.grid
+        xs = np.array(x_range) + center.x
+        ys = np.array(y_range) + center.y
+        inside = ((xs >= 0) & (xs < grid.width))[:, np.newaxis] & ((ys >= 0) & (ys < grid.height))[np.newaxis, :]
+        index_x = np.clip(xs, 0, grid.width - 1)[:, np.newaxis]
+        index_y = np.clip(ys, 0, grid.height - 1)[np.newaxis, :]
+
+        candidates = inside & (grid.zones[index_x, index_y] == zone_color.value)
+        for x, y, width, height, area_filter in rects:
+            candidates &= grid.query_rects_in(x, y, width, height, area_filter)[index_x, index_y]
+
+        return [Point2((int(xs[i]), int(ys[j]))) for i, j in zip(*np.nonzero(candidates))]
 
     def massive_grid(self, pos):
         rect = Rectangle(pos.x, pos.y, 6, 9)
@@ -344,9 +446,9 @@ class BuildingSolver(ManagerBase):
         padding = Rectangle(pos.x - 2, pos.y - 2, 10, 12)
 
         if (
-            self.grid.query_rect(rect, is_empty)
-            and self.grid.query_rect(unit_exit_rect, is_free)
-            and self.grid.query_rect(unit_exit_rect2, is_free)
+            self.grid.query_rect_in(rect, EMPTY_AREAS)
+            and self.grid.query_rect_in(unit_exit_rect, FREE_AREAS)
+            and self.grid.query_rect_in(unit_exit_rect2, FREE_AREAS)
         ):
             pylons = [pos + Point2((1, 1)), pos + Point2((1 + 2, 1)), pos + Point2((1 + 4, 1))]
             gates = [
@@ -357,7 +459,7 @@ class BuildingSolver(ManagerBase):
             ]
 
             pylon_check = pylons[0].offset(Point2((0, -1)))
-            if not self.grid.query_area(pylon_check, BlockerType.Building2x2, is_free):
+            if not self.grid.query_area_in(pylon_check, BlockerType.Building2x2, FREE_AREAS):
                 pylons.pop(0)
 
             for pylon_pos in pylons:
@@ -366,13 +468,13 @@ class BuildingSolver(ManagerBase):
             for gate_pos in gates:
                 self.fill_and_save(gate_pos, BlockerType.Building3x3, BuildArea.Building)
 
-            self.grid.fill_rect(padding, fill_padding)
+            self.grid.fill_rect_with(padding, BuildArea.BuildingPadding, EMPTY_AREAS)
 
     def terran_grid(self, pos):
         rect = Rectangle(pos.x, pos.y, 6, 5)
         padding = Rectangle(pos.x, pos.y, 7, 5)
 
-        if self.grid.query_rect(rect, is_empty):
+        if self.grid.query_rect_in(rect, EMPTY_AREAS):
             pylons = [pos + Point2((1, 4)), pos + Point2((1 + 2, 4)), pos + Point2((1 + 4, 4))]
             gates = [
                 pos + Point2((1.5, 1.5)),
@@ -383,13 +485,13 @@ class BuildingSolver(ManagerBase):
             for gate_pos in gates:
                 self.fill_and_save(gate_pos, BlockerType.Building3x3, BuildArea.Building)
 
-            self.grid.fill_rect(padding, fill_padding)
+            self.grid.fill_rect_with(padding, BuildArea.BuildingPadding, EMPTY_AREAS)
 
     def terran_massive_grid(self, pos):
         rect = Rectangle(pos.x, pos.y, 7, 8)
         # padding = Rectangle(pos.x, pos.y - 2, 7, 8)
 
-        if self.grid.query_rect(rect, is_empty):
+        if self.grid.query_rect_in(rect, EMPTY_AREAS):
             pylons = [pos + Point2((1, 3)), pos + Point2((6, 4)), pos + Point2((6, 6))]
             gates = [
                 pos + Point2((1.5, 5.5)),
@@ -401,27 +503,27 @@ class BuildingSolver(ManagerBase):
             for gate_pos in gates:
                 self.fill_and_save(gate_pos, BlockerType.Building3x3, BuildArea.Building)
 
-            self.grid.fill_rect(rect, fill_padding)
+            self.grid.fill_rect_with(rect, BuildArea.BuildingPadding, EMPTY_AREAS)
 
     def pylon_pair_normal(self, pos):
         rect_pylon = Rectangle(pos.x, pos.y, 2, 2)
         rect = Rectangle(rect_pylon.right, pos.y, 3, 3)
-        if self.grid.query_rect(rect_pylon, is_empty) and self.grid.query_rect(rect, is_empty):
+        if self.grid.query_rect_in(rect_pylon, EMPTY_AREAS) and self.grid.query_rect_in(rect, EMPTY_AREAS):
             pylon_pos = pos + Point2((1, 1))
             gate_pos = pos + Point2((3.5, 1.5))
             self.fill_and_save(pylon_pos, BlockerType.Building2x2, BuildArea.Pylon)
             self.fill_and_save(gate_pos, BlockerType.Building3x3, BuildArea.Building)
-            self.grid.fill_area(gate_pos, BlockerType.Building5x5, fill_padding)
+            self.grid.fill_area_with(gate_pos, BlockerType.Building5x5, BuildArea.BuildingPadding, EMPTY_AREAS)
 
     def pylon_pair_reversed(self, pos):
         rect_pylon = Rectangle(pos.x, pos.y, 2, 2)
         rect = Rectangle(rect_pylon.x - 3, pos.y, 3, 3)
-        if self.grid.query_rect(rect_pylon, is_empty) and self.grid.query_rect(rect, is_empty):
+        if self.grid.query_rect_in(rect_pylon, EMPTY_AREAS) and self.grid.query_rect_in(rect, EMPTY_AREAS):
             pylon_pos = pos + Point2((1, 1))
             gate_pos = pos + Point2((-1.5, 1.5))
             self.fill_and_save(pylon_pos, BlockerType.Building2x2, BuildArea.Pylon)
             self.fill_and_save(gate_pos, BlockerType.Building3x3, BuildArea.Building)
-            self.grid.fill_area(gate_pos, BlockerType.Building5x5, fill_padding)
+            self.grid.fill_area_with(gate_pos, BlockerType.Building5x5, BuildArea.BuildingPadding, EMPTY_AREAS)
 
     def protoss_wall(self):
         ramp: "ExtendedRamp" = self.knowledge.base_ramp
@@ -500,9 +602,43 @@ class BuildingSolver(ManagerBase):
         self, center: Point2, perpendicular: Point2, search_vector: Point2, wall_finders: List[WallFinder]
     ):
         map_data = np.swapaxes(self.ai.game_info.pathing_grid.data_numpy, 0, 1)
+        tester: Optional[sc2pathlibp.PathFinder] = None
 
+        for score, name, lookup, pylon, zealot, gates in self.wall_candidates(
+            center, perpendicular, search_vector, wall_finders
+        ):
+            if tester is None:
+                tester = sc2pathlibp.PathFinder(map_data)
+            else:
+                tester.reset()
+
+            tester.create_block(gates, (3, 3))
+            tester.create_block(zealot, (1, 1))
+            path = tester.find_path(
+                self.knowledge.expansion_zones[1].center_location, self.knowledge.enemy_start_location
+            )
+
+            if path[1] > 0:
+                self.print(
+                    f"Wall {name} was found at {lookup}, but disregarded due to not blocking check", stats=False,
+                )
+                continue
+
+            self.print(f"Natural wall {name} found! ({lookup})", stats=False, log_level=logging.DEBUG)
+            self.save_natural_wall(pylon, zealot, gates)
+            return True
+        return False
+
+    def wall_candidates(
+        self, center: Point2, perpendicular: Point2, search_vector: Point2, wall_finders: List[WallFinder]
+    ) -> List[Tuple[int, str, Point2, Point2, Point2, List[Point2]]]:
+        """
+        Evaluates all wall finders at all positions in the search area at once.
+        Returns walls that fit the grid as (score, name, position, pylon, zealot, gates) tuples,
+        ranked by score and then by the order of the search.
+        """
         zone_height = self.ai.get_terrain_height(center)
-        wall: Optional[Tuple[int, Point2, Point2, List[Point2]]] = None
+        lookups: List[Point2] = []
 
         for i in range(5, 15):
             for j in range(-15, 16):
@@ -511,53 +647,33 @@ class BuildingSolver(ManagerBase):
                 if zone_height != self.ai.get_terrain_height(lookup):
                     # height doesn't match with zone height
                     continue
-
-                for finder in wall_finders:
-
-                    if finder.query(self.grid, lookup, ZoneArea.OwnNaturalZone):
-                        pylon = lookup - 2.5 * search_vector
-                        zealot = lookup + finder.zealot
-                        gates = finder.positions(lookup)
-
-                        tester: sc2pathlibp.PathFinder = sc2pathlibp.PathFinder(map_data)
-
-                        tester.create_block(gates, (3, 3))
-                        tester.create_block(zealot, (1, 1))
-                        path = tester.find_path(
-                            self.knowledge.expansion_zones[1].center_location, self.knowledge.enemy_start_location
-                        )
-
-                        if path[1] > 0:
-                            self.print(
-                                f"Wall {finder.name} was found at {lookup}, but disregarded due to not blocking check",
-                                stats=False,
-                            )
-                            continue
-
-                        if wall is None:
-                            self.print(
-                                f"Natural wall {finder.name} found! ({lookup})", stats=False, log_level=logging.DEBUG
-                            )
-                            wall = (finder.score, pylon, zealot, gates)
-                        elif wall[0] < finder.score:
-                            self.print(
-                                f"Better natural wall {finder.name} found! ({lookup})",
-                                stats=False,
-                                log_level=logging.DEBUG,
-                            )
-                            wall = (finder.score, pylon, zealot, gates)
-                        else:
-                            self.print(
-                                f"Natural wall {finder.name} found, but disregarded! ({lookup})",
-                                stats=False,
-                                log_level=logging.DEBUG,
-                            )
-                            wall = (finder.score, pylon, zealot, gates)
-
-        if wall is not None:
-            self.save_natural_wall(wall[1], wall[2], wall[3])
-            return True
-        return False
+                lookups.append(lookup)
+
+        if not lookups:
+            return []
+
+        empty = self.grid.query_rects_in(-1, -1, 3, 3, EMPTY_AREAS)
+        not_hard_wall = self.grid.query_rects_in(-1, -1, 3, 3, NOT_HARD_WALL_AREAS)
+        # Rows are positions and columns are wall finders, so that nonzero returns them in the search order
+        found = np.stack(
+            [
+                finder.query_all(self.grid, lookups, empty, not_hard_wall, ZoneArea.OwnNaturalZone)
+                for finder in wall_finders
+            ],
+            axis=1,
+        )
+
+        walls = []
+        for lookup_index, finder_index in zip(*np.nonzero(found)):
+            finder = wall_finders[finder_index]
+            lookup = lookups[lookup_index]
+            pylon = lookup - 2.5 * search_vector
+            zealot = lookup + finder.zealot
+            walls.append((finder.score, finder.name, lookup, pylon, zealot, finder.positions(lookup)))
+
+        # Sort is stable, walls with the same score stay in search order
+        walls.sort(key=lambda wall: -wall[0])
+        return walls
 
     def save_natural_wall(self, pylon: Point2, zealot: Point2, gates: List[Point2]):
         pylon = pylon.rounded
@@ -568,7 +684,7 @@ class BuildingSolver(ManagerBase):
         for position in sc2math.spiral(7, 7):
             pylon_check = pylon + position
             if (
-                self.grid.query_area(pylon_check, BlockerType.Building2x2, is_empty)
+                self.grid.query_area_in(pylon_check, BlockerType.Building2x2, EMPTY_AREAS)
                 and pylon_check.distance_to(gates[0]) < Constants.PYLON_POWERED_DISTANCE
                 and pylon_check.distance_to(gates[1]) < Constants.PYLON_POWERED_DISTANCE
                 and pylon_check.distance_to(gates[2]) < Constants.PYLON_POWERED_DISTANCE
@@ -613,13 +729,7 @@ class BuildingSolver(ManagerBase):
         else:
             building_index = -1
 
-        def filler(cell: GridArea):
-            if cell.Area == BuildArea.Empty or cell.Area == BuildArea.BuildingPadding:
-                cell.BuildingIndex = building_index
-                cell.Area = area
-            return cell
-
-        self.grid.fill_area(position, blocker_type, filler)
+        self.grid.fill_area_with(position, blocker_type, area, FREE_AREAS, building_index)
 
     def color_zone(self, zone: Zone, zone_type: ZoneArea):
         center = Point2((floor(zone.center_location.x), floor(zone.center_location.y)))
@@ -627,15 +737,13 @@ class BuildingSolver(ManagerBase):
         radius = zone.radius
         height = self.ai.get_terrain_height(center)
 
-        def fill_circle(cell: GridArea, point: Point2) -> GridArea:
-            if (
-                cell.Area == BuildArea.Empty
-                and height == self.ai.get_terrain_height(point)
-                and point.distance_to_point2(center) <= zone.radius
-            ):
-                cell.ZoneIndex = zone_type
-
-            return cell
-
         rect = Rectangle(center.x - radius, center.y - radius, radius * 2, radius * 2)
-        self.grid.fill_rect_func(rect, fill_circle)
+        slices = self.grid.rect_slices(rect)
+        xs = np.arange(slices[0].start, slices[0].stop)[:, np.newaxis]
+        ys = np.arange(slices[1].start, slices[1].stop)[np.newaxis, :]
+        mask = (
+            (self.grid.areas[slices] == BuildArea.Empty.value)
+            & (self.grid.heights[slices] == height)
+            & ((xs - center.x) ** 2 + (ys - center.y) ** 2 <= zone.radius * zone.radius)
+        )
+        self.grid.zones[slices][mask] = zone_type.value
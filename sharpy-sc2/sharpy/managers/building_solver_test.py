@@ -0,0 +1,48 @@
+import os
+import random
+
+from sc2.position import Point2
+from .building_solver import BuildingSolver, NOT_HARD_WALL_AREAS
+from .grids import BlockerType, BuildArea, EMPTY_AREAS, ZoneArea
+from .grids.build_grid_test import mock_grid
+
+
+class TestBuildingSolver:
+    def test_wall_finder_query_all_returns_same_results_as_query(self):
+        solver = BuildingSolver()
+        grid = mock_grid(40, 30, seed=3)
+        grid.areas[grid.areas == BuildArea.BuildingPadding.value] = BuildArea.HighRock.value
+        empty = grid.query_rects_in(-1, -1, 3, 3, EMPTY_AREAS)
+        not_hard_wall = grid.query_rects_in(-1, -1, 3, 3, NOT_HARD_WALL_AREAS)
+
+        rnd = random.Random(2)
+        positions = [Point2((rnd.uniform(-2, 42), rnd.uniform(-2, 32))) for _ in range(300)]
+
+        for finder in solver.wall_finders_v + solver.wall_finders_h + solver.wall_finders_d:
+            results = finder.query_all(grid, positions, empty, not_hard_wall, ZoneArea.OwnNaturalZone)
+            for position, result in zip(positions, results):
+                assert result == finder.query(grid, position, ZoneArea.OwnNaturalZone)
+
+    def test_saved_layout_is_loaded(self, tmpdir):
+        file_name = os.path.join(str(tmpdir), "maps", "test-buildings.npz")
+        solver = BuildingSolver()
+        solver.grid = mock_grid(20, 20)
+        solver.fill_and_save(Point2((5, 5)), BlockerType.Building2x2, BuildArea.Pylon)
+        solver.fill_and_save(Point2((8.5, 5.5)), BlockerType.Building3x3, BuildArea.Building)
+        solver.zealot_position = Point2((10.5, 7.5))
+        solver.wall_buildings = [Point2((8.5, 5.5))]
+        solver.save_layout(file_name)
+
+        loaded = BuildingSolver()
+        loaded.grid = mock_grid(20, 20, seed=2)
+        assert loaded.load_layout(file_name)
+        assert (loaded.grid.areas == solver.grid.areas).all()
+        assert (loaded.grid.building_indices == solver.grid.building_indices).all()
+        assert loaded.pylon_position == [Point2((5, 5))]
+        assert isinstance(loaded.pylon_position[0].x, int)
+        assert loaded.building_position == [Point2((8.5, 5.5))]
+        assert loaded.zealot_position == Point2((10.5, 7.5))
+        assert loaded.wall_buildings == [Point2((8.5, 5.5))]
+        assert loaded.wall_pylons == []
+
+        assert not loaded.load_layout(os.path.join(str(tmpdir), "missing.npz"))
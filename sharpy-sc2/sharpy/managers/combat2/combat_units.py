@@ -3,20 +3,22 @@ from typing import Optional, List
 from sc2.position import Point2
 from sharpy import sc2math
 from sharpy.general.extended_power import ExtendedPower
+from sharpy.general.group_statistics import GroupStats
 
 from sc2.unit import Unit
 from sc2.units import Units
 
 
 class CombatUnits:
-    def __init__(self, units: Units, knowledge: "Knowledge"):
+    def __init__(self, units: Units, knowledge: "Knowledge", stats: Optional[GroupStats] = None):
+        """
+        @param stats: statistics calculated for all groups at once by GroupStatistics,
+        calculated here for this group only when not given
+        """
         self.knowledge = knowledge
         self.unit_values = knowledge.unit_values
         self.units = units
-        self.center: Point2 = sc2math.unit_geometric_median(units)
         self.ground_units = self.units.not_flying
-        if self.ground_units:
-            self.center: Point2 = self.ground_units.closest_to((self.center)).position
 
         self.power = ExtendedPower(self.unit_values)
         self.power.add_units(self.units)
@@ -25,6 +27,17 @@ class CombatUnits:
         self._area_by_circles: float = 0
         self.average_speed = 0
 
+        if stats is not None:
+            self.center: Point2 = stats.center
+            self.average_speed = stats.average_speed
+            self._total_distance = stats.total_distance
+            self._area_by_circles = stats.area_by_circles
+            return
+
+        self.center: Point2 = sc2math.unit_geometric_median(units)
+        if self.ground_units:
+            self.center: Point2 = self.ground_units.closest_to((self.center)).position
+
         for unit in self.units:
             self.average_speed += knowledge.unit_values.real_speed(unit)
 
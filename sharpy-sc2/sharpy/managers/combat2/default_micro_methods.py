@@ -5,6 +5,7 @@ from sc2 import UnitTypeId, Race, AbilityId
 from sc2.position import Point2
 from sc2.unit import Unit
 from sc2.units import Units
+from sharpy import sc2math
 from sharpy.general.extended_power import ExtendedPower
 from sharpy.managers.combat2 import CombatUnits, MoveType, MicroStep, Action
 from typing import TYPE_CHECKING
@@ -124,16 +125,18 @@ class DefaultMicroMethods:
         step.enemy_attack_range = 0
         attack_range_count = 0
         enemy_attack_range_count = 0
+        # Distances from all units to all enemies near by with shape (units, enemies)
+        distances = sc2math.distance_matrix(step.positions, sc2math.to_array(step.enemies_near_by))
 
-        for unit in units:
+        for unit_index, unit in enumerate(units):
             closest_distance = 1000
             if step.ready_to_shoot(unit):
                 ready_to_attack += 1
 
             engage_added = False
             can_engage_added = False
-            for enemy_near in step.enemies_near_by:  # type: Unit
-                d = enemy_near.distance_to(unit)
+            for enemy_index, enemy_near in enumerate(step.enemies_near_by):  # type: Unit
+                d = distances[unit_index, enemy_index]
                 if d < closest_distance:
                     step.closest_units[unit.tag] = enemy_near
                     closest_distance = d
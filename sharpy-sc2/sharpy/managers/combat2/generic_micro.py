@@ -126,7 +126,7 @@ class GenericMicro(MicroStep):
                 return Action(backstep, False)
 
         if self.should_retreat(unit) and self.closest_group and not self.ready_to_shoot(unit):
-            backstep: Point2 = unit.position.towards(self.closest_group.center, -3)
+            backstep: Point2 = self.backstep(unit, 3)
             if unit.is_flying:
                 backstep = self.pather.find_weak_influence_air(backstep, 4)
             else:
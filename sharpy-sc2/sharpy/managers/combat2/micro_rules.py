@@ -1,14 +1,12 @@
-from typing import Dict, Callable, Optional, List
+import importlib
+from typing import Dict, Callable, Optional, List, Tuple
 
-from sc2 import UnitTypeId
+from sc2 import UnitTypeId, Race
 from sc2.position import Point2
 from sc2.unit import Unit
 from sc2.units import Units
 from sharpy.general.component import Component
 
-from sharpy.managers.combat2.protoss import *
-from sharpy.managers.combat2.terran import *
-from sharpy.managers.combat2.zerg import *
 from sharpy.managers.combat2 import *
 
 from typing import TYPE_CHECKING
@@ -20,6 +18,57 @@ if TYPE_CHECKING:
     from sharpy.managers.group_combat_manager import GroupCombatManager
 
 
+# Default micro of each race as module and class name, so that micro can be imported only for the race being played
+DEFAULT_MICROS: Dict[Race, Dict[UnitTypeId, Tuple[str, str]]] = {
+    Race.Protoss: {
+        UnitTypeId.PROBE: ("sharpy.managers.combat2", "MicroWorkers"),
+        UnitTypeId.ARCHON: ("sharpy.managers.combat2", "NoMicro"),
+        UnitTypeId.ADEPT: ("sharpy.managers.combat2.protoss.micro_adepts", "MicroAdepts"),
+        UnitTypeId.IMMORTAL: ("sharpy.managers.combat2.protoss.micro_immortal", "MicroImmortals"),
+        UnitTypeId.CARRIER: ("sharpy.managers.combat2.protoss.micro_carriers", "MicroCarriers"),
+        UnitTypeId.COLOSSUS: ("sharpy.managers.combat2.protoss.micro_colossi", "MicroColossi"),
+        UnitTypeId.DARKTEMPLAR: ("sharpy.managers.combat2.zerg.micro_zerglings", "MicroZerglings"),
+        UnitTypeId.DISRUPTOR: ("sharpy.managers.combat2.protoss.micro_disruptor", "MicroDisruptor"),
+        UnitTypeId.DISRUPTORPHASED: ("sharpy.managers.combat2.protoss.micro_disruptor", "MicroPurificationNova"),
+        UnitTypeId.HIGHTEMPLAR: ("sharpy.managers.combat2.protoss.micro_hightemplars", "MicroHighTemplars"),
+        UnitTypeId.OBSERVER: ("sharpy.managers.combat2.protoss.micro_observers", "MicroObservers"),
+        UnitTypeId.ORACLE: ("sharpy.managers.combat2.protoss.micro_oracles", "MicroOracles"),
+        UnitTypeId.PHOENIX: ("sharpy.managers.combat2.protoss.micro_phoenixes", "MicroPhoenixes"),
+        UnitTypeId.SENTRY: ("sharpy.managers.combat2.protoss.micro_sentries", "MicroSentries"),
+        UnitTypeId.STALKER: ("sharpy.managers.combat2.protoss.micro_stalkers", "MicroStalkers"),
+        UnitTypeId.WARPPRISM: ("sharpy.managers.combat2.protoss.micro_warp_prism", "MicroWarpPrism"),
+        UnitTypeId.VOIDRAY: ("sharpy.managers.combat2.protoss.micro_voidrays", "MicroVoidrays"),
+        UnitTypeId.ZEALOT: ("sharpy.managers.combat2.protoss.micro_zealots", "MicroZealots"),
+        UnitTypeId.MOTHERSHIP: ("sharpy.managers.combat2.protoss.micro_mothership", "MicroMotherShip"),
+    },
+    Race.Zerg: {
+        UnitTypeId.DRONE: ("sharpy.managers.combat2", "MicroWorkers"),
+        UnitTypeId.ZERGLING: ("sharpy.managers.combat2.zerg.micro_zerglings", "MicroZerglings"),
+        UnitTypeId.ULTRALISK: ("sharpy.managers.combat2", "NoMicro"),
+        UnitTypeId.OVERSEER: ("sharpy.managers.combat2.zerg.micro_overseers", "MicroOverseers"),
+        UnitTypeId.QUEEN: ("sharpy.managers.combat2.zerg.micro_queens", "MicroQueens"),
+        UnitTypeId.RAVAGER: ("sharpy.managers.combat2.zerg.micro_ravagers", "MicroRavagers"),
+        UnitTypeId.LURKERMP: ("sharpy.managers.combat2.zerg.micro_lurkers", "MicroLurkers"),
+        UnitTypeId.INFESTOR: ("sharpy.managers.combat2.zerg.micro_infestors", "MicroInfestors"),
+        UnitTypeId.SWARMHOSTMP: ("sharpy.managers.combat2.zerg.micro_swarmhosts", "MicroSwarmHosts"),
+        UnitTypeId.LOCUSTMP: ("sharpy.managers.combat2", "NoMicro"),
+        UnitTypeId.LOCUSTMPFLYING: ("sharpy.managers.combat2", "NoMicro"),
+        UnitTypeId.VIPER: ("sharpy.managers.combat2.zerg.micro_vipers", "MicroVipers"),
+    },
+    Race.Terran: {
+        UnitTypeId.SCV: ("sharpy.managers.combat2", "MicroWorkers"),
+        UnitTypeId.HELLIONTANK: ("sharpy.managers.combat2", "NoMicro"),
+        UnitTypeId.SIEGETANK: ("sharpy.managers.combat2.terran.micro_tanks", "MicroTanks"),
+        UnitTypeId.VIKINGFIGHTER: ("sharpy.managers.combat2.terran.micro_vikings", "MicroVikings"),
+        UnitTypeId.MARINE: ("sharpy.managers.combat2.terran.micro_bio", "MicroBio"),
+        UnitTypeId.MARAUDER: ("sharpy.managers.combat2.terran.micro_bio", "MicroBio"),
+        UnitTypeId.BATTLECRUISER: ("sharpy.managers.combat2.terran.micro_battlecruisers", "MicroBattleCruisers"),
+        UnitTypeId.RAVEN: ("sharpy.managers.combat2.terran.micro_ravens", "MicroRavens"),
+        UnitTypeId.MEDIVAC: ("sharpy.managers.combat2.terran.micro_medivacs", "MicroMedivacs"),
+    },
+}
+
+
 class MicroRules(Component):
     handle_groups_func: Callable[["GroupCombatManager", Point2, MoveType], None]
     init_group_func: Callable[[MicroStep, CombatUnits, Units, List[CombatUnits], MoveType], None]
@@ -34,6 +83,7 @@ class MicroRules(Component):
         super().__init__()
         self.regroup = True
         self.unit_micros: Dict[UnitTypeId, MicroStep] = dict()
+        self.default_micros: Dict[Race, Dict[UnitTypeId, Tuple[str, str]]] = dict()
         self.regroup_percentage = 0.8
         # How much distance must be between units to consider them to be in different groups, set to 0 for no grouping
         self.own_group_distance = 7
@@ -43,10 +93,17 @@ class MicroRules(Component):
     async def start(self, knowledge: "Knowledge"):
         await super().start(knowledge)
 
+        for type_id, (module, name) in self.default_micros.get(knowledge.my_race, {}).items():
+            if type_id not in self.unit_micros:
+                # Race specific micro is imported here to keep it out of the startup time
+                self.unit_micros[type_id] = getattr(importlib.import_module(module), name)()
+
         await self.generic_micro.start(knowledge)
 
-        for micro in self.unit_micros.values():
+        for type_id, micro in self.unit_micros.items():
             await micro.start(knowledge)
+            if micro.abilities:
+                self.cd_manager.register(type_id, micro.abilities)
 
     def load_default_methods(self):
         self.handle_groups_func = DefaultMicroMethods.handle_groups
@@ -62,53 +119,9 @@ class MicroRules(Component):
         self.melee_focus_fire_func = DefaultMicroMethods.melee_focus_fire
 
     def load_default_micro(self):
-        # Micro controllers / handlers
-        self.unit_micros[UnitTypeId.DRONE] = MicroWorkers()
-        self.unit_micros[UnitTypeId.PROBE] = MicroWorkers()
-        self.unit_micros[UnitTypeId.SCV] = MicroWorkers()
-
-        # Protoss
-        self.unit_micros[UnitTypeId.ARCHON] = NoMicro()
-        self.unit_micros[UnitTypeId.ADEPT] = MicroAdepts()
-        self.unit_micros[UnitTypeId.IMMORTAL] = MicroImmortals()
-        self.unit_micros[UnitTypeId.CARRIER] = MicroCarriers()
-        self.unit_micros[UnitTypeId.COLOSSUS] = MicroColossi()
-        self.unit_micros[UnitTypeId.DARKTEMPLAR] = MicroZerglings()
-        self.unit_micros[UnitTypeId.DISRUPTOR] = MicroDisruptor()
-        self.unit_micros[UnitTypeId.DISRUPTORPHASED] = MicroPurificationNova()
-        self.unit_micros[UnitTypeId.HIGHTEMPLAR] = MicroHighTemplars()
-        self.unit_micros[UnitTypeId.OBSERVER] = MicroObservers()
-        self.unit_micros[UnitTypeId.ORACLE] = MicroOracles()
-        self.unit_micros[UnitTypeId.PHOENIX] = MicroPhoenixes()
-        self.unit_micros[UnitTypeId.SENTRY] = MicroSentries()
-        self.unit_micros[UnitTypeId.STALKER] = MicroStalkers()
-        self.unit_micros[UnitTypeId.WARPPRISM] = MicroWarpPrism()
-        self.unit_micros[UnitTypeId.VOIDRAY] = MicroVoidrays()
-        self.unit_micros[UnitTypeId.ZEALOT] = MicroZealots()
-        self.unit_micros[UnitTypeId.MOTHERSHIP] = MicroMotherShip()
-
-        # Zerg
-        self.unit_micros[UnitTypeId.ZERGLING] = MicroZerglings()
-        self.unit_micros[UnitTypeId.ULTRALISK] = NoMicro()
-        self.unit_micros[UnitTypeId.OVERSEER] = MicroOverseers()
-        self.unit_micros[UnitTypeId.QUEEN] = MicroQueens()
-        self.unit_micros[UnitTypeId.RAVAGER] = MicroRavagers()
-
-        self.unit_micros[UnitTypeId.LURKERMP] = MicroLurkers()
-        self.unit_micros[UnitTypeId.INFESTOR] = MicroInfestors()
-        self.unit_micros[UnitTypeId.SWARMHOSTMP] = MicroSwarmHosts()
-        self.unit_micros[UnitTypeId.LOCUSTMP] = NoMicro()
-        self.unit_micros[UnitTypeId.LOCUSTMPFLYING] = NoMicro()
-        self.unit_micros[UnitTypeId.VIPER] = MicroVipers()
-
-        # Terran
-        self.unit_micros[UnitTypeId.HELLIONTANK] = NoMicro()
-        self.unit_micros[UnitTypeId.SIEGETANK] = MicroTanks()
-        self.unit_micros[UnitTypeId.VIKINGFIGHTER] = MicroVikings()
-        self.unit_micros[UnitTypeId.MARINE] = MicroBio()
-        self.unit_micros[UnitTypeId.MARAUDER] = MicroBio()
-        self.unit_micros[UnitTypeId.BATTLECRUISER] = MicroBattleCruisers()
-        self.unit_micros[UnitTypeId.RAVEN] = MicroRavens()
-        self.unit_micros[UnitTypeId.MEDIVAC] = MicroMedivacs()
-
+        """
+        Sets default micro for all unit types. Micro for a unit type is created on start, only when the type
+        is of the race being played and no micro has been set for it in unit_micros.
+        """
+        self.default_micros = DEFAULT_MICROS
         self.generic_micro = GenericMicro()
@@ -0,0 +1,61 @@
+import importlib
+from types import SimpleNamespace
+
+import pytest
+
+from sc2 import Race, UnitTypeId
+from sharpy.managers.combat2 import MicroStep, NoMicro
+from .micro_rules import MicroRules, DEFAULT_MICROS
+
+
+def mock_knowledge(race: Race):
+    return SimpleNamespace(
+        my_race=race,
+        get_boolean_setting=lambda key: False,
+        ai=SimpleNamespace(_client=None),
+        unit_cache=None,
+        unit_values=None,
+        pathing_manager=None,
+        combat_manager=None,
+        roles=None,
+        zone_manager=None,
+        cooldown_manager=SimpleNamespace(register=lambda type_id, abilities: None),
+    )
+
+
+class TestMicroRules:
+    def test_default_micro_is_not_created_on_load(self):
+        rules = MicroRules()
+        rules.load_default_micro()
+
+        assert not rules.unit_micros
+
+    def test_default_micros_are_micro_steps(self):
+        for micros in DEFAULT_MICROS.values():
+            for module, name in micros.values():
+                assert issubclass(getattr(importlib.import_module(module), name), MicroStep)
+
+    @pytest.mark.asyncio
+    async def test_start_creates_default_micro_for_own_race_only(self):
+        rules = MicroRules()
+        rules.default_micros = {
+            Race.Terran: {UnitTypeId.MARINE: ("sharpy.managers.combat2", "NoMicro")},
+            Race.Zerg: {UnitTypeId.ZERGLING: ("sharpy.managers.combat2", "NoMicro")},
+        }
+
+        await rules.start(mock_knowledge(Race.Terran))
+
+        assert list(rules.unit_micros) == [UnitTypeId.MARINE]
+        assert isinstance(rules.unit_micros[UnitTypeId.MARINE], NoMicro)
+
+    @pytest.mark.asyncio
+    async def test_micro_set_before_start_replaces_default_micro(self):
+        rules = MicroRules()
+        rules.load_default_micro()
+        rules.default_micros = {Race.Terran: {UnitTypeId.MARINE: ("sharpy.managers.combat2", "MicroWorkers")}}
+        micro = NoMicro()
+        rules.unit_micros[UnitTypeId.MARINE] = micro
+
+        await rules.start(mock_knowledge(Race.Terran))
+
+        assert rules.unit_micros[UnitTypeId.MARINE] is micro
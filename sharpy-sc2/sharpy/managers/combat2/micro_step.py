@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Any, Callable, Union, TYPE_CHECKING
+from typing import List, Dict, Optional, Any, Callable, Set, Union, TYPE_CHECKING
+
+import numpy as np
 
 import sc2
+from sharpy import sc2math
 from sharpy.general.extended_power import ExtendedPower
 from sharpy.managers.combat2.move_type import MoveType
 from sc2.ids.buff_id import BuffId
@@ -34,6 +37,8 @@ class MicroStep(ABC, Component):
     delay_to_shoot: float
     enemies_near_by: Units
     closest_group: CombatUnits
+    # Abilities checked with cd_manager.is_ready, registered for the unit types that use this micro
+    abilities: Set[AbilityId] = set()
 
     def __init__(self):
         self.enemy_groups: List[CombatUnits] = []
@@ -51,6 +56,11 @@ class MicroStep(ABC, Component):
         self.enemy_attack_range = 0
 
         self.focus_fired: Dict[int, float] = dict()
+        # Positions of the units in the group with shape (n, 2) and the index of each unit tag in them
+        self.positions: np.ndarray = np.zeros((0, 2))
+        self.unit_indices: Dict[int, int] = dict()
+        # Backstep positions for all units in the group by distance
+        self.backsteps: Dict[float, np.ndarray] = dict()
 
     async def start(self, knowledge: "Knowledge"):
         await super().start(knowledge)
@@ -74,6 +84,9 @@ class MicroStep(ABC, Component):
         self.our_power = group.power
         self.closest_units.clear()
         self.engaged_power.clear()
+        self.positions = sc2math.to_array(units)
+        self.unit_indices = {unit.tag: index for index, unit in enumerate(units)}
+        self.backsteps.clear()
 
         self.rules.init_group_func(self, group, units, enemy_groups, move_type)
 
@@ -94,6 +107,21 @@ class MicroStep(ABC, Component):
     ) -> Action:
         return self.rules.melee_focus_fire_func(self, unit, current_command, prio)
 
+    def backstep(self, unit: Unit, distance: float) -> Point2:
+        """
+        Returns position distance away from closest enemy group center, same as
+        unit.position.towards(self.closest_group.center, -distance) but calculated for the whole group in one go.
+        """
+        backsteps = self.backsteps.get(distance)
+        if backsteps is None:
+            backsteps = sc2math.towards_all(self.positions, self.closest_group.center, -distance)
+            self.backsteps[distance] = backsteps
+
+        index = self.unit_indices.get(unit.tag)
+        if index is None:
+            return unit.position.towards(self.closest_group.center, -distance)
+        return Point2(backsteps[index].tolist())
+
     def last_targeted(self, unit: Unit) -> Optional[int]:
         if unit.orders:
             # action: UnitCommand
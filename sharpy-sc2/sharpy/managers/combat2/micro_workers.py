@@ -20,7 +20,7 @@ class MicroWorkers(MicroStep):
 
     def unit_solve_combat(self, unit: Unit, current_command: Action) -> Action:
         if self.closest_group and self.engaged_power.melee_percentage > 0.9:
-            backstep: Point2 = unit.position.towards(self.closest_group.center, -3)
+            backstep: Point2 = self.backstep(unit, 3)
             if (unit.health + unit.shield <= 5 and not self.ready_to_shoot(unit)) or (
                 unit.shield_health_percentage < 0.5 and unit.weapon_cooldown > 9
             ):
@@ -1,15 +1,23 @@
-from .micro_stalkers import MicroStalkers
-from .micro_zealots import MicroZealots
-from .micro_carriers import MicroCarriers
-from .micro_colossi import MicroColossi
-from .micro_adepts import MicroAdepts
-from .micro_voidrays import MicroVoidrays
-from .micro_disruptor import MicroDisruptor, MicroPurificationNova
-from .micro_hightemplars import MicroHighTemplars
-from .micro_observers import MicroObservers
-from .micro_oracles import MicroOracles
-from .micro_phoenixes import MicroPhoenixes
-from .micro_sentries import MicroSentries
-from .micro_warp_prism import MicroWarpPrism
-from .micro_immortal import MicroImmortals
-from .micro_mothership import MicroMotherShip
+from sharpy.general.lazy_exports import lazy_exports
+
+# Micro modules are imported on first use, so that only micro for the units in use is imported
+_exports = {
+    "MicroStalkers": ".micro_stalkers",
+    "MicroZealots": ".micro_zealots",
+    "MicroCarriers": ".micro_carriers",
+    "MicroColossi": ".micro_colossi",
+    "MicroAdepts": ".micro_adepts",
+    "MicroVoidrays": ".micro_voidrays",
+    "MicroDisruptor": ".micro_disruptor",
+    "MicroPurificationNova": ".micro_disruptor",
+    "MicroHighTemplars": ".micro_hightemplars",
+    "MicroObservers": ".micro_observers",
+    "MicroOracles": ".micro_oracles",
+    "MicroPhoenixes": ".micro_phoenixes",
+    "MicroSentries": ".micro_sentries",
+    "MicroWarpPrism": ".micro_warp_prism",
+    "MicroImmortals": ".micro_immortal",
+    "MicroMotherShip": ".micro_mothership",
+}
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
@@ -68,6 +68,8 @@ high_priority: Dict[UnitTypeId, int] = {
 
 
 class MicroAdepts(GenericMicro):
+    abilities = {AbilityId.ADEPTPHASESHIFT_ADEPTPHASESHIFT}
+
     def __init__(self, micro_shades: bool = True):
         super().__init__()
         self.prio_dict = high_priority
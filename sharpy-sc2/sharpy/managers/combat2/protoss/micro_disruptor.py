@@ -10,6 +10,8 @@ NOVA_DURATION = 2.1
 
 
 class MicroDisruptor(MicroStep):
+    abilities = {AbilityId.EFFECT_PURIFICATIONNOVA}
+
     def __init__(self):
         super().__init__()
         self.last_used_any = 0
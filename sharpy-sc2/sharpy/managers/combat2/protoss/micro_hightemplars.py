@@ -5,6 +5,8 @@ from sc2.unit import Unit
 
 
 class MicroHighTemplars(GenericMicro):
+    abilities = {AbilityId.FEEDBACK_FEEDBACK, AbilityId.PSISTORM_PSISTORM}
+
     def unit_solve_combat(self, unit: Unit, current_command: Action) -> Action:
         # before death
         if unit.shield_health_percentage <= 0.3:
@@ -4,6 +4,8 @@ from sc2.unit import Unit
 
 
 class MicroMotherShip(GenericMicro):
+    abilities = {AbilityId.EFFECT_TIMEWARP}
+
     def unit_solve_combat(self, unit: Unit, current_command: Action) -> Action:
         enemy = self.knowledge.unit_cache.enemy_in_range(unit.position3d, 12)
         if unit.shield_health_percentage <= 0.3 and enemy:
@@ -80,6 +80,8 @@ high_priority: Dict[UnitTypeId, int] = {
 
 
 class MicroStalkers(GenericMicro):
+    abilities = {AbilityId.EFFECT_BLINK_STALKER}
+
     def __init__(self):
         super().__init__()
         self.prio_dict = high_priority
@@ -118,7 +120,7 @@ class MicroStalkers(GenericMicro):
 
                 target_pos = unit.position
                 if self.closest_group:
-                    target_pos = target_pos.towards(self.closest_group.center, -5)
+                    target_pos = self.backstep(unit, 5)
 
                 target = self.pather.find_weak_influence_ground_blink(target_pos, 6)
                 if target.distance_to(unit) > 3:
@@ -12,6 +12,8 @@ ticks_to_shoot = 6  # cd_ticks * 0.6
 
 
 class MicroVoidrays(MicroStep):
+    abilities = {AbilityId.EFFECT_VOIDRAYPRISMATICALIGNMENT}
+
     def should_retreat(self, unit: Unit) -> bool:
         if unit.shield_max + unit.health_max > 0:
             health_percentage = (unit.shield + unit.health) / (unit.shield_max + unit.health_max)
@@ -1,6 +1,13 @@
-from .micro_vikings import MicroVikings
-from .micro_bio import MicroBio
-from .micro_tanks import MicroTanks
-from .micro_battlecruisers import MicroBattleCruisers
-from .micro_ravens import MicroRavens
-from .micro_medivacs import MicroMedivacs
+from sharpy.general.lazy_exports import lazy_exports
+
+# Micro modules are imported on first use, so that only micro for the units in use is imported
+_exports = {
+    "MicroVikings": ".micro_vikings",
+    "MicroBio": ".micro_bio",
+    "MicroTanks": ".micro_tanks",
+    "MicroBattleCruisers": ".micro_battlecruisers",
+    "MicroRavens": ".micro_ravens",
+    "MicroMedivacs": ".micro_medivacs",
+}
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
@@ -7,6 +7,8 @@ from sc2.unit import Unit
 
 
 class MicroBattleCruisers(GenericMicro):
+    abilities = {AbilityId.EFFECT_TACTICALJUMP, AbilityId.YAMATO_YAMATOGUN}
+
     def group_solve_combat(self, units: Units, current_command: Action) -> Action:
         return current_command
 
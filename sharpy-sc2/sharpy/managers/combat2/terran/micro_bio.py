@@ -6,6 +6,8 @@ from sc2.units import Units
 
 
 class MicroBio(GenericMicro):
+    abilities = {AbilityId.EFFECT_STIM_MARINE, AbilityId.EFFECT_STIM_MARAUDER}
+
     def __init__(self):
         super().__init__()
         self.stim_required = 0
@@ -8,6 +8,8 @@ from sc2.unit import Unit
 
 
 class MicroRavens(MicroStep):
+    abilities = {AbilityId.EFFECT_INTERFERENCEMATRIX, AbilityId.EFFECT_ANTIARMORMISSILE}
+
     def __init__(self):
         super().__init__()
         self.anti_armor_available = 0
@@ -1,8 +1,15 @@
-from .micro_zerglings import MicroZerglings
-from .micro_overseers import MicroOverseers
-from .micro_queens import MicroQueens
-from .micro_ravagers import MicroRavagers
-from .micro_infestors import MicroInfestors
-from .micro_lurkers import MicroLurkers
-from .micro_vipers import MicroVipers
-from .micro_swarmhosts import MicroSwarmHosts
+from sharpy.general.lazy_exports import lazy_exports
+
+# Micro modules are imported on first use, so that only micro for the units in use is imported
+_exports = {
+    "MicroZerglings": ".micro_zerglings",
+    "MicroOverseers": ".micro_overseers",
+    "MicroQueens": ".micro_queens",
+    "MicroRavagers": ".micro_ravagers",
+    "MicroInfestors": ".micro_infestors",
+    "MicroLurkers": ".micro_lurkers",
+    "MicroVipers": ".micro_vipers",
+    "MicroSwarmHosts": ".micro_swarmhosts",
+}
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
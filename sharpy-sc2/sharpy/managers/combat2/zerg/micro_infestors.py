@@ -8,6 +8,8 @@ from sc2.unit import Unit
 
 
 class MicroInfestors(MicroStep):
+    abilities = {AbilityId.NEURALPARASITE_NEURALPARASITE, AbilityId.FUNGALGROWTH_FUNGALGROWTH}
+
     def __init__(self):
         super().__init__()
         self.aoe_available = 0
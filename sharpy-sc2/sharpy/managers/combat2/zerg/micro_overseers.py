@@ -5,6 +5,8 @@ from sc2.units import Units
 
 
 class MicroOverseers(MicroStep):
+    abilities = {AbilityId.SPAWNCHANGELING_SPAWNCHANGELING}
+
     def group_solve_combat(self, units: Units, current_command: Action) -> Action:
         return current_command
 
@@ -5,6 +5,8 @@ from sc2.unit import Unit
 
 
 class MicroQueens(GenericMicro):
+    abilities = {AbilityId.TRANSFUSION_TRANSFUSION}
+
     def __init__(self):
         super().__init__()
 
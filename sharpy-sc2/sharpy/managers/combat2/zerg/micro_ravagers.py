@@ -5,6 +5,8 @@ from sc2.unit import Unit
 
 
 class MicroRavagers(GenericMicro):
+    abilities = {AbilityId.EFFECT_CORROSIVEBILE}
+
     def unit_solve_combat(self, unit: Unit, current_command: Action) -> Action:
         shuffler = unit.tag % 10
 
@@ -12,6 +12,8 @@ HOST_RANGE = 15
 class MicroSwarmHosts(MicroStep):
     """Micro Swarm Hosts."""
 
+    abilities = {AbilityId.EFFECT_SPAWNLOCUSTS}
+
     def __init__(self) -> None:
         """Run setup."""
         super().__init__()
@@ -8,6 +8,8 @@ from sc2.unit import Unit
 
 
 class MicroVipers(MicroStep):
+    abilities = {AbilityId.EFFECT_ABDUCT, AbilityId.PARASITICBOMB_PARASITICBOMB, AbilityId.BLINDINGCLOUD_BLINDINGCLOUD}
+
     def __init__(self):
         super().__init__()
         self.blind_available = 0
@@ -1,14 +1,27 @@
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from sharpy.managers.manager_base import ManagerBase
 from sc2 import UnitTypeId, AbilityId
 from sc2.unit import Unit
 from sc2.units import Units
 
+# How many seconds available abilities are cached for, abilities that are not listed are queried every frame.
+# Abilities used by our own actions are known to be unavailable without a query.
+ABILITY_REFRESH: Dict[AbilityId, float] = {
+    AbilityId.EFFECT_CHRONOBOOSTENERGYCOST: 1,
+    AbilityId.EFFECT_INJECTLARVA: 1,
+    AbilityId.BUILD_CREEPTUMOR_QUEEN: 1,
+    AbilityId.BUILD_CREEPTUMOR_TUMOR: 1,
+}
+
 
 class CooldownManager(ManagerBase):
     """
     Global cooldown manager that is shared between all units.
+
+    Available abilities are only queried for unit types that have registered abilities. Types are registered with
+    `register` or when `is_ready` is first asked about a unit of the type, in which case the answer is available
+    from the next frame on.
     TODO: Rename to ability manager?
     """
 
@@ -19,19 +32,86 @@ class CooldownManager(ManagerBase):
         self.adept_to_shade: Dict[int, int] = dict()
         self.shade_to_adept: Dict[int, int] = dict()
         self._shade_tags_handled: Set[int] = set()
+        # Refresh interval in seconds for each registered unit type
+        self.refresh: Dict[UnitTypeId, float] = dict()
+        self.queried_units = 0
+        # Time, unit type and energy of each unit when its available abilities were last queried
+        self._queried: Dict[int, float] = dict()
+        self._queried_type: Dict[int, UnitTypeId] = dict()
+        self._queried_energy: Dict[int, float] = dict()
+        # Time when our own actions last used each ability
+        self._issued: Dict[int, Dict[AbilityId, float]] = dict()
+        self._learned: Set[Tuple[UnitTypeId, AbilityId]] = set()
+
+    def register(
+        self,
+        type_ids: Union[UnitTypeId, Iterable[UnitTypeId]],
+        abilities: Union[AbilityId, Iterable[AbilityId]],
+        refresh: Optional[float] = None,
+    ):
+        """
+        Registers interest in abilities of unit types, so that their available abilities are queried.
+
+        @param type_ids: unit types to query
+        @param abilities: abilities that are checked with `is_ready`, used for the default refresh interval
+        @param refresh: how many seconds the available abilities are cached for, defaults to `ABILITY_REFRESH`
+        """
+        if isinstance(type_ids, UnitTypeId):
+            type_ids = [type_ids]
+        if isinstance(abilities, AbilityId):
+            abilities = [abilities]
+        if refresh is None:
+            refresh = min((ABILITY_REFRESH.get(ability, 0) for ability in abilities), default=0)
+
+        for type_id in type_ids:
+            self.refresh[type_id] = min(self.refresh.get(type_id, refresh), refresh)
 
     async def update(self):
-        self.available_dict.clear()
+        self.queried_units = 0
         if len(self.knowledge.all_own) < 1:
-            return
-        try:
-            result: List[List[AbilityId]] = await self.ai.get_available_abilities(self.knowledge.all_own)
-        except Exception as e:
-            self.print(f"Get available abilities failed: {e}")
+            self.available_dict.clear()
             return
 
-        for i in range(0, len(self.knowledge.all_own)):
-            self.available_dict[self.knowledge.all_own[i].tag] = result[i]
+        units = Units([], self.ai)
+        alive: Set[int] = set()
+
+        for unit in self.knowledge.all_own:  # type: Unit
+            refresh = self.refresh.get(unit.type_id)
+            if refresh is None:
+                continue
+
+            tag = unit.tag
+            alive.add(tag)
+            if (
+                self.time - self._queried.get(tag, -1000) >= refresh
+                or self._queried_type.get(tag) != unit.type_id
+                or unit.energy < self._queried_energy.get(tag, 0)
+            ):
+                units.append(unit)
+
+        for tag in [tag for tag in self.available_dict if tag not in alive]:
+            self.available_dict.pop(tag)
+            self._queried.pop(tag, None)
+            self._queried_type.pop(tag, None)
+            self._queried_energy.pop(tag, None)
+            self._issued.pop(tag, None)
+
+        if units:
+            try:
+                result: List[List[AbilityId]] = await self.ai.get_available_abilities(units)
+            except Exception as e:
+                self.print(f"Get available abilities failed: {e}")
+                for unit in units:
+                    self.available_dict.pop(unit.tag, None)
+                return
+
+            self.queried_units = len(units)
+            for i in range(0, len(units)):
+                unit = units[i]
+                self.available_dict[unit.tag] = result[i]
+                self._queried[unit.tag] = self.time
+                self._queried_type[unit.tag] = unit.type_id
+                self._queried_energy[unit.tag] = unit.energy
 
         shades = self.cache.own(UnitTypeId.ADEPTPHASESHIFT)
 
@@ -68,7 +148,15 @@ class CooldownManager(ManagerBase):
                     self.shade_to_adept.pop(shade_tag)
 
     async def post_update(self):
-        pass
+        # Remember abilities used by this frame's actions of the queried units
+        for action in self.ai.actions:
+            tag = action.unit.tag
+            if tag in self._queried:
+                issued = self._issued.get(tag)
+                if issued is None:
+                    issued = {}
+                    self._issued[tag] = issued
+                issued[action.ability] = self.time
 
     @property
     def time(self) -> float:
@@ -76,7 +164,17 @@ class CooldownManager(ManagerBase):
 
     def is_ready(self, unit_tag: int, ability: AbilityId, cooldown: Optional[float] = None) -> bool:
         if cooldown is None:
-            return ability in self.available_dict.get(unit_tag, [])
+            available = self.available_dict.get(unit_tag)
+            if available is None:
+                self._learn(unit_tag, ability)
+                return False
+            if ability not in available:
+                return False
+            # Ability has been used since the query
+            queried = self._queried.get(unit_tag, -1000)
+            if self._issued.get(unit_tag, {}).get(ability, -1000) >= queried:
+                return False
+            return self.used_dict.get(unit_tag, {}).get(ability, -1000) < queried
 
         ability_dict = self.used_dict.get(unit_tag, None)
         if ability_dict is None:
@@ -86,6 +184,13 @@ class CooldownManager(ManagerBase):
 
         return last_used + cooldown < self.time
 
+    def _learn(self, unit_tag: int, ability: AbilityId):
+        """Registers the type of the unit so that its abilities are queried from next frame on."""
+        unit = self.cache.by_tag(unit_tag)
+        if unit is not None and (unit.type_id, ability) not in self._learned:
+            self._learned.add((unit.type_id, ability))
+            self.register(unit.type_id, ability)
+
     def used_ability(self, unit_tag: int, ability: AbilityId) -> None:
         ability_dict = self.used_dict.get(unit_tag, None)
 
@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+
+import pytest
+
+from sc2 import AbilityId, UnitTypeId
+from .cooldown_manager import CooldownManager
+
+
+class MockAI:
+    def __init__(self):
+        self.time = 0
+        self.actions = []
+        self.requests = []
+        self.available = {}
+
+    async def get_available_abilities(self, units):
+        self.requests.append([unit.tag for unit in units])
+        return [list(self.available.get(unit.tag, [])) for unit in units]
+
+
+def mock_manager(units) -> CooldownManager:
+    manager = CooldownManager()
+    manager.ai = MockAI()
+    manager.knowledge = SimpleNamespace(all_own=units, ai=manager.ai)
+    manager.cache = SimpleNamespace(
+        by_tag=lambda tag: next((unit for unit in units if unit.tag == tag), None), own=lambda type_id: []
+    )
+    return manager
+
+
+def mock_unit(tag: int, type_id: UnitTypeId, energy: float = 0):
+    return SimpleNamespace(tag=tag, type_id=type_id, energy=energy)
+
+
+class TestCooldownManager:
+    @pytest.mark.asyncio
+    async def test_only_registered_types_are_queried(self):
+        stalker = mock_unit(1, UnitTypeId.STALKER)
+        units = [stalker, mock_unit(2, UnitTypeId.PROBE), mock_unit(3, UnitTypeId.NEXUS)]
+        manager = mock_manager(units)
+        manager.ai.available[1] = [AbilityId.EFFECT_BLINK_STALKER]
+
+        await manager.update()
+        assert not manager.ai.requests
+
+        manager.register(UnitTypeId.STALKER, AbilityId.EFFECT_BLINK_STALKER)
+        await manager.update()
+        assert manager.ai.requests == [[1]]
+        assert manager.is_ready(1, AbilityId.EFFECT_BLINK_STALKER)
+
+        # Blink has no refresh interval, so stalkers are queried every frame
+        await manager.update()
+        assert manager.ai.requests == [[1], [1]]
+
+    @pytest.mark.asyncio
+    async def test_is_ready_registers_unit_type_for_next_frame(self):
+        units = [mock_unit(3, UnitTypeId.NEXUS, 50)]
+        manager = mock_manager(units)
+        manager.ai.available[3] = [AbilityId.EFFECT_CHRONOBOOSTENERGYCOST]
+
+        assert not manager.is_ready(3, AbilityId.EFFECT_CHRONOBOOSTENERGYCOST)
+        await manager.update()
+        assert manager.is_ready(3, AbilityId.EFFECT_CHRONOBOOSTENERGYCOST)
+
+        # Chrono boost is cached for a second
+        manager.ai.time = 0.5
+        await manager.update()
+        assert manager.ai.requests == [[3]]
+        manager.ai.time = 1
+        await manager.update()
+        assert manager.ai.requests == [[3], [3]]
+
+    @pytest.mark.asyncio
+    async def test_used_abilities_are_not_ready_until_next_query(self):
+        nexus = mock_unit(3, UnitTypeId.NEXUS, 50)
+        manager = mock_manager([nexus])
+        manager.register(UnitTypeId.NEXUS, AbilityId.EFFECT_CHRONOBOOSTENERGYCOST)
+        manager.ai.available[3] = [AbilityId.EFFECT_CHRONOBOOSTENERGYCOST]
+        await manager.update()
+
+        manager.ai.actions.append(SimpleNamespace(unit=nexus, ability=AbilityId.EFFECT_CHRONOBOOSTENERGYCOST))
+        await manager.post_update()
+        manager.ai.actions.clear()
+        assert not manager.is_ready(3, AbilityId.EFFECT_CHRONOBOOSTENERGYCOST)
+
+        # Energy was spent, so the nexus is queried again before the refresh interval
+        nexus.energy = 0
+        manager.ai.time = 0.1
+        manager.ai.available[3] = []
+        await manager.update()
+        assert manager.ai.requests == [[3], [3]]
+        assert not manager.is_ready(3, AbilityId.EFFECT_CHRONOBOOSTENERGYCOST)
+
+        manager.ai.time = 2
+        manager.ai.available[3] = [AbilityId.EFFECT_CHRONOBOOSTENERGYCOST]
+        await manager.update()
+        assert manager.is_ready(3, AbilityId.EFFECT_CHRONOBOOSTENERGYCOST)
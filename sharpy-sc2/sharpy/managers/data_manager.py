@@ -3,7 +3,6 @@ import os
 from typing import Optional
 from uuid import uuid4
 
-import jsonpickle
 from datetime import datetime
 from pathlib import Path
 
@@ -66,6 +65,8 @@ class DataManager(ManagerBase):
                 )
 
     def read_data(self):
+        import jsonpickle
+
         with open(self.file_name, "r") as handle:
             text = handle.read()
             # Compatibility with older versions to prevent crashes
@@ -146,6 +147,8 @@ class DataManager(ManagerBase):
 
         self.data.results.append(self.result)
 
+        import jsonpickle
+
         frozen = jsonpickle.encode(self.data)
         try:
             with open(self.file_name, "w") as handle:
@@ -1,9 +1,13 @@
-from typing import Dict, Set, List, KeysView
+from typing import Dict, Set, List, KeysView, Sequence, Tuple, Union
 
+import numpy as np
+
+from sharpy import sc2math
 from sharpy.events import UnitDestroyedEvent
 from sharpy.managers.manager_base import ManagerBase
 from sharpy.unit_count import UnitCount
 from sc2 import UnitTypeId, Result
+from sc2.ids.buff_id import BuffId
 from sc2.position import Point2
 from sc2.unit import Unit
 
@@ -32,6 +36,11 @@ class EnemyUnitsManager(ManagerBase):
         # This is the count we have seen that are morphed from this base type
         self._morphed_type: Dict[UnitTypeId, int] = {}
         self._enemy_cloak_trigger = False
+        # Danger field of ready known enemy units, built on first danger query of each frame
+        self._danger_frame = -1
+        self._danger_positions: np.ndarray = np.zeros((0, 2))
+        # Columns are radius, ground range, air range, ground dps, air dps and speed
+        self._danger_stats: np.ndarray = np.zeros((0, 6))
 
     async def start(self, knowledge: "Knowledge"):
         await super().start(knowledge)
@@ -147,28 +156,78 @@ class EnemyUnitsManager(ManagerBase):
             self._enemy_cloak_trigger = True
 
     def danger_value(self, danger_for_unit: Unit, position: Point2) -> float:
-        danger = 0
-        for unit in self.knowledge.known_enemy_units:
-            if not unit.is_ready:
-                continue
-            real_range = self.unit_values.real_range(unit, danger_for_unit)
+        return float(self.danger_values([danger_for_unit], [position])[0, 0])
 
-            if real_range < 1:
-                continue
-            if danger_for_unit.is_flying:
-                local_danger = unit.air_dps
-            else:
-                local_danger = unit.ground_dps
-
-            distance = unit.distance_to(position)
-            if distance < real_range:
-                danger += local_danger + (1 - distance / real_range) * local_danger
-            elif self.unit_values.real_speed(danger_for_unit) > self.unit_values.real_speed(unit):
-                danger += max(0, (1.5 - distance / real_range) * local_danger)
-            else:
-                danger += max(0, (2 - distance / real_range) * local_danger)
-
-        return danger
+    def danger_values(
+        self, danger_for_units: Sequence[Unit], positions: Union[np.ndarray, Sequence[Point2]]
+    ) -> np.ndarray:
+        """
+        Scores danger of all known enemy units for each of the units at each of the positions.
+        Returns numpy array with shape (units, positions), same values as danger_value would return.
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        enemy_positions, stats = self._danger_field()
+        if len(enemy_positions) == 0 or len(danger_for_units) == 0:
+            return np.zeros((len(danger_for_units), len(positions)))
+
+        radius, ground_range, air_range, ground_dps, air_dps, speed = stats.T
+        targets = self._danger_targets(danger_for_units)
+        target_radius, air_target, flying, own_speed = (column[:, np.newaxis] for column in targets.T)
+
+        # Shape (units, enemies)
+        corrected_range = np.where(air_target > 0, air_range, ground_range)
+        real_range = np.where(corrected_range > 0, radius + corrected_range + target_radius, corrected_range)
+        in_range = real_range >= 1
+        local_danger = np.where(flying > 0, air_dps, ground_dps)
+        reach = np.where(own_speed > speed, 1.5, 2)
+
+        # Shape (units, positions, enemies), danger is local danger multiplied by the factor
+        distances = sc2math.distance_matrix(positions, enemy_positions)[np.newaxis]
+        real_range = np.where(in_range, real_range, 1)[:, np.newaxis]
+        factor = np.where(distances < real_range, 2, reach[:, np.newaxis]) - distances / real_range
+        np.maximum(factor, 0, out=factor)
+        local_danger = np.where(in_range, local_danger, 0)
+        return np.einsum("upe,ue->up", factor, local_danger)
+
+    def _danger_field(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._danger_frame != self.ai.state.game_loop:
+            self._danger_frame = self.ai.state.game_loop
+            positions: List[Point2] = []
+            stats: List[Tuple[float, float, float, float, float, float]] = []
+
+            for unit in self.knowledge.known_enemy_units:  # type: Unit
+                if not unit.is_ready:
+                    continue
+                positions.append(unit.position)
+                stats.append(
+                    (
+                        unit.radius,
+                        self.unit_values.ground_range(unit),
+                        self.unit_values.air_range(unit),
+                        unit.ground_dps,
+                        unit.air_dps,
+                        self.unit_values.real_speed(unit),
+                    )
+                )
+
+            self._danger_positions = np.array(positions, dtype=np.float64).reshape(-1, 2)
+            self._danger_stats = np.array(stats, dtype=np.float64).reshape(-1, 6)
+        return self._danger_positions, self._danger_stats
+
+    def _danger_targets(self, danger_for_units: Sequence[Unit]) -> np.ndarray:
+        """ Columns are radius, whether air range is used against the unit, is flying and speed. """
+        return np.array(
+            [
+                (
+                    unit.radius,
+                    unit.is_flying or unit.has_buff(BuffId.GRAVITONBEAM),
+                    unit.is_flying,
+                    self.unit_values.real_speed(unit),
+                )
+                for unit in danger_for_units
+            ],
+            dtype=np.float64,
+        )
 
     def on_unit_destroyed(self, event: UnitDestroyedEvent):
         unit = event.unit
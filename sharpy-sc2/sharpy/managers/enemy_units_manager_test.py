@@ -0,0 +1,111 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from sc2.ids.buff_id import BuffId
+from sc2.position import Point2
+from .enemy_units_manager import EnemyUnitsManager
+from .unit_value import UnitValue
+
+
+class MockUnitValues:
+    real_range = UnitValue.real_range
+
+    def ground_range(self, unit) -> float:
+        return unit.ground_range
+
+    def air_range(self, unit) -> float:
+        return unit.air_range
+
+    def real_speed(self, unit) -> float:
+        return unit.speed
+
+
+class MockUnit(SimpleNamespace):
+    def distance_to(self, position: Point2) -> float:
+        return self.position.distance_to(position)
+
+    def has_buff(self, buff: BuffId) -> bool:
+        return buff in self.buffs
+
+
+def mock_units(count: int, random: np.random.RandomState):
+    return [
+        MockUnit(
+            position=Point2(random.uniform(0, 40, 2).tolist()),
+            radius=random.uniform(0.3, 1),
+            ground_range=random.choice([0, 0.1, 1, 5, 7]),
+            air_range=random.choice([0, 0.1, 6, 9]),
+            ground_dps=random.uniform(0, 20),
+            air_dps=random.uniform(0, 20),
+            speed=random.choice([2.25, 3.15, 4.13]),
+            is_ready=random.rand() < 0.9,
+            is_flying=random.rand() < 0.3,
+            buffs={BuffId.GRAVITONBEAM} if random.rand() < 0.1 else set(),
+        )
+        for _ in range(count)
+    ]
+
+
+def mock_manager(enemies) -> EnemyUnitsManager:
+    manager = EnemyUnitsManager()
+    manager.ai = SimpleNamespace(state=SimpleNamespace(game_loop=0))
+    manager.knowledge = SimpleNamespace(known_enemy_units=enemies)
+    manager.unit_values = MockUnitValues()
+    return manager
+
+
+def danger_value_reference(manager: EnemyUnitsManager, danger_for_unit, position: Point2) -> float:
+    """Danger value calculated one enemy unit at a time."""
+    danger = 0
+    for unit in manager.knowledge.known_enemy_units:
+        if not unit.is_ready:
+            continue
+        real_range = manager.unit_values.real_range(unit, danger_for_unit)
+
+        if real_range < 1:
+            continue
+        if danger_for_unit.is_flying:
+            local_danger = unit.air_dps
+        else:
+            local_danger = unit.ground_dps
+
+        distance = unit.distance_to(position)
+        if distance < real_range:
+            danger += local_danger + (1 - distance / real_range) * local_danger
+        elif manager.unit_values.real_speed(danger_for_unit) > manager.unit_values.real_speed(unit):
+            danger += max(0, (1.5 - distance / real_range) * local_danger)
+        else:
+            danger += max(0, (2 - distance / real_range) * local_danger)
+
+    return danger
+
+
+class TestEnemyUnitsManager:
+    def test_danger_values_returns_same_values_as_single_unit_loop(self):
+        random = np.random.RandomState(1)
+        manager = mock_manager(mock_units(100, random))
+        own_units = mock_units(20, random)
+        positions = [Point2(position) for position in random.uniform(0, 40, (30, 2)).tolist()]
+
+        values = manager.danger_values(own_units, positions)
+
+        assert values.shape == (20, 30)
+        for unit, unit_values in zip(own_units, values):
+            for position, value in zip(positions, unit_values):
+                expected = danger_value_reference(manager, unit, position)
+                assert abs(value - expected) < 1e-9
+                assert abs(manager.danger_value(unit, position) - expected) < 1e-9
+
+    def test_danger_field_is_built_once_per_frame(self):
+        random = np.random.RandomState(2)
+        enemies = mock_units(10, random)
+        manager = mock_manager(enemies)
+        unit = mock_units(1, random)[0]
+
+        before = manager.danger_value(unit, unit.position)
+        enemies.clear()
+        assert manager.danger_value(unit, unit.position) == before
+
+        manager.ai.state.game_loop = 1
+        assert manager.danger_value(unit, unit.position) == 0
@@ -2,7 +2,7 @@ from .grid_area import GridArea
 from .grid import Grid
 from .blocker_type import BlockerType
 from .build_area import BuildArea
-from .build_grid import BuildGrid
+from .build_grid import BuildGrid, ReadOnlyGridArea, area_filter, EMPTY_AREAS, FREE_AREAS
 from .cliff import Cliff
 from .zone_area import ZoneArea
 from .rectangle import Rectangle
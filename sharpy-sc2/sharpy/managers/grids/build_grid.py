@@ -1,5 +1,7 @@
 import string
+from typing import Iterable, Optional
 
+import numpy as np
 from s2clientprotocol.debug_pb2 import Color
 from sc2 import UnitTypeId
 
@@ -12,12 +14,65 @@ from sc2.game_info import GameInfo
 
 import sc2
 from sharpy.managers.grids import Grid, GridArea, BlockerType
+from sharpy.managers.grids.rectangle import Rectangle
 from sharpy.managers.grids.zone_area import ZoneArea
 from sc2.position import Point2, Point3
 from sc2.unit import Unit
 
+# Area values are stored in numpy arrays, filters are indexed with value + offset
+_AREA_OFFSET = -min(area.value for area in BuildArea)
+_AREA_COUNT = max(area.value for area in BuildArea) + _AREA_OFFSET + 1
+_BUILD_AREAS = {area.value: area for area in BuildArea}
+_ZONE_AREAS = {zone.value: zone for zone in ZoneArea}
+_CLIFFS = {cliff.value: cliff for cliff in Cliff}
+
+
+def area_filter(areas: Iterable[BuildArea], inverse: bool = False) -> np.ndarray:
+    """
+    Creates a filter for BuildGrid area queries that matches the areas, or all other areas when inverse is True.
+    """
+    result = np.zeros(_AREA_COUNT, dtype=bool)
+    for area in areas:
+        result[area.value + _AREA_OFFSET] = True
+    if inverse:
+        result = ~result
+    return result
+
+
+EMPTY_AREAS = area_filter([BuildArea.Empty])
+FREE_AREAS = area_filter([BuildArea.Empty, BuildArea.BuildingPadding])
+
+
+class ReadOnlyGridArea(GridArea):
+    """
+    Cell of BuildGrid returned by get. Cells are copies of the values in the grid arrays, so they can't be changed.
+    Use copy to get a GridArea that can be changed and stored back with BuildGrid.set.
+    """
+
+    def __init__(self, area: BuildArea, zone: ZoneArea, building_index: int, cliff: Cliff):
+        object.__setattr__(self, "Area", area)
+        object.__setattr__(self, "ZoneIndex", zone)
+        object.__setattr__(self, "BuildingIndex", building_index)
+        object.__setattr__(self, "Cliff", cliff)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"BuildGrid cells are read-only, use copy and BuildGrid.set to change {name}")
+
+    def copy(self) -> GridArea:
+        cell = GridArea(self.Area)
+        cell.ZoneIndex = self.ZoneIndex
+        cell.BuildingIndex = self.BuildingIndex
+        cell.Cliff = self.Cliff
+        return cell
+
 
 class BuildGrid(Grid):
+    """
+    Building placement grid. Cell values are stored in numpy arrays indexed with [x, y], so that rectangle queries
+    and fills can be done for many cells at once.
+    get returns a read-only copy of the cell and set stores a changed cell back.
+    """
+
     def __init__(self, knowledge):
         """
 
@@ -25,6 +80,8 @@ class BuildGrid(Grid):
         """
         ai = knowledge.ai
         self.game_info: GameInfo = ai.game_info
+        # Terrain height indexed with [x, y]
+        self.heights: np.ndarray = self.game_info.terrain_height.data_numpy.T
         super().__init__(self.game_info.placement_grid.width, self.game_info.placement_grid.height)
         # noinspection PyUnresolvedReferences
         self.knowledge = knowledge  # type: Knowledge
@@ -40,136 +97,182 @@ class BuildGrid(Grid):
         self.ramp_color = Point3((139, 0, 0))
         self.vision_blocker_color = Point3((139, 0, 80))
 
+    def _create_data(self):
+        self._data = None
+        shape = (self.width, self.height)
+        self.areas = np.full(shape, BuildArea.NotBuildable.value, dtype=np.int16)
+        self.zones = np.full(shape, ZoneArea.NoZone.value, dtype=np.int8)
+        self.building_indices = np.full(shape, -1, dtype=np.int32)
+        self.cliffs = np.full(shape, Cliff.No.value, dtype=np.int8)
+
+    def get(self, x: int, y: int) -> ReadOnlyGridArea:
+        """Get read-only copy of the cell from position, no checking for performance"""
+        return ReadOnlyGridArea(
+            _BUILD_AREAS[self.areas[x, y]],
+            _ZONE_AREAS[self.zones[x, y]],
+            int(self.building_indices[x, y]),
+            _CLIFFS[self.cliffs[x, y]],
+        )
+
+    def set(self, x: int, y: int, value: GridArea):
+        self.areas[x, y] = value.Area.value
+        self.zones[x, y] = value.ZoneIndex.value
+        self.building_indices[x, y] = value.BuildingIndex
+        self.cliffs[x, y] = value.Cliff.value
+
     def get_default(self):
         return GridArea(BuildArea.NotBuildable)
 
+    def area_mask(self, area_filter: np.ndarray) -> np.ndarray:
+        """Returns boolean array of the cells that match the filter."""
+        return area_filter[self.areas + _AREA_OFFSET]
+
+    def query_rect_in(self, rect: Rectangle, area_filter: np.ndarray) -> bool:
+        """Vectorized query_rect, returns True if areas of all cells in the rectangle match the filter."""
+        return bool(area_filter[self.areas[self.rect_slices(rect)] + _AREA_OFFSET].all())
+
+    def query_area_in(self, position: Point2, fill_type: BlockerType, area_filter: np.ndarray) -> bool:
+        """Vectorized query_area, returns True if areas of all cells in the area match the filter."""
+        return self.query_rect_in(self.get_area(position, fill_type), area_filter)
+
+    def query_rects_in(self, x: int, y: int, width: int, height: int, area_filter: np.ndarray) -> np.ndarray:
+        """
+        Runs query_rect_in for rectangles at every cell of the grid at once.
+        Returns boolean array where value at [x0, y0] is the result for Rectangle(x0 + x, y0 + y, width, height).
+        """
+        # Count the cells that don't match with a summed area table, cells that query_rect skips always match
+        misses = ~self.area_mask(area_filter)
+        misses[-1, :] = False
+        misses[:, -1] = False
+
+        pad_x = abs(x) + width
+        pad_y = abs(y) + height
+        table = np.zeros((self.width + 2 * pad_x + 1, self.height + 2 * pad_y + 1), dtype=np.int32)
+        table[pad_x + 1 : pad_x + 1 + self.width, pad_y + 1 : pad_y + 1 + self.height] = misses
+        table = table.cumsum(0).cumsum(1)
+
+        x0 = x + pad_x
+        y0 = y + pad_y
+        x1 = x0 + width
+        y1 = y0 + height
+        w = self.width
+        h = self.height
+        counts = (
+            table[x1 : x1 + w, y1 : y1 + h]
+            - table[x0 : x0 + w, y1 : y1 + h]
+            - table[x1 : x1 + w, y0 : y0 + h]
+            + table[x0 : x0 + w, y0 : y0 + h]
+        )
+        return counts == 0
+
+    def fill_rect_with(
+        self,
+        rect: Rectangle,
+        area: BuildArea,
+        replace: Optional[np.ndarray] = None,
+        building_index: Optional[int] = None,
+    ):
+        """
+        Vectorized fill_rect, sets area and optionally building index of the cells in the rectangle.
+
+        @param replace: Only replace cells whose area matches this filter.
+        """
+        slices = self.rect_slices(rect)
+        if replace is None:
+            self.areas[slices] = area.value
+            if building_index is not None:
+                self.building_indices[slices] = building_index
+            return
+
+        mask = replace[self.areas[slices] + _AREA_OFFSET]
+        self.areas[slices][mask] = area.value
+        if building_index is not None:
+            self.building_indices[slices][mask] = building_index
+
+    def fill_area_with(
+        self,
+        position: Point2,
+        fill_type: BlockerType,
+        area: BuildArea,
+        replace: Optional[np.ndarray] = None,
+        building_index: Optional[int] = None,
+    ):
+        """Vectorized fill_area, see fill_rect_with."""
+        self.fill_rect_with(self.get_area(position, fill_type), area, replace, building_index)
+
     def Generate(self, ai: sc2.BotAI):
         self.copy_build_map(self.game_info.placement_grid)
 
         for ramp in self.game_info.map_ramps:
             is_ramp = len(ramp.lower) != len(ramp.points)
+            area = BuildArea.Ramp if is_ramp else BuildArea.VisionBlocker
             for point in ramp.points:  # type: Point2
-                x = point.x
-                y = point.y
-                cell: GridArea = self.get(x, y)
-                if is_ramp:
-                    cell.Area = BuildArea.Ramp
-                else:
-                    cell.Area = BuildArea.VisionBlocker
-
-        def low_rock_filler(cell):
-            cell.Area = BuildArea.LowRock
-            return cell
-
-        def high_rock_filler(cell):
-            cell.Area = BuildArea.HighRock
-            return cell
+                self.areas[point.x, point.y] = area.value
 
         for low_blocker in ai.destructables:  # type: Unit
             type_id = low_blocker.type_id
             # TODO: diagonal rocks, they're not commonly blocking base building though
             if type_id in unbuildable_rocks:
-                self.fill_area(low_blocker.position, BlockerType.Building2x2, low_rock_filler)
+                self.fill_area_with(low_blocker.position, BlockerType.Building2x2, BuildArea.LowRock)
             if type_id in breakable_rocks_2x2:
-                self.fill_area(low_blocker.position, BlockerType.Building2x2, high_rock_filler)
+                self.fill_area_with(low_blocker.position, BlockerType.Building2x2, BuildArea.HighRock)
             if type_id in breakable_rocks_4x4:
-                self.fill_area(low_blocker.position, BlockerType.Building4x4, high_rock_filler)
+                self.fill_area_with(low_blocker.position, BlockerType.Building4x4, BuildArea.HighRock)
             if type_id in breakable_rocks_6x6:
-                self.fill_area(low_blocker.position, BlockerType.Building6x6, high_rock_filler)
-
-        def building_filler(cell):
-            cell.Area = BuildArea.TownHall
-            cell.BuildingIndex = 0
-            return cell
-
-        def mineral_filler(cell):
-            cell.Area = BuildArea.Mineral
-            cell.BuildingIndex = 0
-            return cell
-
-        def vespene_filler(cell):
-            cell.Area = BuildArea.Gas
-            cell.BuildingIndex = 0
-            return cell
-
-        def mining_filler(cell):
-            if cell.Area == BuildArea.Empty:
-                cell.Area = BuildArea.InMineralLine
-            return cell
+                self.fill_area_with(low_blocker.position, BlockerType.Building6x6, BuildArea.HighRock)
 
         for zone in self.knowledge.expansion_zones:
-            self.fill_area(zone.center_location, BlockerType.Building5x5, building_filler)
+            self.fill_area_with(zone.center_location, BlockerType.Building5x5, BuildArea.TownHall, building_index=0)
 
         for neutral_unit in ai.mineral_field:  # type: Unit
-            self.fill_area(neutral_unit.position, BlockerType.Minerals, mineral_filler)
-            self.fill_line(ai, mining_filler, neutral_unit)
+            self.fill_area_with(neutral_unit.position, BlockerType.Minerals, BuildArea.Mineral, building_index=0)
+            self.fill_line(ai, neutral_unit)
 
         for neutral_unit in ai.vespene_geyser:  # type: Unit
-            self.fill_area(neutral_unit.position, BlockerType.Building3x3, vespene_filler)
-            self.fill_line(ai, mining_filler, neutral_unit)
+            self.fill_area_with(neutral_unit.position, BlockerType.Building3x3, BuildArea.Gas, building_index=0)
+            self.fill_line(ai, neutral_unit)
 
-    def fill_line(self, ai, mining_filler, neutral_unit):
+    def fill_line(self, ai, neutral_unit):
         pos: Point2 = neutral_unit.position
         closest_expansion = pos.closest(ai.expansion_locations.keys())
         direction = closest_expansion - neutral_unit.position
         direction = sc2math.point_normalize(direction)
         i = 1
         while i < 5:
-            self.fill_area(neutral_unit.position + direction * i, BlockerType.Building2x2, mining_filler)
+            self.fill_area_with(
+                neutral_unit.position + direction * i, BlockerType.Building2x2, BuildArea.InMineralLine, EMPTY_AREAS
+            )
             i += 1
 
     def copy_build_map(self, buildGrid: PixelMap):
-        for x in range(0, buildGrid.width):
-            for y in range(0, buildGrid.height):
-                if buildGrid.is_set((x, y)):
-                    self.set(x, y, GridArea(BuildArea.Empty))
-                else:
-                    self.set(x, y, GridArea(BuildArea.NotBuildable))
+        placement = buildGrid.data_numpy.T
+        self.areas[:, :] = np.where(placement != 0, BuildArea.Empty.value, BuildArea.NotBuildable.value)
 
     def SolveCliffs(self, ai: sc2.BotAI):
         maxDifference = 3
-        hMap = self.game_info.terrain_height
-        correction = Point2((0, 1))
-
-        x = 2
-        while x < self.width - 3:
-            y = 3
-            while y < self.height - 3:
-                pos = Point2((x, y))
-                h = hMap[pos + correction]
-                possibles = [
-                    Point2((x - 2, y - 2)),
-                    Point2((x + 2, y - 2)),
-                    Point2((x - 2, y + 2)),
-                    Point2((x + 2, y + 2)),
-                ]
-
-                for possible in possibles:
-                    # To ensure rounding errors don't drop it to previous pixel.
-                    middle = (possible + pos) * 0.500001
-                    cell_possible: GridArea = self[possible]
-                    cell_middle: GridArea = self[middle]
-
-                    if cell_possible.Area == BuildArea.Empty and cell_middle.Area == BuildArea.NotBuildable:
-                        h2 = hMap[possible + correction]
-                        difference = h - h2
-                        if abs(difference) > maxDifference:
-                            continue
-
-                        cell: GridArea = self.get(x, y)
-
-                        if difference < 0:
-                            if cell.Cliff == Cliff.HighCliff:
-                                cell.Cliff = Cliff.BothCliff
-                            else:
-                                cell.Cliff = Cliff.LowCliff
-                        if difference > 0:
-                            if cell.Cliff == Cliff.LowCliff:
-                                cell.Cliff = Cliff.BothCliff
-                            else:
-                                cell.Cliff = Cliff.HighCliff
-                y += 1
-            x += 1
+        areas = self.areas
+        heights = self.heights.astype(np.int16)
+        # Cells x in [2, width - 3) and y in [3, height - 3), height is read one cell above the position
+        xs = slice(2, self.width - 3)
+        ys = slice(3, self.height - 3)
+        h = heights[xs, 4 : self.height - 2]
+        cliffs = self.cliffs[xs, ys]
+
+        for dx, dy in ((-2, -2), (2, -2), (-2, 2), (2, 2)):
+            possible = areas[2 + dx : self.width - 3 + dx, 3 + dy : self.height - 3 + dy]
+            middle = areas[2 + dx // 2 : self.width - 3 + dx // 2, 3 + dy // 2 : self.height - 3 + dy // 2]
+            h2 = heights[2 + dx : self.width - 3 + dx, 4 + dy : self.height - 2 + dy]
+            difference = h - h2
+            mask = (
+                (possible == BuildArea.Empty.value)
+                & (middle == BuildArea.NotBuildable.value)
+                & (np.abs(difference) <= maxDifference)
+            )
+
+            low = mask & (difference < 0)
+            cliffs[low] = np.where(cliffs[low] == Cliff.HighCliff.value, Cliff.BothCliff.value, Cliff.LowCliff.value)
+            high = mask & (difference > 0)
+            cliffs[high] = np.where(cliffs[high] == Cliff.LowCliff.value, Cliff.BothCliff.value, Cliff.HighCliff.value)
 
     def save(self, filename: string):
         if self.knowledge.debug:
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from sc2.position import Point2
+from . import BuildArea, BuildGrid, BlockerType, EMPTY_AREAS, FREE_AREAS, Rectangle, ZoneArea
+
+
+def mock_grid(width: int, height: int, seed: int = 1) -> BuildGrid:
+    # Skip generating the grid from game info
+    grid = BuildGrid.__new__(BuildGrid)
+    grid.width = width
+    grid.height = height
+    grid._create_data()
+
+    rnd = random.Random(seed)
+    areas = [BuildArea.Empty, BuildArea.Empty, BuildArea.Empty, BuildArea.BuildingPadding, BuildArea.NotBuildable]
+    for x in range(width):
+        for y in range(height):
+            grid.areas[x, y] = rnd.choice(areas).value
+    return grid
+
+
+class TestBuildGrid:
+    def test_get_returns_cell_that_set_stored(self):
+        grid = mock_grid(10, 10)
+        cell = grid.get(3, 4).copy()
+        cell.Area = BuildArea.Pylon
+        cell.ZoneIndex = ZoneArea.OwnNaturalZone
+        cell.BuildingIndex = 7
+        grid.set(3, 4, cell)
+
+        cell = grid[Point2((3.5, 4.5))]
+        assert cell.Area == BuildArea.Pylon
+        assert cell.ZoneIndex == ZoneArea.OwnNaturalZone
+        assert cell.BuildingIndex == 7
+        assert grid[Point2((-1, 4))].Area == BuildArea.NotBuildable
+
+    def test_cells_can_not_be_changed_in_place(self):
+        grid = mock_grid(10, 10)
+        with pytest.raises(AttributeError):
+            grid[Point2((3, 4))].Area = BuildArea.Pylon
+
+    def test_query_rects_in_returns_same_results_as_query_rect(self):
+        grid = mock_grid(30, 25)
+
+        for x, y, width, height in [(0, 0, 2, 2), (-2, 4, 2, 2), (-3, 0, 3, 3), (6, 4, 2, 2), (0, 0, 6, 9)]:
+            for area_filter, check in [
+                (EMPTY_AREAS, lambda cell: cell.Area == BuildArea.Empty),
+                (FREE_AREAS, lambda cell: cell.Area in {BuildArea.Empty, BuildArea.BuildingPadding}),
+            ]:
+                results = grid.query_rects_in(x, y, width, height, area_filter)
+                for x0 in range(-1, grid.width):
+                    for y0 in range(-1, grid.height):
+                        rect = Rectangle(x0 + x, y0 + y, width, height)
+                        expected = grid.query_rect(rect, check)
+                        assert grid.query_rect_in(rect, area_filter) == expected
+                        if x0 >= 0 and y0 >= 0:
+                            assert results[x0, y0] == expected
+
+    def test_fill_area_with_only_replaces_matching_cells(self):
+        grid = mock_grid(10, 10)
+        grid.areas[:, :] = BuildArea.Empty.value
+        grid.areas[5, 5] = BuildArea.NotBuildable.value
+
+        grid.fill_area_with(Point2((5.5, 5.5)), BlockerType.Building3x3, BuildArea.Building, FREE_AREAS, 2)
+
+        assert grid.get(4, 4).Area == BuildArea.Building
+        assert grid.get(4, 4).BuildingIndex == 2
+        assert grid.get(5, 5).Area == BuildArea.NotBuildable
+        assert grid.get(5, 5).BuildingIndex == -1
+        assert grid.get(3, 3).Area == BuildArea.Empty
+        assert (grid.areas == BuildArea.Building.value).sum() == 8
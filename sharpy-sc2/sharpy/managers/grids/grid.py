@@ -1,6 +1,7 @@
 import math
 import os
 from abc import abstractmethod
+from typing import Tuple
 
 from s2clientprotocol.debug_pb2 import Color
 
@@ -13,8 +14,10 @@ class Grid:
     def __init__(self, width, height):
         self.height = height
         self.width = width
-        self.height = height
-        self._data = [[0 for y in range(height)] for x in range(width)]
+        self._create_data()
+
+    def _create_data(self):
+        self._data = [[0 for y in range(self.height)] for x in range(self.width)]
 
     def set(self, x: int, y: int, value):
         # print(f"{x},{y})")
@@ -68,6 +71,14 @@ class Grid:
                     return False
         return True
 
+    def rect_slices(self, rect: Rectangle) -> Tuple[slice, slice]:
+        """Returns the cells that query_rect and fill_rect process as slices of x and y."""
+        minx = max(rect.x, 0)
+        miny = max(rect.y, 0)
+        maxx = min(rect.right, self.width - 1)
+        maxy = min(rect.bottom, self.height - 1)
+        return slice(minx, max(minx, maxx)), slice(miny, max(miny, maxy))
+
     def fill_area(self, pos: Point2, fill_type: BlockerType, func):
         area = self.get_area(pos, fill_type)
         self.fill_rect(area, func)
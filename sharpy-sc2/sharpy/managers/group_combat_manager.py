@@ -1,7 +1,9 @@
-from typing import List, Dict, Optional, Union
+from typing import Callable, List, Dict, Optional, Union
 
 from sharpy.managers.combat2 import *
 from sharpy.general.extended_power import ExtendedPower
+from sharpy.general.group_statistics import GroupStatistics
+from sharpy.general.unit_clustering import UnitClustering
 from sharpy.managers import UnitCacheManager, PathingManager, ManagerBase
 from sharpy.managers.combat2 import Action
 from sc2.units import Units
@@ -10,14 +12,6 @@ from sc2 import UnitTypeId
 from sc2.position import Point2, Point3
 from sc2.unit import Unit
 import numpy as np
-from sklearn.cluster import DBSCAN
-
-# IMPORTANT, do NOT remove these. Used for pyinstaller to include all files.
-import sklearn.utils._cython_blas
-import sklearn.neighbors.typedefs
-import sklearn.neighbors.quad_tree
-import sklearn.tree
-import sklearn.tree._utils
 
 ignored = {UnitTypeId.MULE, UnitTypeId.LARVA, UnitTypeId.EGG}
 
@@ -31,6 +25,10 @@ class GroupCombatManager(ManagerBase):
         self.default_rules.load_default_methods()
         self.default_rules.load_default_micro()
         self.enemy_group_distance = 7
+        self.own_clustering = UnitClustering(self.enemy_group_distance)
+        self.enemy_clustering = UnitClustering(self.enemy_group_distance)
+        self.own_statistics = GroupStatistics()
+        self.enemy_statistics = GroupStatistics()
 
     async def start(self, knowledge: "Knowledge"):
         await super().start(knowledge)
@@ -201,60 +199,52 @@ class GroupCombatManager(ManagerBase):
         return group
 
     def group_own_units(self, units: Units) -> List[CombatUnits]:
-        groups: List[Units] = []
-
-        # import time
-        # ns_pf = time.perf_counter_ns()
-
-        numpy_vectors: List[np.ndarray] = []
-        for unit in units:
-            numpy_vectors.append(np.array([unit.position.x, unit.position.y]))
-
-        if numpy_vectors:
-            clustering = DBSCAN(eps=self.enemy_group_distance, min_samples=1).fit(numpy_vectors)
-            # print(clustering.labels_)
-
-            for index in range(0, len(clustering.labels_)):
-                unit = units[index]
-                if unit.type_id in self.unit_values.combat_ignore:
-                    continue
+        if not units:
+            return []
 
-                label = clustering.labels_[index]
-
-                if label >= len(groups):
-                    groups.append(Units([unit], self.ai))
-                else:
-                    groups[label].append(unit)
-            # for label in clustering.labels_:
-
-        # ns_pf = time.perf_counter_ns() - ns_pf
-        # print(f"Own unit grouping (v2) took {ns_pf / 1000 / 1000} ms. groups: {len(groups)} units: {len(units)}")
-
-        return [CombatUnits(u, self.knowledge) for u in groups]
+        positions = np.array([unit.position_tuple for unit in units], dtype=np.float32)
+        labels = self.own_clustering.labels(positions)
+        return self._create_groups(
+            units, labels, lambda unit: unit.type_id not in self.unit_values.combat_ignore, self.own_statistics,
+        )
 
     def group_enemy_units(self) -> List[CombatUnits]:
-        groups: List[Units] = []
-
-        import time
-
-        ns_pf = time.perf_counter_ns()
-
-        if self.cache.enemy_numpy_vectors:
-            clustering = DBSCAN(eps=self.enemy_group_distance, min_samples=1).fit(self.cache.enemy_numpy_vectors)
-            # print(clustering.labels_)
-            units = self.knowledge.known_enemy_units
-            for index in range(0, len(clustering.labels_)):
-                unit = units[index]
-                if unit.type_id in self.unit_values.combat_ignore or not unit.can_be_attacked:
-                    continue
-
-                label = clustering.labels_[index]
-
-                if label >= len(groups):
-                    groups.append(Units([unit], self.ai))
-                else:
-                    groups[label].append(unit)
-            # for label in clustering.labels_:
-        ns_pf = time.perf_counter_ns() - ns_pf
-        # print(f"Enemy unit grouping (v2) took {ns_pf / 1000 / 1000} ms. groups: {len(groups)}")
-        return [CombatUnits(u, self.knowledge) for u in groups]
+        units = self.knowledge.known_enemy_units
+        if len(self.cache.enemy_positions) == 0:
+            return []
+
+        tags = np.fromiter((unit.tag for unit in units), dtype=np.int64, count=len(units))
+        labels = self.enemy_clustering.labels(self.cache.enemy_positions, tags, self.cache.enemy_tree)
+        return self._create_groups(
+            units,
+            labels,
+            lambda unit: unit.type_id not in self.unit_values.combat_ignore and unit.can_be_attacked,
+            self.enemy_statistics,
+        )
+
+    def _create_groups(
+        self, units: Units, labels: np.ndarray, include: Callable[[Unit], bool], statistics: GroupStatistics
+    ) -> List[CombatUnits]:
+        groups: Dict[int, Units] = {}
+        included: List[Unit] = []
+        group_indices: List[int] = []
+        # Group index of each label, in order of first appearance
+        label_indices: Dict[int, int] = {}
+
+        for index in range(0, len(labels)):
+            unit = units[index]
+            if not include(unit):
+                continue
+
+            label = labels[index]
+            group = groups.get(label)
+            if group is None:
+                groups[label] = Units([unit], self.ai)
+                label_indices[label] = len(label_indices)
+            else:
+                group.append(unit)
+            included.append(unit)
+            group_indices.append(label_indices[label])
+
+        stats = statistics.calculate(included, np.array(group_indices, dtype=np.intp), self.unit_values)
+        return [CombatUnits(u, self.knowledge, group_stats) for u, group_stats in zip(groups.values(), stats)]
@@ -1,7 +1,9 @@
 from collections import deque
+from itertools import chain
 from typing import Dict, Set, Deque, List
 
-from sc2.position import Point2
+import numpy as np
+
 from sharpy.events import UnitDestroyedEvent
 from sharpy.managers import ManagerBase
 from sc2 import UnitTypeId
@@ -28,11 +30,27 @@ class MemoryManager(ManagerBase):
         # Dictionary of units that we know of, but which are longer present at the location last seen. Keyed by unit tag.
         self._archive_units_by_tag: Dict[int, Deque[Unit]] = dict()
 
+        # Latest snapshots of the remembered units as arrays, in the same order as _memory_units_by_tag.
+        # Rows of destroyed units are removed on next update.
+        self._tags = np.zeros(0, dtype=np.int64)
+        self._type_ids = np.zeros(0, dtype=np.int32)
+        self._positions = np.zeros((0, 2), dtype=np.float64)
+        self._last_seen = np.zeros(0, dtype=np.int64)
+        self._rows: Dict[int, int] = dict()
+        self._destroyed_tags: List[int] = []
+
+        self._ghost_frame = -1
+        self._ghost_units: Units = Units([], None)
+        self._visible_frame = -1
+        self._visible: np.ndarray = np.zeros(0, dtype=np.int64)
+
     async def start(self, knowledge: "Knowledge"):
         await super().start(knowledge)
         knowledge.register_on_unit_destroyed_listener(self.on_unit_destroyed)
 
     async def update(self):
+        seen: List[Unit] = []
+
         # Iterate all currently visible enemy units.
         # self.ai.enemy_units is used here because it does not include memory lane units
         for unit in self.ai.enemy_units:
@@ -53,35 +71,24 @@ class MemoryManager(ManagerBase):
 
             if unit.tag not in self._memory_units_by_tag:
                 self._memory_units_by_tag[unit.tag] = snaps
+            seen.append(unit)
 
-        memory_tags_to_remove = list()
-
-        for unit_tag in self._memory_units_by_tag:
-            if self.is_unit_visible(unit_tag):
-                continue
-
-            snap = self.get_latest_snapshot(unit_tag)
-            points: List[Point2] = []
-            points.append(Point2((int(snap.position.x), int(snap.position.y))))
-            points.append(Point2((int(snap.position.x + 1), int(snap.position.y))))
-            points.append(Point2((int(snap.position.x), int(snap.position.y + 1))))
-            points.append(Point2((int(snap.position.x + 1), int(snap.position.y + 1))))
+        self._remember(seen)
 
-            visible = True
+        # Units that are not visible, but all four grid points around their last known position are.
+        # todo: what about burrowed units, especially lurkers?
+        hidden = ~np.isin(self._tags, self._visible_tags())
+        gone = hidden & self._is_area_visible(self._positions)
 
-            for point in points:
-                if not self.ai.is_visible(point):
-                    visible = False
-
-            if visible:
+        if gone.any():
+            for tag in self._tags[gone].tolist():
                 # We see that the unit is no longer there.
-                # todo: what about burrowed units, especially lurkers?
-                memory_tags_to_remove.append(unit_tag)
-                snaps = self._memory_units_by_tag.get(unit_tag)
-                self._archive_units_by_tag[unit_tag] = snaps
+                snaps = self._memory_units_by_tag.pop(tag, None)
+                if snaps is not None:
+                    self._archive_units_by_tag[tag] = snaps
+            self._forget(gone)
 
-        for tag in memory_tags_to_remove:
-            self._memory_units_by_tag.pop(tag)
+        self._ghost_frame = -1
 
     async def post_update(self):
         if not self.debug:
@@ -92,18 +99,17 @@ class MemoryManager(ManagerBase):
 
     @property
     def ghost_units(self) -> Units:
-        """Returns latest snapshot for all units that we know of but which are currently not visible."""
-        memory_units = Units([], self.ai)
-
-        for tag in self._memory_units_by_tag:
-            if self.is_unit_visible(tag):
-                continue
-
-            snap = self.get_latest_snapshot(tag)
-            memory_units.append(snap)
-
-        return memory_units
-        # return memory_units.visible
+        """
+        Returns latest snapshot for all units that we know of but which are currently not visible.
+        The collection is shared until memory changes and should not be modified.
+        """
+        if self._ghost_frame != self.ai.state.game_loop:
+            memory = self._memory_units_by_tag
+            hidden = self._tags[~np.isin(self._tags, self._visible_tags())]
+            self._ghost_units = Units([memory[tag][0] for tag in hidden.tolist() if tag in memory], self.ai)
+            self._ghost_frame = self.ai.state.game_loop
+
+        return self._ghost_units
 
     def get_latest_snapshot(self, unit_tag: int) -> Unit:
         """Returns the latest snapshot of a unit. Throws KeyError if unit_tag is not found."""
@@ -120,6 +126,64 @@ class MemoryManager(ManagerBase):
         # Remove the unit from frozenh dictionaries.
         self._memory_units_by_tag.pop(event.unit_tag, None)
         self._archive_units_by_tag.pop(event.unit_tag, None)
+        if event.unit_tag in self._rows:
+            self._destroyed_tags.append(event.unit_tag)
+        self._ghost_frame = -1
+
+    def _visible_tags(self) -> np.ndarray:
+        """Returns tags of enemy units that are visible on this frame."""
+        if self._visible_frame != self.ai.state.game_loop:
+            self._visible = np.fromiter((unit.tag for unit in self.ai.all_enemy_units), dtype=np.int64)
+            self._visible_frame = self.ai.state.game_loop
+        return self._visible
+
+    def _is_area_visible(self, positions: np.ndarray) -> np.ndarray:
+        """Returns true for positions where the grid point and the points above and to the right are visible."""
+        visibility: np.ndarray = self.ai.state.visibility.data_numpy == 2
+        x = positions[:, 0].astype(np.intp)
+        y = positions[:, 1].astype(np.intp)
+        x2 = np.minimum(x + 1, visibility.shape[1] - 1)
+        y2 = np.minimum(y + 1, visibility.shape[0] - 1)
+        return visibility[y, x] & visibility[y, x2] & visibility[y2, x] & visibility[y2, x2]
+
+    def _remember(self, units: List[Unit]):
+        """Updates latest snapshot arrays with units seen on this frame."""
+        if self._destroyed_tags:
+            self._forget(np.isin(self._tags, self._destroyed_tags))
+            self._destroyed_tags.clear()
+
+        if not units:
+            return
+
+        rows = np.fromiter((self._rows.get(unit.tag, -1) for unit in units), dtype=np.intp, count=len(units))
+        positions = np.fromiter(
+            chain.from_iterable(unit.position for unit in units), dtype=np.float64, count=len(units) * 2
+        ).reshape((-1, 2))
+        type_ids = np.fromiter((unit.type_id.value for unit in units), dtype=np.int32, count=len(units))
+        known = rows >= 0
+
+        self._positions[rows[known]] = positions[known]
+        self._type_ids[rows[known]] = type_ids[known]
+        self._last_seen[rows[known]] = self.ai.state.game_loop
+
+        new = ~known
+        if new.any():
+            tags = np.fromiter((unit.tag for unit in units), dtype=np.int64, count=len(units))[new]
+            first_row = len(self._tags)
+            self._rows.update((tag, first_row + index) for index, tag in enumerate(tags.tolist()))
+            self._tags = np.concatenate((self._tags, tags))
+            self._type_ids = np.concatenate((self._type_ids, type_ids[new]))
+            self._positions = np.concatenate((self._positions, positions[new]))
+            self._last_seen = np.concatenate((self._last_seen, np.full(len(tags), self.ai.state.game_loop)))
+
+    def _forget(self, mask: np.ndarray):
+        """Removes rows of the latest snapshot arrays."""
+        keep = ~mask
+        self._tags = self._tags[keep]
+        self._type_ids = self._type_ids[keep]
+        self._positions = self._positions[keep]
+        self._last_seen = self._last_seen[keep]
+        self._rows = {tag: row for row, tag in enumerate(self._tags.tolist())}
 
 
 # Will this end up being the same set as in enemy_units_manager.py ?
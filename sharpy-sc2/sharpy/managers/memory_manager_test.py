@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from sc2 import UnitTypeId
+from sc2.position import Point2
+from sharpy.events import UnitDestroyedEvent
+from .memory_manager import MemoryManager
+
+
+class MockAI:
+    def __init__(self):
+        self.enemy_units = []
+        self.state = SimpleNamespace(game_loop=0, visibility=SimpleNamespace(data_numpy=np.zeros((50, 60))))
+
+    @property
+    def all_enemy_units(self):
+        return self.enemy_units
+
+    def next_frame(self, enemy_units, visible_area=None):
+        self.state.game_loop += 1
+        self.enemy_units = enemy_units
+        visibility = np.zeros((50, 60))
+        if visible_area is not None:
+            (x1, y1), (x2, y2) = visible_area
+            visibility[y1:y2, x1:x2] = 2
+        self.state.visibility.data_numpy = visibility
+
+
+def mock_unit(tag: int, x: float, y: float, type_id: UnitTypeId = UnitTypeId.ZERGLING):
+    return SimpleNamespace(tag=tag, type_id=type_id, position=Point2((x, y)))
+
+
+def mock_manager() -> MemoryManager:
+    manager = MemoryManager()
+    manager.ai = MockAI()
+    return manager
+
+
+class TestMemoryManager:
+    @pytest.mark.asyncio
+    async def test_ghost_units_are_remembered_units_that_are_not_visible(self):
+        manager = mock_manager()
+        units = [mock_unit(1, 10.5, 10.5), mock_unit(2, 20.5, 20.5), mock_unit(3, 30.5, 30.5)]
+        manager.ai.next_frame(units + [mock_unit(4, 5, 5, UnitTypeId.LARVA)])
+        await manager.update()
+        assert not manager.ghost_units
+
+        manager.ai.next_frame(units[1:2])
+        ghosts = manager.ghost_units
+        assert [unit.tag for unit in ghosts] == [1, 3]
+        assert manager.ghost_units is ghosts
+
+        # Unit moved while visible, its latest snapshot is remembered
+        moved = mock_unit(1, 40.5, 40.5)
+        manager.ai.next_frame([moved])
+        await manager.update()
+        assert [unit.tag for unit in manager.ghost_units] == [2, 3]
+        manager.ai.next_frame([])
+        assert manager.ghost_units[0] is moved
+
+    @pytest.mark.asyncio
+    async def test_units_are_archived_when_last_position_is_visible(self):
+        manager = mock_manager()
+        units = [mock_unit(1, 10.5, 10.5), mock_unit(2, 20.5, 20.5), mock_unit(3, 30.9, 30.9)]
+        manager.ai.next_frame(units)
+        await manager.update()
+
+        # Only three of the four grid points around unit 3 are visible
+        manager.ai.next_frame([], ((5, 5), (31, 32)))
+        await manager.update()
+        assert [unit.tag for unit in manager.ghost_units] == [3]
+
+        manager.ai.next_frame([units[0]])
+        await manager.update()
+        assert [unit.tag for unit in manager.ghost_units] == [3]
+
+        manager.ai.next_frame([])
+        assert [unit.tag for unit in manager.ghost_units] == [3, 1]
+
+    @pytest.mark.asyncio
+    async def test_destroyed_units_are_forgotten(self):
+        manager = mock_manager()
+        units = [mock_unit(1, 10.5, 10.5), mock_unit(2, 20.5, 20.5), mock_unit(3, 30.5, 30.5)]
+        manager.ai.next_frame(units)
+        await manager.update()
+
+        manager.ai.next_frame([])
+        assert len(manager.ghost_units) == 3
+        manager.on_unit_destroyed(UnitDestroyedEvent(2, None))
+        assert [unit.tag for unit in manager.ghost_units] == [1, 3]
+
+        manager.ai.next_frame([mock_unit(4, 40.5, 40.5)])
+        await manager.update()
+        manager.ai.next_frame([])
+        assert [unit.tag for unit in manager.ghost_units] == [1, 3, 4]
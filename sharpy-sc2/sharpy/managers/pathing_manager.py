@@ -1,10 +1,15 @@
 import logging
+from collections import Counter
 from math import floor
-from typing import List, Dict, Tuple, Union
 
-from sc2 import Race
+import numpy as np
+from typing import List, Dict, Tuple, Union, Optional
+
+from sc2 import Race, Result
 from sc2pathlibp import Sc2Map, MapType
 from sharpy.general.extended_power import ExtendedPower
+from sharpy.general.path_cache import PathCache
+from sharpy.mapping.influence_grid import InfluenceGrid
 from sharpy.managers.unit_value import buildings_2x2, buildings_3x3, buildings_5x5
 from sharpy.sc2math import point_normalize
 from sc2.ids.effect_id import EffectId
@@ -24,10 +29,25 @@ class PathingManager(ManagerBase):
     map: Sc2Map
     path_finder_terrain: sc2pathlibp.PathFinder
 
-    def __init__(self):
+    def __init__(self, incremental: bool = True, path_cache_size: int = 512, path_cache_quantization: float = 1):
+        """
+        @param incremental: When true, static blocks are only recreated when minerals, rocks or structures change
+        and enemy influence is only recreated when enemy positions, effects or special maps change.
+        @param path_cache_size: Maximum amount of cached paths per cache.
+        @param path_cache_quantization: Size of the cells that start and end points are rounded to in path caches.
+        """
         super().__init__()
         self.found_points = []
         self.found_points_air = []
+        self.incremental = incremental
+        # Versions are increased every time the blocks or the influence of the maps are recreated
+        self.static_version = 0
+        self.influence_version = 0
+        self._static_key: Optional[tuple] = None
+        self._influence_key: Optional[tuple] = None
+        # Paths that ignore influence are only invalidated by blocks, influence paths by both
+        self.path_cache = PathCache(path_cache_size, path_cache_quantization)
+        self.influence_path_cache = PathCache(path_cache_size, path_cache_quantization)
 
     async def start(self, knowledge: "Knowledge"):
         await super().start(knowledge)
@@ -41,6 +61,9 @@ class PathingManager(ManagerBase):
             game_info.terrain_height.data_numpy,
             game_info.playable_area,
         )
+        analysis = self.knowledge.map_analysis
+        if analysis is not None and analysis.overlord_spots is not None:
+            self.map.overlord_spots = analysis.overlord_spots
         _data = [[0 for y in range(path_grid.height)] for x in range(path_grid.width)]
 
         for x in range(0, path_grid.width):
@@ -50,13 +73,39 @@ class PathingManager(ManagerBase):
                     _data[x][y] = 1
 
         self.path_finder_terrain = sc2pathlibp.PathFinder(_data)
+        self.influence_grid = InfluenceGrid(path_grid.width, path_grid.height)
 
         self.path_finder_terrain.normalize_influence(20)
+        # Zone paths are searched on start and need the blocks that do not depend on structures
+        self.set_terrain_blocks()
+
+    @property
+    def ground_influence(self) -> np.ndarray:
+        """
+        Read-only enemy ground influence indexed with [y, x].
+        Unlike the influence in map, this does not include the base value of 20.
+        """
+        return self.influence_grid.ground
+
+    @property
+    def air_influence(self) -> np.ndarray:
+        """
+        Read-only enemy air influence indexed with [y, x].
+        Unlike the influence in map, this does not include the base value of 20.
+        """
+        return self.influence_grid.air
 
     @property
     def overlord_spots(self) -> List[Point2]:
+        spots = self.map.overlord_spots
+        analysis = self.knowledge.map_analysis
+        if analysis is not None and analysis.overlord_spots is None:
+            # Spots were calculated now, store them so that they are loaded in the next game on this map
+            analysis.overlord_spots = [tuple(spot) for spot in spots]
+            analysis.dirty = True
+
         points = []
-        for tuple_spot in self.map.overlord_spots:
+        for tuple_spot in spots:
             points.append(Point2(tuple_spot))
         # TODO: cache this
         return points
@@ -116,27 +165,68 @@ class PathingManager(ManagerBase):
                         grid.create_block(rock.position + Point2((-y, y)), (5, 1))
 
     async def update_influence(self):
-        power = ExtendedPower(self.unit_values)
-        self.path_finder_terrain.reset()  # Reset
-        self.map.reset()  # Reset
-        self.map.enable_colossus_map(
-            self.knowledge.my_race == Race.Protoss and len(self.cache.own(UnitTypeId.COLOSSUS)) > 0
+        colossus_map = self.knowledge.my_race == Race.Protoss and len(self.cache.own(UnitTypeId.COLOSSUS)) > 0
+        reaper_map = self.knowledge.my_race == Race.Terran and len(self.cache.own(UnitTypeId.REAPER)) > 0
+        structures = self.ai.structures + self.knowledge.known_enemy_structures
+
+        static_key = self.create_static_key(structures)
+        static_changed = not self.incremental or static_key != self._static_key
+
+        if static_changed:
+            self._static_key = static_key
+            self.static_version += 1
+            self.path_finder_terrain.reset()  # Reset
+            self.map.reset()  # Reset
+            self.set_static_blocks(structures)
+
+        influence_key = (colossus_map, reaper_map, self.create_influence_key())
+
+        if not static_changed and influence_key == self._influence_key:
+            # Nothing that affects the maps has changed since last frame.
+            return
+
+        self._influence_key = influence_key
+        self.influence_version += 1
+        self.map.enable_colossus_map(colossus_map)
+        self.map.enable_reaper_map(reaper_map)
+        self.map.normalize_influence(20)
+        self.add_enemy_influence()
+
+    def create_static_key(self, structures: Units) -> tuple:
+        """Creates a hashable key of everything that is blocked in the maps."""
+        minerals = frozenset(mf.position_tuple for mf in self.ai.mineral_field)
+        rocks = frozenset((rock.type_id, rock.position_tuple) for rock in self.ai.destructables)
+        buildings = frozenset((building.type_id, building.position_tuple) for building in structures)
+        return minerals, rocks, buildings
+
+    def create_influence_key(self) -> tuple:
+        """
+        Creates a hashable key of enemy units and effects that add influence to the map.
+        Positions are rounded to half a grid cell so that enemies standing still do not cause the influence to update.
+        Entries are counted, so that units or effects on top of each other change the key when one of them leaves.
+        """
+        enemies = Counter(
+            (unit.type_id, round(unit.position_tuple[0] * 2), round(unit.position_tuple[1] * 2))
+            for unit in self.knowledge.known_enemy_units
         )
-        self.map.enable_reaper_map(self.knowledge.my_race == Race.Terran and len(self.cache.own(UnitTypeId.REAPER)) > 0)
+        effects = Counter((effect.id, frozenset(effect.positions)) for effect in self.ai.state.effects)
+        return frozenset(enemies.items()), frozenset(effects.items())
 
-        positions = []
+    def set_terrain_blocks(self):
+        """Blocks minerals and destructible rocks in terrain path finder."""
+        # In 4.8.5+ minerals are no longer visible in pathing grid unless player has vision
+        positions = [mf.position for mf in self.ai.mineral_field]
+        self.path_finder_terrain.create_block(positions, (2, 1))
+        self.set_rocks(self.path_finder_terrain)
 
-        for mf in self.ai.mineral_field:  # type: Unit
-            # In 4.8.5+ minerals are no longer visible in pathing grid unless player has vision
-            positions.append(mf.position)
+    def set_static_blocks(self, structures: Units):
+        self.set_terrain_blocks()
 
-        self.path_finder_terrain.create_block(positions, (2, 1))
+        positions = [mf.position for mf in self.ai.mineral_field]
         self.map.create_block(positions, (2, 1))
-
-        self.set_rocks(self.path_finder_terrain)
         self.set_rocks(self.map)
 
-        for building in self.ai.structures + self.knowledge.known_enemy_structures:  # type: Unit
+        for building in structures:  # type: Unit
             if building.type_id in buildings_2x2:
                 self.map.create_block(building.position, (2, 2))
             elif building.type_id in buildings_3x3:
@@ -145,7 +235,10 @@ class PathingManager(ManagerBase):
                 self.map.create_block(building.position, (5, 3))
                 self.map.create_block(building.position, (3, 5))
 
-        self.map.normalize_influence(20)
+    def add_enemy_influence(self):
+        power = ExtendedPower(self.unit_values)
+        grid = self.influence_grid
+        grid.clear()
 
         for enemy_type in self.cache.enemy_unit_cache:  # type: UnitTypeId
             enemies: Units = self.cache.enemy_unit_cache.get(enemy_type, Units([], self.ai))
@@ -165,8 +258,10 @@ class PathingManager(ManagerBase):
 
                 if example_enemy.is_structure:
                     self.map.add_pure_ground_influence(positions, power.air_power, s_range, s_range)
+                    grid.add(positions, power.air_power, s_range, s_range, True, False)
                 else:
                     self.map.add_air_influence(positions, power.air_power, s_range, s_range + 3)
+                    grid.add(positions, power.air_power, s_range, s_range + 3, False, True)
 
             if self.unit_values.can_shoot_ground(example_enemy):
                 positions = [unit.position for unit in enemies]  # need to be specified in both places
@@ -175,14 +270,20 @@ class PathingManager(ManagerBase):
                     s_range = 7
                 if example_enemy.type_id == UnitTypeId.SIEGETANKSIEGED:
                     self.map.add_tank_influence(positions, power.ground_power)
+                    grid.add_hollow(positions, power.ground_power, 3, 14.5, True, False)
                 elif s_range < 2:
                     self.map.add_walk_influence(positions, power.ground_power, 7)
+                    # Walking distance is approximated with a straight line distance
+                    grid.add(positions, power.ground_power, 0, 7, True, False)
                 elif example_enemy.is_structure:
                     self.map.add_pure_ground_influence(positions, power.ground_power, s_range, s_range)
+                    grid.add(positions, power.ground_power, s_range, s_range, True, False)
                 elif s_range < 5:
                     self.map.add_pure_ground_influence(positions, power.ground_power, s_range, 7)
+                    grid.add(positions, power.ground_power, s_range, 7, True, False)
                 else:
                     self.map.add_pure_ground_influence(positions, power.ground_power, s_range, s_range + 3)
+                    grid.add(positions, power.ground_power, s_range, s_range + 3, True, False)
 
         # influence, radius, points, can it hit air?
         effect_dict: Dict[EffectId, Tuple[float, float, List[Point2], bool]] = dict()
@@ -220,6 +321,7 @@ class PathingManager(ManagerBase):
                 self.map.add_both_influence(effects[2], effects[0], effects[1], effects[1])
             else:
                 self.map.add_ground_influence(effects[2], effects[0], effects[1], effects[1])
+            grid.add(effects[2], effects[0], effects[1], effects[1], True, effects[3])
 
         # batteries: Units = self.cache.own(UnitTypeId.SHIELDBATTERY).filter(lambda u: u.energy > 5)
         # if batteries:
@@ -238,8 +340,35 @@ class PathingManager(ManagerBase):
                 point3 = Point3((point.x, point.y, z))
                 self.client.debug_box2_out(point3, 0.25)
 
+    async def on_end(self, game_result: Result):
+        for name, cache in (("Path", self.path_cache), ("Influence path", self.influence_path_cache)):
+            self.print(
+                f"{name} cache hits: {cache.hits} misses: {cache.misses} hit rate: {cache.hit_rate:.2f}", stats=False
+            )
+
+    def _find_terrain_path(self, start: Point2, target: Point2) -> Tuple[List[Tuple[int, int]], float]:
+        return self.path_cache.get(
+            self.static_version, None, start, target, lambda: self.path_finder_terrain.find_path(start, target)
+        )
+
+    def _find_map_path(self, map_type: MapType, start: Point2, target: Point2) -> Tuple[List[Tuple[int, int]], float]:
+        return self.path_cache.get(
+            self.static_version, map_type, start, target, lambda: self.map.find_path(map_type, start, target)
+        )
+
+    def _find_influence_path(
+        self, map_type: MapType, start: Point2, target: Point2
+    ) -> Tuple[List[Tuple[int, int]], float]:
+        return self.influence_path_cache.get(
+            (self.static_version, self.influence_version),
+            map_type,
+            start,
+            target,
+            lambda: self.map.find_path_influence(map_type, start, target),
+        )
+
     def walk_distance(self, start: Point2, target: Point2) -> float:
-        result = self.map.find_path(MapType.Ground, start, target)
+        result = self._find_map_path(MapType.Ground, start, target)
         path = result[0]
 
         if len(path) < 1:
@@ -247,7 +376,7 @@ class PathingManager(ManagerBase):
         return result[1]
 
     def find_path(self, start: Point2, target: Point2, target_index: int = 20) -> Point2:
-        result = self.path_finder_terrain.find_path(start, target)
+        result = self._find_terrain_path(start, target)
         path = result[0]
 
         if len(path) < 1:
@@ -278,7 +407,7 @@ class PathingManager(ManagerBase):
         return Point2((pos[0], pos[1]))
 
     def find_influence_air_path(self, start: Point2, target: Point2) -> Point2:
-        result = self.map.find_path_influence(MapType.Air, start, target)
+        result = self._find_influence_path(MapType.Air, start, target)
         path = result[0]
         target_index = 4
 
@@ -297,7 +426,7 @@ class PathingManager(ManagerBase):
     def find_influence_ground_path(
         self, start: Point2, target: Point2, target_index: int = 5, map_type: MapType = MapType.Ground
     ) -> Point2:
-        result = self.map.find_path_influence(map_type, start, target)
+        result = self._find_influence_path(map_type, start, target)
         path = result[0]
 
         if len(path) < 1:
@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+
+from sc2 import UnitTypeId
+from sc2.ids.effect_id import EffectId
+from sharpy.mapping.map_analysis import MapAnalysis
+from .pathing_manager import PathingManager
+
+
+def mock_manager(enemies, effects=()) -> PathingManager:
+    manager = PathingManager()
+    manager.knowledge = SimpleNamespace(known_enemy_units=enemies)
+    manager.ai = SimpleNamespace(state=SimpleNamespace(effects=effects))
+    return manager
+
+
+def mock_unit(x: float, y: float, type_id: UnitTypeId = UnitTypeId.ZERGLING):
+    return SimpleNamespace(type_id=type_id, position_tuple=(x, y))
+
+
+class TestPathingManager:
+    def test_influence_key_ignores_small_movement(self):
+        key = mock_manager([mock_unit(10, 10), mock_unit(20, 20)]).create_influence_key()
+        assert mock_manager([mock_unit(10.1, 10), mock_unit(20, 19.9)]).create_influence_key() == key
+
+    def test_influence_key_changes_when_stacked_unit_leaves(self):
+        stacked = [mock_unit(10, 10), mock_unit(10.05, 10), mock_unit(20, 20)]
+        key = mock_manager(stacked).create_influence_key()
+
+        assert mock_manager(stacked[1:]).create_influence_key() != key
+        assert mock_manager(stacked + [mock_unit(10, 10.05)]).create_influence_key() != key
+
+    def test_influence_key_changes_when_overlapping_effect_ends(self):
+        storm = SimpleNamespace(id=EffectId.PSISTORMPERSISTENT, positions={(10, 10)})
+        key = mock_manager([], [storm, storm]).create_influence_key()
+        assert mock_manager([], [storm]).create_influence_key() != key
+
+    def test_overlord_spots_are_stored_in_map_analysis_when_first_used(self):
+        manager = PathingManager()
+        manager.knowledge = SimpleNamespace(map_analysis=MapAnalysis())
+        manager.map = SimpleNamespace(overlord_spots=[(10.5, 12.5)])
+
+        assert manager.overlord_spots == [(10.5, 12.5)]
+        assert manager.knowledge.map_analysis.overlord_spots == [(10.5, 12.5)]
+        assert manager.knowledge.map_analysis.dirty
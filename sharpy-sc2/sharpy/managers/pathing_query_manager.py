@@ -0,0 +1,165 @@
+import json
+import logging
+import os
+from typing import Dict, Optional, Set, Tuple, Union
+
+from sc2.position import Point2
+from sc2.unit import Unit
+from sharpy.managers.manager_base import ManagerBase
+from sharpy.mapping.map_cache import MAP_DATA_FOLDER, map_key
+
+Key = Tuple[int, int, int, int]
+
+
+class PathingQueryManager(ManagerBase):
+    """
+    Sends pathing distance queries to the game in batches and caches the results.
+
+    Queries that are not cached are queued and sent to the game in one query_pathings request after the frame.
+    Until the result arrives, distance answers with the terrain distance from the local path finder, so that callers
+    never wait for a round trip to the game.
+    Static queries are answered by terrain and starting structures only, e.g. distances between ramps at game start.
+    They are kept for the whole game and stored per map when map cache is enabled.
+    """
+
+    def __init__(self, max_age: float = 10):
+        """
+        @param max_age: Time in seconds that results of queries that are not static are cached for.
+        """
+        super().__init__()
+        self.max_age = max_age
+        # Amount of query_pathings requests sent to the game and the amount of distances queried in them
+        self.requests = 0
+        self.queries = 0
+        self.cache_file: Optional[str] = None
+        # Distances are 0 when there is no path
+        self._static: Dict[Key, float] = {}
+        self._recent: Dict[Key, Tuple[float, float]] = {}
+        self._pending: Dict[Key, Tuple[Point2, Point2]] = {}
+        self._pending_static: Set[Key] = set()
+        self._dirty = False
+
+    async def start(self, knowledge: "Knowledge"):
+        await super().start(knowledge)
+
+        if self.knowledge.config["general"].getboolean("map_cache"):
+            self.cache_file = os.path.join(MAP_DATA_FOLDER, map_key(self.ai.game_info) + "-pathing.json")
+            if self._load(self.cache_file):
+                self.print(f"Loaded {len(self._static)} pathing distances", stats=False, log_level=logging.DEBUG)
+
+    async def update(self):
+        pass
+
+    async def post_update(self):
+        await self.flush()
+
+    def distance(self, start: Union[Unit, Point2], end: Point2) -> Optional[float]:
+        """
+        Returns the pathing distance from the game if it is known, otherwise queues the query and returns
+        the terrain distance from the local path finder. Returns None when there is no path.
+        """
+        start, end = self._points(start, end)
+        key = self._query_key(start, end)
+        distance = self._cached(key)
+        if distance is None:
+            self._pending.setdefault(key, (start, end))
+            distance = self._local_distance(start, end)
+        return distance if distance > 0 else None
+
+    async def query(self, start: Union[Unit, Point2], end: Point2, static: bool = False) -> Optional[float]:
+        """
+        Returns the pathing distance from the game, sending all queued queries with it if it is not cached.
+        Returns None when there is no path.
+
+        @param static: The distance only depends on terrain and starting structures and can be stored per map.
+        """
+        start, end = self._points(start, end)
+        key = self._query_key(start, end)
+        distance = self._cached(key)
+        if distance is None:
+            self._pending.setdefault(key, (start, end))
+            if static:
+                self._pending_static.add(key)
+            await self.flush()
+            distance = self._cached(key)
+        return distance if distance > 0 else None
+
+    async def flush(self):
+        """Sends all queued queries to the game in one request."""
+        if not self._pending:
+            return
+
+        pending = list(self._pending.items())
+        self._pending.clear()
+        distances = await self.client.query_pathings([[start, end] for _, (start, end) in pending])
+        self.requests += 1
+        self.queries += len(pending)
+
+        now = self.ai.time
+        for (key, _), distance in zip(pending, distances):
+            if key in self._pending_static:
+                self._static[key] = distance
+                self._dirty = True
+            else:
+                self._recent[key] = (distance, now)
+        self._pending_static.clear()
+
+        if self._dirty and self.cache_file is not None:
+            try:
+                self._save(self.cache_file)
+            except OSError:
+                self.print("Pathing distances could not be saved", stats=False)
+
+    def _cached(self, key: Key) -> Optional[float]:
+        distance = self._static.get(key)
+        if distance is not None:
+            return distance
+
+        recent = self._recent.get(key)
+        if recent is not None:
+            if self.ai.time - recent[1] <= self.max_age:
+                return recent[0]
+            del self._recent[key]
+        return None
+
+    def _local_distance(self, start: Point2, end: Point2) -> float:
+        path, distance = self.pather.path_finder_terrain.find_path(start, end)
+        if not path:
+            return 0
+        return distance
+
+    @staticmethod
+    def _points(start: Union[Unit, Point2], end: Point2) -> Tuple[Point2, Point2]:
+        # Batched queries must all be either from units or from points, positions are used for all of them
+        if isinstance(start, Unit):
+            start = start.position
+        return Point2(start), Point2(end)
+
+    @staticmethod
+    def _query_key(start: Point2, end: Point2) -> Key:
+        return int(round(start.x)), int(round(start.y)), int(round(end.x)), int(round(end.y))
+
+    def _load(self, file_name: str) -> bool:
+        if not os.path.isfile(file_name):
+            return False
+
+        try:
+            with open(file_name, "r") as handle:
+                data = json.load(handle)
+
+            for item in data["distances"]:
+                self._static[tuple(item["key"])] = float(item["distance"])
+        except (OSError, ValueError, KeyError, TypeError):
+            self._static.clear()
+            return False
+        return True
+
+    def _save(self, file_name: str):
+        folder = os.path.dirname(file_name)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        distances = [{"key": key, "distance": distance} for key, distance in self._static.items()]
+        with open(file_name, "w") as handle:
+            json.dump({"distances": distances}, handle)
+        self._dirty = False
@@ -0,0 +1,85 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from sc2.position import Point2
+from .pathing_query_manager import PathingQueryManager
+
+
+class MockClient:
+    def __init__(self):
+        self.requests = []
+
+    async def query_pathings(self, zipped_list):
+        self.requests.append(zipped_list)
+        # No path to the right side of the map
+        return [0 if end.x > 100 else start.distance_to(end) for start, end in zipped_list]
+
+
+def mock_manager(client: MockClient) -> PathingQueryManager:
+    manager = PathingQueryManager(max_age=5)
+    manager.client = client
+    manager.ai = SimpleNamespace(time=0)
+    manager.pather = SimpleNamespace(
+        path_finder_terrain=SimpleNamespace(find_path=lambda start, end: ([start, end], 1000))
+    )
+    return manager
+
+
+class TestPathingQueryManager:
+    @pytest.mark.asyncio
+    async def test_distance_returns_local_distance_until_queries_are_flushed(self):
+        client = MockClient()
+        manager = mock_manager(client)
+
+        assert manager.distance(Point2((10, 10)), Point2((10, 30))) == 1000
+        assert manager.distance(Point2((10, 10)), Point2((110, 10))) == 1000
+        assert manager.distance(Point2((10.2, 9.8)), Point2((10, 30))) == 1000
+        assert not client.requests
+
+        await manager.flush()
+
+        assert len(client.requests) == 1
+        assert manager.queries == 2
+        assert manager.distance(Point2((10, 10)), Point2((10, 30))) == 20
+        assert manager.distance(Point2((10, 10)), Point2((110, 10))) is None
+
+    @pytest.mark.asyncio
+    async def test_query_returns_game_distance_and_sends_pending_queries(self):
+        client = MockClient()
+        manager = mock_manager(client)
+
+        manager.distance(Point2((10, 10)), Point2((10, 40)))
+        assert await manager.query(Point2((10, 10)), Point2((10, 30))) == 20
+        assert await manager.query(Point2((10, 10)), Point2((10, 30))) == 20
+
+        assert len(client.requests) == 1
+        assert len(client.requests[0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_recent_distances_expire_and_static_distances_do_not(self):
+        client = MockClient()
+        manager = mock_manager(client)
+
+        await manager.query(Point2((10, 10)), Point2((10, 30)))
+        await manager.query(Point2((10, 10)), Point2((10, 50)), static=True)
+        manager.ai.time = 10
+
+        assert manager.distance(Point2((10, 10)), Point2((10, 30))) == 1000
+        assert manager.distance(Point2((10, 10)), Point2((10, 50))) == 40
+
+    @pytest.mark.asyncio
+    async def test_static_distances_are_saved_and_loaded(self, tmpdir):
+        file_name = os.path.join(str(tmpdir), "maps", "test-pathing.json")
+        manager = mock_manager(MockClient())
+        manager.cache_file = file_name
+        await manager.query(Point2((10, 10)), Point2((10, 50)), static=True)
+        await manager.query(Point2((10, 10)), Point2((110, 50)), static=True)
+
+        client = MockClient()
+        loaded = mock_manager(client)
+        assert loaded._load(file_name)
+        assert await loaded.query(Point2((10, 10)), Point2((10, 50))) == 40
+        assert await loaded.query(Point2((10, 10)), Point2((110, 50))) is None
+        assert not client.requests
@@ -1,8 +1,6 @@
 import numpy as np
 from typing import Dict, Union, Optional, List, Iterable
 
-from scipy.spatial.ckdtree import cKDTree
-
 from sharpy.managers.unit_value import race_townhalls
 from sc2.constants import FakeEffectID
 from sc2.game_state import EffectData
@@ -15,6 +13,7 @@ from sc2.unit import Unit
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from scipy.spatial import cKDTree
     from sharpy.knowledges import Knowledge
 
 
@@ -30,12 +29,20 @@ class UnitCacheManager(ManagerBase):
         self.tag_cache: Dict[int, Unit] = {}
         self.own_unit_cache: Dict[UnitTypeId, Units] = {}
         self.enemy_unit_cache: Dict[UnitTypeId, Units] = {}
-        self.own_tree: Optional[cKDTree] = None
-        self.enemy_tree: Optional[cKDTree] = None
+        self.own_tree: Optional["cKDTree"] = None
+        self.enemy_tree: Optional["cKDTree"] = None
         self.force_fields: List[EffectData] = []
 
-        self.own_numpy_vectors: List[np.ndarray] = []
-        self.enemy_numpy_vectors: List[np.ndarray] = []
+        # Contiguous arrays of unit data, index matches all_own and knowledge.known_enemy_units
+        self.own_positions: np.ndarray = np.empty((0, 2), dtype=np.float32)
+        self.own_type_ids: np.ndarray = np.empty(0, dtype=np.int32)
+        self.enemy_positions: np.ndarray = np.empty((0, 2), dtype=np.float32)
+        self.enemy_type_ids: np.ndarray = np.empty(0, dtype=np.int32)
+        # Health and owner arrays are created when they are first used during the frame
+        self._own_health: Optional[np.ndarray] = None
+        self._own_owners: Optional[np.ndarray] = None
+        self._enemy_health: Optional[np.ndarray] = None
+        self._enemy_owners: Optional[np.ndarray] = None
         self.mineral_fields: Dict[Point2, Unit] = {}
         self.mineral_wall: Units = {}
 
@@ -88,23 +95,61 @@ class UnitCacheManager(ManagerBase):
         enemy_townhall_types = race_townhalls[self.knowledge.enemy_race]
         return self.enemy(enemy_townhall_types)
 
-    def own_in_range(self, position: Point2, range: Union[int, float]) -> Units:
-        units = Units([], self.ai)
+    @property
+    def own_health(self) -> np.ndarray:
+        """Health including shields of all_own units."""
+        if self._own_health is None:
+            self._own_health = self._health_array(self.all_own)
+        return self._own_health
+
+    @property
+    def own_owners(self) -> np.ndarray:
+        """Owner player ids of all_own units."""
+        if self._own_owners is None:
+            self._own_owners = self._owner_array(self.all_own)
+        return self._own_owners
+
+    @property
+    def enemy_health(self) -> np.ndarray:
+        """Health including shields of knowledge.known_enemy_units."""
+        if self._enemy_health is None:
+            self._enemy_health = self._health_array(self.knowledge.known_enemy_units)
+        return self._enemy_health
+
+    @property
+    def enemy_owners(self) -> np.ndarray:
+        """Owner player ids of knowledge.known_enemy_units."""
+        if self._enemy_owners is None:
+            self._enemy_owners = self._owner_array(self.knowledge.known_enemy_units)
+        return self._enemy_owners
+
+    def own_indices_in_range(self, position: Point2, range: Union[int, float]) -> np.ndarray:
+        """Returns indices to all_own and own arrays of units within range of the position."""
         if self.own_tree is None:
-            return units
+            return np.empty(0, dtype=np.intp)
+        return np.asarray(self.own_tree.query_ball_point((position.x, position.y), range), dtype=np.intp)
 
-        for index in self.own_tree.query_ball_point(np.array([position.x, position.y]), range):
-            units.append(self.all_own[index])
+    def enemy_indices_in_range(self, position: Point2, range: Union[int, float]) -> np.ndarray:
+        """Returns indices to knowledge.known_enemy_units and enemy arrays of units within range of the position."""
+        if self.enemy_tree is None:
+            return np.empty(0, dtype=np.intp)
+        return np.asarray(self.enemy_tree.query_ball_point((position.x, position.y), range), dtype=np.intp)
 
-        return units
+    def own_in_range(self, position: Point2, range: Union[int, float]) -> Units:
+        if self.own_tree is None:
+            return Units([], self.ai)
+
+        all_own = self.all_own
+        indices = self.own_tree.query_ball_point((position.x, position.y), range)
+        return Units([all_own[index] for index in indices], self.ai)
 
     def enemy_in_range(self, position: Point2, range: Union[int, float], only_targetable=True) -> Units:
-        units = Units([], self.ai)
         if self.enemy_tree is None:
-            return units
+            return Units([], self.ai)
 
-        for index in self.enemy_tree.query_ball_point(np.array([position.x, position.y]), range):
-            units.append(self.knowledge.known_enemy_units[index])
+        enemies = self.knowledge.known_enemy_units
+        indices = self.enemy_tree.query_ball_point((position.x, position.y), range)
+        units = Units([enemies[index] for index in indices], self.ai)
 
         if only_targetable:
             return units.filter(lambda x: x.can_be_attacked or x.is_snapshot)
@@ -118,38 +163,34 @@ class UnitCacheManager(ManagerBase):
         self.enemy_unit_cache.clear()
         self.force_fields.clear()
 
-        self.own_numpy_vectors = []
-        self.enemy_numpy_vectors = []
         self.all_own = self.knowledge.all_own
+        enemies = self.knowledge.known_enemy_units
 
-        for unit in self.all_own:
-            units = self.own_unit_cache.get(unit.type_id, Units([], self.ai))
-            if units.amount == 0:
-                self.own_unit_cache[unit.type_id] = units
-            units.append(unit)
-            self.own_numpy_vectors.append(np.array([unit.position.x, unit.position.y]))
+        self.own_positions, self.own_type_ids = self._to_arrays(self.all_own, self.own_unit_cache)
+        self.enemy_positions, self.enemy_type_ids = self._to_arrays(enemies, self.enemy_unit_cache)
+        self._own_health = None
+        self._own_owners = None
+        self._enemy_health = None
+        self._enemy_owners = None
 
-        for unit in self.knowledge.known_enemy_units:
+        for unit in enemies:
             if unit.is_memory:
                 self.tag_cache[unit.tag] = unit
 
-            units = self.enemy_unit_cache.get(unit.type_id, Units([], self.ai))
-            if units.amount == 0:
-                self.enemy_unit_cache[unit.type_id] = units
-            units.append(unit)
-            self.enemy_numpy_vectors.append(np.array([unit.position.x, unit.position.y]))
-
         for unit in self.ai.all_units:
             # Add all non-memory units to unit tag cache
             self.tag_cache[unit.tag] = unit
 
-        if len(self.own_numpy_vectors) > 0:
-            self.own_tree = cKDTree(self.own_numpy_vectors)
+        # Imported here to keep scipy out of the startup time
+        from scipy import spatial
+
+        if len(self.own_positions) > 0:
+            self.own_tree = spatial.cKDTree(self.own_positions)
         else:
             self.own_tree = None
 
-        if len(self.enemy_numpy_vectors) > 0:
-            self.enemy_tree = cKDTree(self.enemy_numpy_vectors)
+        if len(self.enemy_positions) > 0:
+            self.enemy_tree = spatial.cKDTree(self.enemy_positions)
         else:
             self.enemy_tree = None
 
@@ -157,6 +198,33 @@ class UnitCacheManager(ManagerBase):
             if effect.id == FakeEffectID.get(UnitTypeId.FORCEFIELD.value):
                 self.force_fields.append(effect)
 
+    def _to_arrays(self, units: Units, type_cache: Dict[UnitTypeId, Units]):
+        """Fills type_cache with units and collects their positions and types into arrays in one pass."""
+        count = len(units)
+        coordinates: List[float] = [0.0] * (count * 2)
+        type_ids: List[int] = [0] * count
+
+        for index, unit in enumerate(units):
+            type_id = unit.type_id
+            type_units = type_cache.get(type_id)
+            if type_units is None:
+                type_units = Units([], self.ai)
+                type_cache[type_id] = type_units
+            type_units.append(unit)
+
+            coordinates[index * 2], coordinates[index * 2 + 1] = unit.position_tuple
+            type_ids[index] = type_id.value
+
+        return np.array(coordinates, dtype=np.float32).reshape((count, 2)), np.array(type_ids, dtype=np.int32)
+
+    @staticmethod
+    def _health_array(units: Units) -> np.ndarray:
+        return np.array([unit.health + unit.shield for unit in units], dtype=np.float32)
+
+    @staticmethod
+    def _owner_array(units: Units) -> np.ndarray:
+        return np.array([unit.owner_id for unit in units], dtype=np.int8)
+
     async def post_update(self):
         if self.debug:
             for mf in self.mineral_wall:
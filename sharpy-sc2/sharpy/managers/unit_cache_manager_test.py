@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from sc2 import UnitTypeId
+from sc2.position import Point2
+from sc2.units import Units
+from .unit_cache_manager import UnitCacheManager
+
+
+def mock_unit(tag: int, type_id: UnitTypeId, x: float, y: float, health: float, shield: float = 0, owner: int = 1):
+    return SimpleNamespace(
+        tag=tag, type_id=type_id, position_tuple=(x, y), health=health, shield=shield, owner_id=owner, is_memory=False,
+    )
+
+
+def mock_manager(own, enemies) -> UnitCacheManager:
+    manager = UnitCacheManager()
+    manager.ai = SimpleNamespace(
+        all_units=own + enemies,
+        mineral_field=[],
+        _resource_location_to_expansion_position_dict={},
+        state=SimpleNamespace(effects=[]),
+    )
+    manager.knowledge = SimpleNamespace(all_own=Units(own, manager.ai), known_enemy_units=Units(enemies, manager.ai))
+    return manager
+
+
+OWN = [
+    mock_unit(1, UnitTypeId.STALKER, 10, 10, 80, 80),
+    mock_unit(2, UnitTypeId.ZEALOT, 12, 10, 100, 50),
+    mock_unit(3, UnitTypeId.STALKER, 30, 30, 40, 0),
+]
+ENEMIES = [
+    mock_unit(11, UnitTypeId.MARINE, 11, 11, 45, owner=2),
+    mock_unit(12, UnitTypeId.MARAUDER, 40, 40, 125, owner=2),
+]
+
+
+class TestUnitCacheManager:
+    @pytest.mark.asyncio
+    async def test_arrays_match_units(self):
+        manager = mock_manager(OWN, ENEMIES)
+        await manager.update()
+
+        for units, positions, type_ids, health, owners in [
+            (OWN, manager.own_positions, manager.own_type_ids, manager.own_health, manager.own_owners),
+            (ENEMIES, manager.enemy_positions, manager.enemy_type_ids, manager.enemy_health, manager.enemy_owners),
+        ]:
+            np.testing.assert_array_equal(positions, [unit.position_tuple for unit in units])
+            np.testing.assert_array_equal(type_ids, [unit.type_id.value for unit in units])
+            np.testing.assert_array_equal(health, [unit.health + unit.shield for unit in units])
+            np.testing.assert_array_equal(owners, [unit.owner_id for unit in units])
+
+        assert [unit.tag for unit in manager.own_unit_cache[UnitTypeId.STALKER]] == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_index_lookups_match_units_in_range(self):
+        manager = mock_manager(OWN, ENEMIES)
+        await manager.update()
+        position = Point2((10, 10))
+
+        own_indices = manager.own_indices_in_range(position, 3)
+        assert sorted(OWN[index].tag for index in own_indices) == [1, 2]
+        assert sorted(unit.tag for unit in manager.own_in_range(position, 3)) == [1, 2]
+
+        enemy_indices = manager.enemy_indices_in_range(position, 3)
+        assert [ENEMIES[index].tag for index in enemy_indices] == [11]
+
+    @pytest.mark.asyncio
+    async def test_health_is_updated_every_frame(self):
+        manager = mock_manager(OWN[:1], [])
+        await manager.update()
+        assert manager.own_health.tolist() == [160]
+
+        manager.knowledge.all_own = Units([mock_unit(1, UnitTypeId.STALKER, 10, 10, 20, 0)], manager.ai)
+        await manager.update()
+        assert manager.own_health.tolist() == [20]
+        assert len(manager.enemy_health) == 0
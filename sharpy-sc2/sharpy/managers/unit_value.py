@@ -1,5 +1,7 @@
 import logging
-from typing import Union, Optional, List, Dict, Callable
+from typing import Union, Optional, List, Dict, Callable, Tuple, TYPE_CHECKING
+
+import numpy as np
 
 from sharpy.general.unit_feature import UnitFeature
 from sc2 import Race, race_gas, race_townhalls
@@ -7,9 +9,12 @@ from sc2.constants import *
 from sc2.unit import Unit
 from sc2.units import Units
 from . import ManagerBase
-from sharpy.general.extended_power import ExtendedPower
+from sharpy.general.extended_power import ExtendedPower, power_vector
 from .version_manager import GameVersion
 
+if TYPE_CHECKING:
+    from sharpy.knowledges import Knowledge
+
 buildings_2x2 = {
     UnitTypeId.SUPPLYDEPOT,
     UnitTypeId.PYLON,
@@ -444,6 +449,31 @@ class UnitValue(ManagerBase):
             if UnitFeature.Detector in unit_data.features:
                 self.detectors.append(unit_data_key)
 
+        self.init_power_table()
+
+    async def start(self, knowledge: "Knowledge"):
+        await super().start(knowledge)
+        # Unit data may have been modified after the instance was created
+        self.init_power_table()
+
+    def init_power_table(self):
+        """Creates power vectors of all known unit types, row 0 of the table is for unknown unit types."""
+        self._unknown_power_vector = power_vector(UnitTypeId.NOTAUNIT, None)
+        self.power_vectors: Dict[UnitTypeId, Tuple[float, ...]] = {}
+        self.power_rows: Dict[UnitTypeId, int] = {}
+        rows = [self._unknown_power_vector]
+
+        for type_id, unit_data in self.unit_data.items():
+            vector = power_vector(type_id, unit_data)
+            self.power_vectors[type_id] = vector
+            self.power_rows[type_id] = len(rows)
+            rows.append(vector)
+
+        self.power_table = np.array(rows, dtype=np.float64)
+
+    def power_vector(self, type_id: UnitTypeId) -> Tuple[float, ...]:
+        return self.power_vectors.get(type_id, self._unknown_power_vector)
+
     def init_range_dicts(self):
         self._ground_range_dict: Dict[UnitTypeId, Callable[[Unit], float]] = {
             UnitTypeId.RAVEN: lambda u: 9,
@@ -558,17 +588,17 @@ class UnitValue(ManagerBase):
 
     def power(self, unit: Unit) -> float:
         """Returns combat power of the unit, taking into account it's known health and shields."""
+        return self.power_by_type(unit.type_id, self.health_percentage(unit))
+
+    def health_percentage(self, unit: Unit) -> float:
+        """Returns multiplier of combat power from health and shields, between 0.5 and 1."""
         # note: sc2.Unit.health_percentage does not include shields.
-        current_health = unit.health + unit.shield
         maximum_health = unit.health_max + unit.shield_max
 
         if maximum_health > 0:
-            health_percentage = 0.5 + 0.5 * current_health / maximum_health
-        else:
-            # this should only happen with known enemy structures that have is_visible=False
-            health_percentage = 1
-
-        return self.power_by_type(unit.type_id, health_percentage)
+            return 0.5 + 0.5 * (unit.health + unit.shield) / maximum_health
+        # this should only happen with known enemy structures that have is_visible=False
+        return 1
 
     def power_by_type(self, type_id: UnitTypeId, health_percentage: float = 1) -> float:
         unit_value = self.unit_data.get(type_id, None)
@@ -1,13 +1,15 @@
 import logging
+import os
 import sys
 from typing import Dict, List, Optional
 
-import sc2pathlibp
 from sc2.unit import Unit
 from sharpy import sc2math
 from sharpy.general.path import Path
 from sharpy.managers.grids import BuildGrid, GridArea, ZoneArea
 from sharpy.mapping import MapInfo
+from sharpy.mapping.map_cache import MAP_DATA_FOLDER, map_key
+from sharpy.mapping.zone_path_table import ZonePathTable
 from sc2.game_info import Ramp
 from sc2.units import Units
 
@@ -35,11 +37,32 @@ class ZoneManager(ManagerBase):
         self.zone_sorted_by = None
         self.found_enemy_start: Optional[Point2] = None
         self.map: MapInfo = None
+        # Terrain paths between zones and ramps, shared between games on the same map when map cache is enabled
+        self.path_table: ZonePathTable = None
+        self.path_table_file: Optional[str] = None
 
     async def start(self, knowledge: "Knowledge"):
         await super().start(knowledge)
         self.map = knowledge.map
+        self.path_table = ZonePathTable(self.knowledge.pathing_manager.path_finder_terrain.find_path)
+
+        if self.knowledge.config["general"].getboolean("map_cache"):
+            self.path_table_file = os.path.join(MAP_DATA_FOLDER, map_key(self.ai.game_info) + "-zones.json")
+            if self.path_table.load(self.path_table_file):
+                self.print(f"Loaded {len(self.path_table)} zone paths", stats=False, log_level=logging.DEBUG)
+
         self.init_zones()
+        # Search all zone paths now, while only minerals and rocks are blocked, so that the table is the same on
+        # every game
+        self.path_table.fill(zone.center_location for zone in self.expansion_zones)
+
+        if self.path_table_file is not None:
+            try:
+                self.path_table.save(self.path_table_file)
+            except OSError:
+                self.print("Zone path table could not be saved", stats=False)
+
+        self.print(f"Zone path searches: {self.path_table.searches}", stats=False, log_level=logging.DEBUG)
 
     def init_zones(self):
         """Add expansion locations as zones."""
@@ -57,9 +80,9 @@ class ZoneManager(ManagerBase):
         self.zone_sorted_by = self.enemy_start_location
 
     def _path_distance(self, start: Point2, end: Point2):
-        path = Path(self.knowledge.pathing_manager.path_finder_terrain.find_path(start, end))
-        if path.distance > 0:
-            return path.distance
+        distance = self.path_table.distance(start, end)
+        if distance > 0:
+            return distance
         return start.distance_to(end)  # Failsafe
 
     def _sort_expansion_zones(self):
@@ -157,11 +180,10 @@ class ZoneManager(ManagerBase):
 
     def init_zone_pathing(self):
         """ Init zone pathing. This needs to be run after all managers have properly started. """
-        pf: sc2pathlibp.PathFinder = self.knowledge.pathing_manager.path_finder_terrain
         zone_count = len(self.expansion_zones)
         for i in range(0, zone_count):
             for j in range(i + 1, zone_count):
-                path_data = pf.find_path(
+                path_data = self.path_table.path(
                     self.expansion_zones[i].center_location, self.expansion_zones[j].center_location
                 )
                 self.expansion_zones[i].paths[j] = Path(path_data)
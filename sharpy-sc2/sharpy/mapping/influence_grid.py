@@ -0,0 +1,143 @@
+import math
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+from sc2.position import Point2
+
+Positions = Union[np.ndarray, List[Tuple[float, float]]]
+
+
+class InfluenceGrid:
+    """
+    Numpy based ground and air influence grids.
+
+    Influence is stamped with precalculated circular kernels, one kernel per (shape, range) combination.
+    Add methods only store their arguments, all stamps are applied in a single batched operation
+    when the grids are accessed, so nothing is calculated for frames where the grids are not used.
+    Grids are indexed as [y, x] like PixelMap.data_numpy and returned as read-only float32 arrays.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self._kernels: Dict[Tuple[bool, float, float], Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        # Queued stamps as (positions, kernel key, influence)
+        self._ground_stamps: List[Tuple[Positions, Tuple[bool, float, float], float]] = []
+        self._air_stamps: List[Tuple[Positions, Tuple[bool, float, float], float]] = []
+        self._ground = self._empty_grid()
+        self._air = self._empty_grid()
+        self._dirty = False
+
+    def clear(self):
+        """Removes all influence."""
+        self._ground_stamps.clear()
+        self._air_stamps.clear()
+        self._dirty = True
+
+    def add(
+        self, positions: Positions, influence: float, full_range: float, fade_range: float, ground: bool, air: bool
+    ):
+        """
+        Adds influence that is full until full_range and then fades linearly to zero at fade_range.
+        """
+        self._queue((False, full_range, max(full_range, fade_range)), positions, influence, ground, air)
+
+    def add_hollow(
+        self, positions: Positions, influence: float, min_range: float, max_range: float, ground: bool, air: bool
+    ):
+        """
+        Adds flat influence between min_range and max_range, e.g. for sieged tanks.
+        """
+        self._queue((True, min_range, max_range), positions, influence, ground, air)
+
+    @property
+    def ground(self) -> np.ndarray:
+        """Ground influence as read-only float32 array indexed with [y, x]."""
+        self._build()
+        return self._ground
+
+    @property
+    def air(self) -> np.ndarray:
+        """Air influence as read-only float32 array indexed with [y, x]."""
+        self._build()
+        return self._air
+
+    def ground_value(self, point: Point2) -> float:
+        return float(self.ground[int(point.y), int(point.x)])
+
+    def air_value(self, point: Point2) -> float:
+        return float(self.air[int(point.y), int(point.x)])
+
+    def kernel(self, hollow: bool, range1: float, range2: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns x offsets, y offsets and weights of the cells that the kernel touches.
+        Distances are calculated between cell centers.
+        """
+        key = (hollow, range1, range2)
+        kernel = self._kernels.get(key)
+        if kernel is not None:
+            return kernel
+
+        radius = int(math.ceil(range2))
+        offsets = np.arange(-radius, radius + 1)
+        offset_x, offset_y = np.meshgrid(offsets, offsets)
+        distance = np.hypot(offset_x, offset_y)
+
+        if hollow:
+            weights = ((distance >= range1) & (distance <= range2)).astype(np.float64)
+        elif range2 > range1:
+            weights = np.clip((range2 - distance) / (range2 - range1), 0, 1)
+        else:
+            weights = (distance <= range1).astype(np.float64)
+
+        mask = weights > 0
+        kernel = (offset_x[mask], offset_y[mask], weights[mask])
+        self._kernels[key] = kernel
+        return kernel
+
+    def _queue(self, key: Tuple[bool, float, float], positions: Positions, influence: float, ground: bool, air: bool):
+        if len(positions) == 0:
+            return
+
+        if ground:
+            self._ground_stamps.append((positions, key, influence))
+        if air:
+            self._air_stamps.append((positions, key, influence))
+        self._dirty = True
+
+    def _build(self):
+        if not self._dirty:
+            return
+
+        self._ground = self._stamp(self._ground_stamps)
+        self._air = self._stamp(self._air_stamps)
+        self._dirty = False
+
+    def _stamp(self, stamps: List[Tuple[Positions, Tuple[bool, float, float], float]]) -> np.ndarray:
+        if not stamps:
+            return self._empty_grid()
+
+        all_indices = []
+        all_weights = []
+
+        for positions, key, influence in stamps:
+            cells = np.floor(np.asarray(positions, dtype=np.float32)).astype(np.int32).reshape((-1, 2))
+            offset_x, offset_y, weights = self.kernel(*key)
+            x = cells[:, 0, np.newaxis] + offset_x[np.newaxis, :]
+            y = cells[:, 1, np.newaxis] + offset_y[np.newaxis, :]
+            inside = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+            all_indices.append((y * self.width + x)[inside])
+            all_weights.append(np.broadcast_to(weights * influence, x.shape)[inside])
+
+        grid = np.bincount(
+            np.concatenate(all_indices), np.concatenate(all_weights), minlength=self.width * self.height
+        ).astype(np.float32)
+        grid = grid.reshape((self.height, self.width))
+        grid.setflags(write=False)
+        return grid
+
+    def _empty_grid(self) -> np.ndarray:
+        grid = np.zeros((self.height, self.width), dtype=np.float32)
+        grid.setflags(write=False)
+        return grid
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from sc2.position import Point2
+from .influence_grid import InfluenceGrid
+
+
+class TestInfluenceGrid:
+    def test_fading_influence_is_full_inside_range_and_fades_outside(self):
+        grid = InfluenceGrid(20, 20)
+        grid.add([(10.5, 10.5)], 100, 2, 4, True, False)
+
+        assert grid.ground_value(Point2((10.5, 10.5))) == 100
+        assert grid.ground_value(Point2((12.5, 10.5))) == 100
+        assert grid.ground_value(Point2((13.5, 10.5))) == pytest.approx(50)
+        assert grid.ground_value(Point2((14.5, 10.5))) == 0
+        assert grid.air.sum() == 0
+
+    def test_stamps_from_multiple_units_are_summed(self):
+        grid = InfluenceGrid(20, 20)
+        grid.add(np.array([(5, 5), (6, 5)]), 10, 3, 3, True, True)
+        grid.add([(5, 5)], 5, 1, 1, False, True)
+
+        assert grid.ground_value(Point2((5, 5))) == 20
+        assert grid.air_value(Point2((5, 5))) == 25
+
+    def test_hollow_influence_leaves_center_empty(self):
+        grid = InfluenceGrid(40, 40)
+        grid.add_hollow([(20, 20)], 10, 3, 14.5, True, False)
+
+        assert grid.ground_value(Point2((20, 20))) == 0
+        assert grid.ground_value(Point2((30, 20))) == 10
+
+    def test_stamps_outside_the_map_are_clipped(self):
+        grid = InfluenceGrid(10, 10)
+        grid.add([(0, 0), (9.9, 9.9)], 1, 3, 3, True, False)
+
+        assert grid.ground.shape == (10, 10)
+        assert grid.ground_value(Point2((0, 0))) == 1
+        assert grid.ground_value(Point2((9, 9))) == 1
+
+    def test_grids_are_read_only_and_cleared(self):
+        grid = InfluenceGrid(10, 10)
+        grid.add([(5, 5)], 1, 1, 1, True, True)
+
+        with pytest.raises(ValueError):
+            grid.ground[5, 5] = 0
+
+        grid.clear()
+        assert grid.ground.sum() == 0
+        assert grid.air.sum() == 0
+
+    def test_stamps_are_calculated_when_grids_are_accessed(self):
+        grid = InfluenceGrid(10, 10)
+        grid.add([(5, 5)], 1, 1, 2, True, False)
+        assert not grid._kernels
+
+        assert grid.ground_value(Point2((5, 5))) == 1
+        assert len(grid._kernels) == 1
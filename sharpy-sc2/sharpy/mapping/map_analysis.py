@@ -0,0 +1,129 @@
+import os
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from sc2.game_info import Ramp
+from sc2.position import Point2
+
+if TYPE_CHECKING:
+    from sc2 import BotAI
+
+# Increase when the analysis changes, so that files written by older versions are not loaded
+ANALYSIS_VERSION = 1
+
+
+class MapAnalysis:
+    """
+    Results of the map analysis that python-sc2 and sc2pathlib do at game start, stored per map on disk.
+
+    Expansion locations, ramps and vision blockers are calculated in BotAI._prepare_first_step and overlord spots
+    by sc2pathlib. None of them change between games on the same map, so they can be loaded from a file instead.
+    """
+
+    def __init__(self):
+        self.expansions: List[Point2] = []
+        # Maps resource positions to expansion locations
+        self.resource_expansions: Dict[Point2, Point2] = {}
+        self.ramps: List[Set[Point2]] = []
+        self.vision_blockers: Set[Point2] = set()
+        self.overlord_spots: Optional[List[Tuple[float, float]]] = None
+        self.dirty = False
+
+    @staticmethod
+    def from_bot(ai: "BotAI") -> "MapAnalysis":
+        """Collects the analysis after BotAI._prepare_first_step has run."""
+        analysis = MapAnalysis()
+        analysis.expansions = list(ai._expansion_positions_list)
+        analysis.resource_expansions = dict(ai._resource_location_to_expansion_position_dict)
+        analysis.ramps = [ramp.points for ramp in ai.game_info.map_ramps]
+        analysis.vision_blockers = set(ai.game_info.vision_blockers)
+        analysis.dirty = True
+        return analysis
+
+    def apply(self, ai: "BotAI") -> bool:
+        """
+        Does the same as BotAI._prepare_first_step, using the analysis instead of calculating it.
+        Returns false if the analysis can't be used, i.e. there are no townhalls or no expansions were stored.
+        """
+        if not ai.townhalls or not self.expansions:
+            return False
+
+        game_info = ai.game_info
+        game_info.player_start_location = ai.townhalls.first.position
+        ai._expansion_positions_list.clear()
+        ai._expansion_positions_list.extend(self.expansions)
+        ai._resource_location_to_expansion_position_dict.clear()
+        ai._resource_location_to_expansion_position_dict.update(self.resource_expansions)
+        game_info.map_ramps = [Ramp(set(points), game_info) for points in self.ramps]
+        game_info.vision_blockers = set(self.vision_blockers)
+        return True
+
+    def load(self, file_name: str) -> bool:
+        """Loads the analysis from the file, returns true if the file was found and could be read."""
+        if not os.path.isfile(file_name):
+            return False
+
+        try:
+            with np.load(file_name, allow_pickle=False) as data:
+                if int(data["version"]) != ANALYSIS_VERSION:
+                    return False
+
+                expansions = [Point2(point) for point in data["expansions"].tolist()]
+                resources = data["resources"].tolist()
+                resource_indices = data["resource_expansions"].tolist()
+                ramp_points = [Point2(point) for point in data["ramp_points"].tolist()]
+                ramp_sizes = data["ramp_sizes"].tolist()
+                vision_blockers = {Point2(point) for point in data["vision_blockers"].tolist()}
+                overlord_spots = [tuple(point) for point in data["overlord_spots"].tolist()]
+                has_overlord_spots = bool(data["has_overlord_spots"])
+        except (OSError, ValueError, KeyError, IndexError):
+            return False
+
+        self.expansions = expansions
+        self.resource_expansions = {
+            Point2(position): expansions[index] for position, index in zip(resources, resource_indices)
+        }
+        self.ramps = []
+        start = 0
+        for size in ramp_sizes:
+            self.ramps.append(set(ramp_points[start : start + size]))
+            start += size
+        self.vision_blockers = vision_blockers
+        self.overlord_spots = overlord_spots if has_overlord_spots else None
+        self.dirty = False
+        return True
+
+    def save(self, file_name: str):
+        """Writes the analysis to the file if it has changed since last load or save."""
+        if not self.dirty:
+            return
+
+        folder = os.path.dirname(file_name)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        indices = {position: index for index, position in enumerate(self.expansions)}
+        resources = list(self.resource_expansions.keys())
+        # Ramp points are stored as integers, so sort them to keep the files identical between runs
+        ramps = [sorted(points) for points in self.ramps]
+        with open(file_name, "wb") as handle:
+            np.savez_compressed(
+                handle,
+                version=np.array(ANALYSIS_VERSION),
+                expansions=self._points(self.expansions),
+                resources=self._points(resources),
+                resource_expansions=np.array(
+                    [indices[self.resource_expansions[position]] for position in resources], dtype=np.int32
+                ),
+                ramp_points=self._points([point for points in ramps for point in points], np.int32),
+                ramp_sizes=np.array([len(points) for points in ramps], dtype=np.int32),
+                vision_blockers=self._points(sorted(self.vision_blockers), np.int32),
+                overlord_spots=self._points(self.overlord_spots or []),
+                has_overlord_spots=np.array(self.overlord_spots is not None),
+            )
+        self.dirty = False
+
+    @staticmethod
+    def _points(points: List[Tuple[float, float]], dtype=np.float64) -> np.ndarray:
+        return np.array([(point[0], point[1]) for point in points], dtype=dtype).reshape(-1, 2)
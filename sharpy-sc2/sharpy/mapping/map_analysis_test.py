@@ -0,0 +1,33 @@
+import os
+
+from sc2.position import Point2
+from .map_analysis import MapAnalysis
+
+
+class TestMapAnalysis:
+    def test_saved_analysis_is_loaded(self, tmpdir):
+        file_name = os.path.join(str(tmpdir), "maps", "test-analysis.npz")
+        analysis = MapAnalysis()
+        analysis.expansions = [Point2((30.5, 40.5)), Point2((100.5, 20.5))]
+        analysis.resource_expansions = {
+            Point2((24, 40.5)): analysis.expansions[0],
+            Point2((107, 21.5)): analysis.expansions[1],
+        }
+        analysis.ramps = [{Point2((50, 50)), Point2((51, 50))}, {Point2((70, 71))}]
+        analysis.vision_blockers = {Point2((60, 60))}
+        analysis.dirty = True
+        analysis.save(file_name)
+
+        loaded = MapAnalysis()
+        assert loaded.load(file_name)
+        assert loaded.expansions == analysis.expansions
+        assert loaded.resource_expansions == analysis.resource_expansions
+        assert loaded.ramps == analysis.ramps
+        assert loaded.vision_blockers == analysis.vision_blockers
+        assert loaded.overlord_spots is None
+
+        loaded.overlord_spots = [(10.5, 12.5)]
+        loaded.dirty = True
+        loaded.save(file_name)
+        assert analysis.load(file_name)
+        assert analysis.overlord_spots == [(10.5, 12.5)]
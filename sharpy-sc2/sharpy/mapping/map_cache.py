@@ -0,0 +1,20 @@
+import hashlib
+import os
+import re
+
+from sc2.game_info import GameInfo
+
+# Folder for files that are computed once per map and loaded in later games
+MAP_DATA_FOLDER = os.path.join("data", "maps")
+
+
+def map_key(game_info: GameInfo) -> str:
+    """
+    Returns a file name friendly key for the map that includes map name and a hash of the pathing grids.
+    The grids include the starting structures, so the key is different for each spawn location.
+    """
+    name = re.sub(r"[^A-Za-z0-9]+", "", game_info.map_name)
+    digest = hashlib.sha1()
+    digest.update(game_info.pathing_grid.data_numpy.tobytes())
+    digest.update(game_info.placement_grid.data_numpy.tobytes())
+    return f"{name}-{digest.hexdigest()[:12]}"
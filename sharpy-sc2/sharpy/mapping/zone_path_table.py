@@ -0,0 +1,96 @@
+import json
+import os
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# Increase when the paths change, so that files written by older versions are not loaded.
+PATH_TABLE_VERSION = 1
+
+PathTuple = Tuple[List[Tuple[int, int]], float]
+Key = Tuple[int, int, int, int]
+
+
+class ZonePathTable:
+    """
+    Table of terrain paths between zone locations that can be stored on disk.
+
+    Points are rounded to integers the same way as in path finding, so any two points that
+    would result in the same path search share the same entry. Paths are symmetric, a path from b to a
+    is the reversed path from a to b.
+    """
+
+    def __init__(self, find_path: Callable[[Tuple[float, float], Tuple[float, float]], PathTuple]):
+        """
+        @param find_path: function that finds terrain path between two points, e.g. PathFinder.find_path
+        """
+        self.find_path = find_path
+        self.searches = 0
+        self.dirty = False
+        self._paths: Dict[Key, PathTuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def path(self, start: Tuple[float, float], end: Tuple[float, float]) -> PathTuple:
+        """Returns terrain path between the points as (points, distance) tuple, searching it if needed."""
+        start_int = (int(round(start[0])), int(round(start[1])))
+        end_int = (int(round(end[0])), int(round(end[1])))
+
+        if start_int > end_int:
+            points, distance = self._get(end_int + start_int, end, start)
+            return points[::-1], distance
+        return self._get(start_int + end_int, start, end)
+
+    def distance(self, start: Tuple[float, float], end: Tuple[float, float]) -> float:
+        return self.path(start, end)[1]
+
+    def fill(self, points: Iterable[Tuple[float, float]]):
+        """Makes sure that paths between all pairs of the points are in the table."""
+        points = list(points)
+        for i in range(0, len(points)):
+            for j in range(i + 1, len(points)):
+                self.path(points[i], points[j])
+
+    def load(self, file_name: str) -> bool:
+        """Loads paths from the file, returns true if the file was found and could be read."""
+        if not os.path.isfile(file_name):
+            return False
+
+        try:
+            with open(file_name, "r") as handle:
+                data = json.load(handle)
+
+            if data.get("version") != PATH_TABLE_VERSION:
+                return False
+
+            for item in data["paths"]:
+                key = tuple(item["key"])
+                points = [tuple(point) for point in item["path"]]
+                self._paths[key] = (points, item["distance"])
+        except (OSError, ValueError, KeyError, TypeError):
+            self._paths.clear()
+            return False
+        return True
+
+    def save(self, file_name: str):
+        """Writes the paths to the file if new paths have been searched since last load or save."""
+        if not self.dirty:
+            return
+
+        folder = os.path.dirname(file_name)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        paths = [{"key": key, "path": points, "distance": distance} for key, (points, distance) in self._paths.items()]
+        with open(file_name, "w") as handle:
+            json.dump({"version": PATH_TABLE_VERSION, "paths": paths}, handle)
+        self.dirty = False
+
+    def _get(self, key: Key, start: Tuple[float, float], end: Tuple[float, float]) -> PathTuple:
+        path = self._paths.get(key)
+        if path is None:
+            self.searches += 1
+            points, distance = self.find_path(start, end)
+            path = ([tuple(point) for point in points], distance)
+            self._paths[key] = path
+            self.dirty = True
+        return path
@@ -0,0 +1,52 @@
+import json
+import os
+
+from sc2.position import Point2
+from .zone_path_table import ZonePathTable
+
+
+def straight_path(start, end):
+    return [(int(round(start[0])), int(round(start[1]))), (int(round(end[0])), int(round(end[1])))], 10.0
+
+
+class TestZonePathTable:
+    def test_reverse_path_is_not_searched_again(self):
+        table = ZonePathTable(straight_path)
+        path = table.path(Point2((10.5, 20.5)), Point2((30.5, 40.5)))
+        reverse = table.path(Point2((30.5, 40.5)), Point2((10.5, 20.5)))
+
+        assert table.searches == 1
+        assert reverse[0] == path[0][::-1]
+        assert reverse[1] == path[1]
+
+    def test_fill_searches_all_pairs(self):
+        table = ZonePathTable(straight_path)
+        table.fill([Point2((1, 1)), Point2((5, 5)), Point2((9, 9)), Point2((1, 9))])
+
+        assert table.searches == 6
+        assert len(table) == 6
+
+    def test_saved_table_is_loaded_without_searches(self, tmpdir):
+        file_name = os.path.join(str(tmpdir), "maps", "test.json")
+        table = ZonePathTable(straight_path)
+        table.fill([Point2((1, 1)), Point2((5, 5)), Point2((9, 9))])
+        table.save(file_name)
+
+        loaded = ZonePathTable(straight_path)
+        assert loaded.load(file_name)
+        assert loaded.path(Point2((9, 9)), Point2((1, 1))) == table.path(Point2((9, 9)), Point2((1, 1)))
+        assert loaded.searches == 0
+        assert not loaded.dirty
+
+    def test_missing_file_returns_false(self, tmpdir):
+        table = ZonePathTable(straight_path)
+        assert not table.load(os.path.join(str(tmpdir), "missing.json"))
+
+    def test_table_of_other_version_is_not_loaded(self, tmpdir):
+        file_name = os.path.join(str(tmpdir), "old.json")
+        with open(file_name, "w") as handle:
+            json.dump({"paths": [{"key": [1, 1, 5, 5], "path": [[1, 1], [5, 5]], "distance": 10.0}]}, handle)
+
+        table = ZonePathTable(straight_path)
+        assert not table.load(file_name)
+        assert len(table) == 0
@@ -3,9 +3,6 @@ from sc2 import UnitTypeId, Race
 from sc2.constants import ALL_GAS
 from sharpy.managers.unit_value import buildings_5x5, buildings_3x3, buildings_2x2, BUILDING_IDS
 from sharpy.plans.acts import ActBase, GridBuilding, Expand, Workers, BuildGas
-from sharpy.plans.acts.protoss import ProtossUnit
-from sharpy.plans.acts.terran import TerranUnit
-from sharpy.plans.acts.zerg import ZergUnit
 
 
 class BuildId(ActBase):
@@ -35,11 +32,18 @@ class BuildId(ActBase):
                 self.type_id, self.to_count, priority=self.priority, consider_worker_production=False
             )
         else:
+            # Race specific acts are imported here, so that only acts of the race being played are imported
             if self.ai.race == Race.Protoss:
+                from sharpy.plans.acts.protoss import ProtossUnit
+
                 self.act = ProtossUnit(self.type_id, self.to_count, priority=self.priority, only_once=True)
             elif self.ai.race == Race.Terran:
+                from sharpy.plans.acts.terran import TerranUnit
+
                 self.act = TerranUnit(self.type_id, self.to_count, priority=self.priority, only_once=True)
             else:
+                from sharpy.plans.acts.zerg import ZergUnit
+
                 self.act = ZergUnit(self.type_id, self.to_count, priority=self.priority, only_once=True)
 
         await self.act.start(knowledge)
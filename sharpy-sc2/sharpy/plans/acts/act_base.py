@@ -1,6 +1,6 @@
 import string
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, TYPE_CHECKING
 
 import sc2
 from sc2.ids.buff_id import BuffId
@@ -17,6 +17,9 @@ from sc2.units import Units
 from sc2.constants import EQUIVALENTS_FOR_TECH_PROGRESS
 from sharpy.managers.roles import UnitTask
 
+if TYPE_CHECKING:
+    from sharpy.knowledges import Knowledge
+
 build_commands = {
     # Protoss
     AbilityId.PROTOSSBUILD_NEXUS,
@@ -66,6 +69,10 @@ build_commands = {
 
 
 class ActBase(Component, ABC):
+    async def start(self, knowledge: "Knowledge"):
+        await super().start(knowledge)
+        knowledge.profiler.instrument(self)
+
     async def debug_draw(self):
         if self.debug:
             await self.debug_actions()
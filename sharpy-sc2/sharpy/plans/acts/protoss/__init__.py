@@ -1,15 +1,27 @@
-from .archon import Archon, ActArchon
-from .artosis_pylon import ArtosisPylon
-from .auto_pylon import AutoPylon
-from .chrono_any_tech import ChronoAnyTech
-from .chrono_tech import ChronoTech
-from .chrono_unit import ChronoUnit, ChronoUnitProduction
-from .defensive_cannons import DefensiveCannons, ActDefensiveCannons
-from .gate_unit import GateUnit
-from .protoss_unit import ProtossUnit
-from .restore_power import RestorePower
-from .robo_unit import RoboUnit
-from .star_unit import StarUnit
-from .warp_unit import WarpUnit
-from .chrono_building import ChronoBuilding
-from .defensive_pylon import DefensivePylons, MineralCannons, MineralBatteries
+from sharpy.general.lazy_exports import lazy_exports
+
+# Act modules are imported on first use, so that only acts of the race being played are imported
+_exports = {
+    "Archon": ".archon",
+    "ActArchon": ".archon",
+    "ArtosisPylon": ".artosis_pylon",
+    "AutoPylon": ".auto_pylon",
+    "ChronoAnyTech": ".chrono_any_tech",
+    "ChronoTech": ".chrono_tech",
+    "ChronoUnit": ".chrono_unit",
+    "ChronoUnitProduction": ".chrono_unit",
+    "DefensiveCannons": ".defensive_cannons",
+    "ActDefensiveCannons": ".defensive_cannons",
+    "GateUnit": ".gate_unit",
+    "ProtossUnit": ".protoss_unit",
+    "RestorePower": ".restore_power",
+    "RoboUnit": ".robo_unit",
+    "StarUnit": ".star_unit",
+    "WarpUnit": ".warp_unit",
+    "ChronoBuilding": ".chrono_building",
+    "DefensivePylons": ".defensive_pylon",
+    "MineralCannons": ".defensive_pylon",
+    "MineralBatteries": ".defensive_pylon",
+}
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
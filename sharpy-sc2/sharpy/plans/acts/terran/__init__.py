@@ -1,5 +1,13 @@
-from .build_addon import BuildAddon, ActBuildAddon
-from .morph_orbitals import MorphOrbitals
-from .morph_planetary import MorphPlanetary
-from .terran_unit import TerranUnit
-from .auto_depot import AutoDepot
+from sharpy.general.lazy_exports import lazy_exports
+
+# Act modules are imported on first use, so that only acts of the race being played are imported
+_exports = {
+    "BuildAddon": ".build_addon",
+    "ActBuildAddon": ".build_addon",
+    "MorphOrbitals": ".morph_orbitals",
+    "MorphPlanetary": ".morph_planetary",
+    "TerranUnit": ".terran_unit",
+    "AutoDepot": ".auto_depot",
+}
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
@@ -1,5 +1,16 @@
-from .zerg_unit import ZergUnit
-from .morph_townhall import MorphHive, MorphLair
-from .auto_overlord import AutoOverLord
-from .morph_units import MorphOverseer, MorphRavager, MorphBroodLord, MorphOverseerTransport
-from .morph_greater_spire import MorphGreaterSpire
+from sharpy.general.lazy_exports import lazy_exports
+
+# Act modules are imported on first use, so that only acts of the race being played are imported
+_exports = {
+    "ZergUnit": ".zerg_unit",
+    "MorphHive": ".morph_townhall",
+    "MorphLair": ".morph_townhall",
+    "AutoOverLord": ".auto_overlord",
+    "MorphOverseer": ".morph_units",
+    "MorphRavager": ".morph_units",
+    "MorphBroodLord": ".morph_units",
+    "MorphOverseerTransport": ".morph_units",
+    "MorphGreaterSpire": ".morph_greater_spire",
+}
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
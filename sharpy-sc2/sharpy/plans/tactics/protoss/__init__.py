@@ -1,10 +1,17 @@
-from .double_adept_scout import DoubleAdeptScout
-from .hallucinated_phoenix_scout import HallucinatedPhoenixScout
-from .main_defender import PlanMainDefender
-from .plan_hallucinations import PlanHallucination
-from .plan_heat_defender import PlanHeatDefender
-from .plan_heat_observer import PlanHeatObserver
-from .dt_attack import DarkTemplarAttack
-from .oracle_harass import OracleHarass
-from .shield_overcharge import ShieldOvercharge
-from .warp_prism_drop import WarpPrismHarass
+from sharpy.general.lazy_exports import lazy_exports
+
+# Tactics modules are imported on first use, so that only tactics of the race being played are imported
+_exports = {
+    "DoubleAdeptScout": ".double_adept_scout",
+    "HallucinatedPhoenixScout": ".hallucinated_phoenix_scout",
+    "PlanMainDefender": ".main_defender",
+    "PlanHallucination": ".plan_hallucinations",
+    "PlanHeatDefender": ".plan_heat_defender",
+    "PlanHeatObserver": ".plan_heat_observer",
+    "DarkTemplarAttack": ".dt_attack",
+    "OracleHarass": ".oracle_harass",
+    "ShieldOvercharge": ".shield_overcharge",
+    "WarpPrismHarass": ".warp_prism_drop",
+}
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
@@ -1,6 +1,5 @@
 from typing import List, Dict, Optional
 
-from sharpy.managers.combat2.protoss import MicroAdepts
 from sharpy.plans.acts import ActBase
 from sharpy.managers import CooldownManager, GroupCombatManager
 from sc2 import UnitTypeId, AbilityId, Race
@@ -35,6 +34,8 @@ class DoubleAdeptScout(ActBase):
 
     async def start(self, knowledge: "Knowledge"):
         await super().start(knowledge)
+        from sharpy.managers.combat2.protoss import MicroAdepts
+
         self.micro = MicroRules()
         self.micro.load_default_methods()
         self.micro.generic_micro = MicroAdepts(False)
@@ -1,8 +1,16 @@
-from .call_mule import CallMule
-from .continue_building import ContinueBuilding
-from .lower_depots import LowerDepots
-from .man_the_bunkers import ManTheBunkers
-from .repair import Repair
-from .scan_enemy import ScanEnemy
-from .zone_gather_terran import PlanZoneGatherTerran
-from .addon_swap import PlanAddonSwap, ExecuteAddonSwap
+from sharpy.general.lazy_exports import lazy_exports
+
+# Tactics modules are imported on first use, so that only tactics of the race being played are imported
+_exports = {
+    "CallMule": ".call_mule",
+    "ContinueBuilding": ".continue_building",
+    "LowerDepots": ".lower_depots",
+    "ManTheBunkers": ".man_the_bunkers",
+    "Repair": ".repair",
+    "ScanEnemy": ".scan_enemy",
+    "PlanZoneGatherTerran": ".zone_gather_terran",
+    "PlanAddonSwap": ".addon_swap",
+    "ExecuteAddonSwap": ".addon_swap",
+}
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
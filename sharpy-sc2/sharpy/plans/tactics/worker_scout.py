@@ -177,7 +177,8 @@ class WorkerScout(ActBase):
 
         end = target
 
-        result = await self.ai._client.query_pathing(start, end)
+        # Answered from the local path finder until the batched game query result is available
+        result = self.knowledge.pathing_query_manager.distance(start, end)
         return result is None
 
     def target_location_reached(self):
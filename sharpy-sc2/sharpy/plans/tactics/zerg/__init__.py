@@ -1,7 +1,14 @@
-from .inject_larva import InjectLarva
-from .plan_heat_overseer import PlanHeatOverseer
-from .spread_creep import SpreadCreep
-from .spread_creep2 import SpreadCreepV2
-from .counter_terran_tie import CounterTerranTie
-from .overlord_scout import OverlordScout
-from .ling_scout import LingScout
+from sharpy.general.lazy_exports import lazy_exports
+
+# Tactics modules are imported on first use, so that only tactics of the race being played are imported
+_exports = {
+    "InjectLarva": ".inject_larva",
+    "PlanHeatOverseer": ".plan_heat_overseer",
+    "SpreadCreep": ".spread_creep",
+    "SpreadCreepV2": ".spread_creep2",
+    "CounterTerranTie": ".counter_terran_tie",
+    "OverlordScout": ".overlord_scout",
+    "LingScout": ".ling_scout",
+}
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
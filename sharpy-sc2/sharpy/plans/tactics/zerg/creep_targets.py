@@ -0,0 +1,117 @@
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from sc2.position import Point2
+from sc2.unit import Unit
+
+
+class CreepTargets:
+    """
+    Creep tumor target locations on a coarse grid over pathable map cells.
+
+    A target is available when no townhall is closer than townhall_distance, no tumor is closer than
+    tumor_distance and no tumor is about to spawn closer than tumor_distance to it.
+    Townhalls and tumors block targets as counts on the grid. The counts are only updated for units
+    that appeared, moved or disappeared since last update, so the cost of an update does not depend on
+    the number of targets or tumors that stay where they are.
+    Grids are indexed as [y, x] like PixelMap.data_numpy, available targets are listed in the same
+    order as the targets were created, x first.
+    """
+
+    def __init__(self, pathing_grid: np.ndarray, interval: int, townhall_distance: float, tumor_distance: float):
+        """
+        @param pathing_grid: pathing grid indexed as [y, x], targets are placed on pathable cells
+        @param interval: distance between target locations
+        """
+        self.townhall_distance = townhall_distance
+        self.tumor_distance = tumor_distance
+        height, width = pathing_grid.shape
+        self.xs = np.arange(interval, width, interval, dtype=np.float64)
+        self.ys = np.arange(interval, height, interval, dtype=np.float64)
+        self.targets: np.ndarray = pathing_grid[interval:height:interval, interval:width:interval] == 1
+
+        self._townhall_blocks = np.zeros(self.targets.shape, dtype=np.int32)
+        self._tumor_blocks = np.zeros(self.targets.shape, dtype=np.int32)
+        self._townhalls: Dict[int, Point2] = {}
+        self._tumors: Dict[int, Point2] = {}
+        self._used_locations: Set[Point2] = set()
+        self._used_blocks = np.zeros(self.targets.shape, dtype=np.int32)
+
+        self._changed = True
+        self._available: List[Point2] = []
+        self._available_positions = np.zeros((0, 2))
+
+    @property
+    def count(self) -> int:
+        """ Number of all target locations. """
+        return int(np.count_nonzero(self.targets))
+
+    @property
+    def available_grid(self) -> np.ndarray:
+        """ Boolean grid of targets that are available for new tumors. """
+        return self.targets & (self._townhall_blocks == 0) & (self._tumor_blocks == 0) & (self._used_blocks == 0)
+
+    @property
+    def available(self) -> List[Point2]:
+        """ Target locations that are available for new tumors. """
+        self._refresh()
+        return self._available
+
+    def update(self, townhalls: Iterable[Unit], tumors: Iterable[Unit], used_locations: Set[Point2]):
+        """
+        @param townhalls: own townhalls
+        @param tumors: own creep tumors of all types
+        @param used_locations: locations where a tumor is about to spawn or currently spawning
+        """
+        self._sync(self._townhalls, self._townhall_blocks, townhalls, self.townhall_distance)
+        self._sync(self._tumors, self._tumor_blocks, tumors, self.tumor_distance)
+
+        if used_locations != self._used_locations:
+            self._used_locations = set(used_locations)
+            self._used_blocks[:] = 0
+            for position in self._used_locations:
+                self._block(self._used_blocks, position, self.tumor_distance, 1)
+            self._changed = True
+
+    def closest(self, position: Point2) -> Optional[Point2]:
+        """ Returns the closest available target location or None when there are none. """
+        self._refresh()
+        if not self._available:
+            return None
+        deltas = self._available_positions - position
+        return self._available[int(np.argmin(np.einsum("ij,ij->i", deltas, deltas)))]
+
+    def _refresh(self):
+        if not self._changed:
+            return
+
+        x_indices, y_indices = np.nonzero(self.available_grid.T)
+        self._available_positions = np.stack((self.xs[x_indices], self.ys[y_indices]), axis=-1)
+        self._available = [Point2(position) for position in self._available_positions.tolist()]
+        self._changed = False
+
+    def _sync(self, known: Dict[int, Point2], blocks: np.ndarray, units: Iterable[Unit], distance: float):
+        current: Dict[int, Point2] = {unit.tag: unit.position for unit in units}
+
+        for tag, position in known.items():
+            if current.get(tag) != position:
+                self._block(blocks, position, distance, -1)
+                self._changed = True
+
+        for tag, position in current.items():
+            if known.get(tag) != position:
+                self._block(blocks, position, distance, 1)
+                self._changed = True
+
+        known.clear()
+        known.update(current)
+
+    def _block(self, blocks: np.ndarray, position: Point2, distance: float, value: int):
+        """ Adds value to all targets that are closer than distance to position. """
+        x_start, x_end = np.searchsorted(self.xs, (position.x - distance, position.x + distance))
+        y_start, y_end = np.searchsorted(self.ys, (position.y - distance, position.y + distance))
+        dx = self.xs[x_start:x_end] - position.x
+        dy = self.ys[y_start:y_end] - position.y
+        inside = dy[:, np.newaxis] ** 2 + dx[np.newaxis, :] ** 2 < distance ** 2
+        blocks[y_start:y_end, x_start:x_end] += inside * value
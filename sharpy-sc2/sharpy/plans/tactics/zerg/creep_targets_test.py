@@ -0,0 +1,92 @@
+from types import SimpleNamespace
+from typing import List, Set
+
+import numpy as np
+
+from sc2.position import Point2
+from .creep_targets import CreepTargets
+
+TOWNHALL_DISTANCE = 10
+TUMOR_DISTANCE = 8
+
+
+def mock_units(count: int, random: np.random.RandomState, first_tag: int = 1):
+    return [
+        SimpleNamespace(tag=first_tag + index, position=Point2(position))
+        for index, position in enumerate(random.uniform(0, 100, (count, 2)).tolist())
+    ]
+
+
+def available_reference(pathing_grid: np.ndarray, interval: int, townhalls, tumors, used: Set[Point2]) -> List[Point2]:
+    """Available targets filtered one location at a time."""
+    available = []
+    for x in range(interval, pathing_grid.shape[1], interval):
+        for y in range(interval, pathing_grid.shape[0], interval):
+            point = Point2((x, y))
+            if pathing_grid[y, x] != 1:
+                continue
+            if townhalls and min(unit.position.distance_to(point) for unit in townhalls) < TOWNHALL_DISTANCE:
+                continue
+            if tumors and min(unit.position.distance_to(point) for unit in tumors) < TUMOR_DISTANCE:
+                continue
+            if used and point.distance_to_closest(used) < TUMOR_DISTANCE:
+                continue
+            available.append(point)
+    return available
+
+
+def mock_pathing_grid(random: np.random.RandomState) -> np.ndarray:
+    return (random.rand(100, 120) < 0.8).astype(np.uint8)
+
+
+class TestCreepTargets:
+    def test_available_returns_same_targets_as_filtering_each_location(self):
+        random = np.random.RandomState(1)
+        pathing_grid = mock_pathing_grid(random)
+        targets = CreepTargets(pathing_grid, 5, TOWNHALL_DISTANCE, TUMOR_DISTANCE)
+        townhalls = mock_units(3, random)
+        tumors = mock_units(20, random, 100)
+        used = {unit.position.rounded for unit in mock_units(4, random)}
+
+        targets.update(townhalls, tumors, used)
+
+        assert targets.available == available_reference(pathing_grid, 5, townhalls, tumors, used)
+        assert targets.count == len(available_reference(pathing_grid, 5, [], [], set()))
+
+    def test_update_follows_spawned_and_destroyed_units(self):
+        random = np.random.RandomState(2)
+        pathing_grid = mock_pathing_grid(random)
+        targets = CreepTargets(pathing_grid, 4, TOWNHALL_DISTANCE, TUMOR_DISTANCE)
+        townhalls = mock_units(2, random)
+        tumors = mock_units(10, random, 100)
+
+        for frame in range(10):
+            # Tumors spawn and die, used locations change and the other townhall is destroyed
+            tumors = tumors[2:] + mock_units(3, random, 200 + frame * 10)
+            used = {unit.position.rounded for unit in mock_units(frame % 3, random)}
+            if frame == 5:
+                townhalls = townhalls[:1]
+
+            targets.update(townhalls, tumors, used)
+
+            expected = available_reference(pathing_grid, 4, townhalls, tumors, used)
+            assert targets.available == expected
+
+        targets.update([], [], set())
+        assert len(targets.available) == targets.count
+
+    def test_closest_returns_closest_available_target(self):
+        random = np.random.RandomState(3)
+        pathing_grid = mock_pathing_grid(random)
+        targets = CreepTargets(pathing_grid, 5, TOWNHALL_DISTANCE, TUMOR_DISTANCE)
+        tumors = mock_units(15, random)
+        targets.update([], tumors, set())
+
+        for unit in mock_units(20, random):
+            assert targets.closest(unit.position) == unit.position.closest(targets.available)
+
+        # Tumors everywhere
+        positions = [Point2((x, y)) for x in range(0, 120, 4) for y in range(0, 100, 4)]
+        tumors = [SimpleNamespace(tag=tag, position=position) for tag, position in enumerate(positions)]
+        targets.update([], tumors, set())
+        assert targets.closest(Point2((50, 50))) is None
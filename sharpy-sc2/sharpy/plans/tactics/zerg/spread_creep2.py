@@ -6,6 +6,7 @@ from sc2.units import Units
 from sharpy.managers import BuildingSolver
 from sharpy.managers.grids import BlockerType, BuildArea
 from sharpy.plans.acts import ActBase
+from sharpy.plans.tactics.zerg.creep_targets import CreepTargets
 from sc2 import UnitTypeId, AbilityId
 from sc2.position import Point2
 from sc2.unit import Unit
@@ -21,7 +22,7 @@ QUEEN_TO_TARGET_TUMOR_MAX_DISTANCE = 3
 TOWNHALL_MIN_DISTANCE = 10
 CREEP_TUMOR_MIN_DISTANCE = 8
 # Can be lowered to improve creep spread accuracy, or increased to improve performance
-CREEP_TARGET_INTERVAL = 10
+CREEP_TARGET_INTERVAL = 5
 
 # todo:
 # * don't spread creep if hostiles are near
@@ -38,7 +39,7 @@ class SpreadCreepV2(ActBase):
         self.building_solver: BuildingSolver = None
 
         # Contains all the tumor locations that the zerg bot should aim for
-        self.target_tumor_locations = []
+        self.target_tumor_locations: Optional[CreepTargets] = None
         # Filled later in 'update_available_tumor_locations' function
         self.available_tumor_locations = []
         self.queen_plant_location_cache: Dict[int, Point2] = {}
@@ -56,14 +57,9 @@ class SpreadCreepV2(ActBase):
 
     def create_target_tumor_locations(self):
         pathing_grid: np.ndarray = self.ai.game_info.pathing_grid.data_numpy
-        map_shape = pathing_grid.shape
-        # Contains all the tumor locations that the zerg bot should aim for
-        self.target_tumor_locations = [
-            Point2((x, y))
-            for x in range(CREEP_TARGET_INTERVAL, map_shape[1], CREEP_TARGET_INTERVAL)
-            for y in range(CREEP_TARGET_INTERVAL, map_shape[0], CREEP_TARGET_INTERVAL)
-            if pathing_grid[y, x] == 1
-        ]
+        self.target_tumor_locations = CreepTargets(
+            pathing_grid, CREEP_TARGET_INTERVAL, TOWNHALL_MIN_DISTANCE, CREEP_TUMOR_MIN_DISTANCE
+        )
 
     def fill_reserved_expansion_positions(self):
         """ Fill all locations where no creep tumor should be planted at. """
@@ -93,8 +89,6 @@ class SpreadCreepV2(ActBase):
             - Remove all locations that already have a townhall nearby
             - Remove all locations that already have a creep tumor nearby
         """
-        self.available_tumor_locations.clear()
-        # expansions: List[Point2] = self.ai.expansion_locations_list
         townhalls: Units = self.cache.own_townhalls
         tumors: Units = self.cache.own(
             [UnitTypeId.CREEPTUMOR, UnitTypeId.CREEPTUMORQUEEN, UnitTypeId.CREEPTUMORBURROWED]
@@ -106,17 +100,8 @@ class SpreadCreepV2(ActBase):
             if isinstance(tumor.order_target, Point2):
                 self.tumor_used_locations.add(tumor.order_target.rounded)
 
-        for point in self.target_tumor_locations:  # type: Point2
-            if townhalls and townhalls.closest_distance_to(point) < TOWNHALL_MIN_DISTANCE:
-                continue
-            if tumors and tumors.closest_distance_to(point) < CREEP_TUMOR_MIN_DISTANCE:
-                continue
-            if (
-                self.tumor_used_locations
-                and point.distance_to_closest(self.tumor_used_locations) < CREEP_TUMOR_MIN_DISTANCE
-            ):
-                continue
-            self.available_tumor_locations.append(point)
+        self.target_tumor_locations.update(townhalls, tumors, self.tumor_used_locations)
+        self.available_tumor_locations = self.target_tumor_locations.available
 
     async def spread_creep_tumors(self):
         """ Orders tumors to plant new tumors. """
@@ -167,7 +152,7 @@ class SpreadCreepV2(ActBase):
 
         queen_pos: Point2 = queen.position
         # TODO Find the closest by ground path instead of air distance
-        target_pos: Point2 = queen_pos.closest(self.available_tumor_locations)
+        target_pos: Point2 = self.target_tumor_locations.closest(queen_pos)
 
         # Find path and move along the path and find the last location where it is possible to plant a tumor
         path = self.knowledge.pathing_manager.path_finder_terrain.find_path(queen_pos, target_pos)[0]
@@ -198,7 +183,9 @@ class SpreadCreepV2(ActBase):
         """ Tries to find a suitable position for tumors to move to next. """
         tumor_pos: Point2 = tumor.position
         # TODO Find the closest by ground path instead of air distance
-        target_pos = tumor_pos.closest(self.available_tumor_locations)
+        target_pos = self.target_tumor_locations.closest(tumor_pos)
+        if target_pos is None:
+            return self.get_next_creep_tumor_position2(tumor)
 
         path = self.knowledge.pathing_manager.path_finder_terrain.find_path(tumor_pos, target_pos)[0]
         # Skip positions close to the tumor, try to find the location furthest from tumor first
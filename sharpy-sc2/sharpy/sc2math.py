@@ -1,10 +1,10 @@
 import math
 import numpy as np
-from scipy.spatial.distance import cdist, euclidean
 from math import pi
-from typing import List
+from typing import Iterable, List, Optional, Union
 
-from sc2.position import Point2
+from sc2.position import EPSILON, Point2
+from sc2.unit import Unit
 from sc2.units import Units
 
 pi2 = 2 * math.pi
@@ -23,13 +23,7 @@ def to_old_ticks(time_value: float) -> float:
 
 def points_on_circumference(center: Point2, radius, n=10) -> List[Point2]:
     """Calculates all points on the circumference of a circle. n = number of points."""
-    points = [
-        (center.x + (math.cos(2 * pi / n * x) * radius), center.y + (math.sin(2 * pi / n * x) * radius))  # x  # y
-        for x in range(0, n)
-    ]
-
-    point2list = list(map(lambda t: Point2(t), points))
-    return point2list
+    return to_points(circumference_array(center, radius, n))
 
 
 def points_on_circumference_sorted(center: Point2, closest_to: Point2, radius, n=10) -> List[Point2]:
@@ -109,6 +103,68 @@ def point_normalize(point: Point2) -> Point2:
     return Point2((point.x / length, point.y / length))
 
 
+def to_array(points: Iterable[Union[Point2, Unit]]) -> np.ndarray:
+    """Converts points or units to a numpy array of positions with shape (n, 2)."""
+    return np.array([point.position for point in points], dtype=np.float64).reshape(-1, 2)
+
+
+def to_points(positions: np.ndarray) -> List[Point2]:
+    """Converts numpy array of positions with shape (n, 2) to a list of points."""
+    return [Point2(position) for position in positions.tolist()]
+
+
+def towards_all(starts: np.ndarray, targets: np.ndarray, distance: Union[float, np.ndarray], limit=False) -> np.ndarray:
+    """
+    Same as Point2.towards for arrays of positions, calculates the results for all positions in one go.
+    Offsetting positions needs no function, adding an array of shape (2,) or (n, 2) to the positions does it.
+
+    :param starts: positions with shape (n, 2)
+    :param targets: single position or positions with shape (n, 2)
+    :param distance: single distance or distances with shape (n,), negative distance moves away from target
+    :param limit: limits the distance to the distance between start and target
+    :return: numpy array with shape (n, 2)
+    """
+    starts = np.asarray(starts, dtype=np.float64)
+    vectors = np.asarray(targets, dtype=np.float64) - starts
+    lengths = np.hypot(vectors[..., 0], vectors[..., 1])
+    distance = np.asarray(distance, dtype=np.float64)
+    if limit:
+        distance = np.minimum(distance, lengths)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        positions = starts + vectors / lengths[..., np.newaxis] * distance[..., np.newaxis]
+    # Point2.towards returns the start when it equals the target
+    same = (np.abs(vectors) <= EPSILON).all(axis=-1)
+    return np.where(same[..., np.newaxis], starts, positions)
+
+
+def normalize_all(vectors: np.ndarray) -> np.ndarray:
+    """Same as point_normalize for array of vectors with shape (n, 2), zero vectors are returned as they are."""
+    vectors = np.asarray(vectors, dtype=np.float64)
+    lengths = np.sqrt(vectors[..., 0] ** 2 + vectors[..., 1] ** 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normalized = vectors / lengths[..., np.newaxis]
+    return np.where((lengths == 0)[..., np.newaxis], vectors, normalized)
+
+
+def distance_matrix(positions: np.ndarray, others: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Calculates distances between all positions with shape (n, 2) and all other positions with shape (m, 2).
+    :return: numpy array with shape (n, m), distance from positions[i] to others[j] is at [i, j]
+    """
+    from scipy.spatial.distance import cdist
+
+    if others is None:
+        others = positions
+    return cdist(positions, others)
+
+
+def circumference_array(center: Point2, radius, n=10) -> np.ndarray:
+    """Calculates all points on the circumference of a circle as numpy array with shape (n, 2)."""
+    angles = 2 * pi / n * np.arange(n)
+    return np.stack((center.x + np.cos(angles) * radius, center.y + np.sin(angles) * radius), axis=-1)
+
+
 def spiral(N, M):
     """Creates a spiral Point2 generator, use for example 3,3 or 5,5 to create 3x3 matrix or 5x5 matrix"""
     x, y = 0, 0
@@ -160,6 +216,8 @@ def geometric_median(X, eps=1e-5):
     :param eps: epsilon for accuracy
     :return: numpy array with 2 floats
     """
+    from scipy.spatial.distance import cdist, euclidean
+
     y = np.mean(X, 0)
 
     for i in range(30):  # Just to make sure that no endless loops happen
@@ -189,6 +247,66 @@ def geometric_median(X, eps=1e-5):
     return y
 
 
+def geometric_medians(X: np.ndarray, groups: np.ndarray, count: int, start: Optional[np.ndarray] = None, eps=1e-5):
+    """
+    Same as geometric_median for many groups of points at once.
+    :param X: 2D numpy array of points with shape (n, 2)
+    :param groups: group index of each point from 0 to count - 1, every group must have at least one point
+    :param count: number of groups
+    :param start: starting points of the groups with shape (count, 2), defaults to the mean of each group
+    :param eps: epsilon for accuracy
+    :return: numpy array with shape (count, 2)
+    """
+    sizes = np.bincount(groups, minlength=count)
+    if start is None:
+        y = np.stack((np.bincount(groups, X[:, 0], count), np.bincount(groups, X[:, 1], count)), axis=-1)
+        y /= sizes[:, np.newaxis]
+    else:
+        y = np.array(start, dtype=np.float64)
+
+    result = y.copy()
+    active = np.ones(count, dtype=bool)
+
+    for i in range(30):  # Just to make sure that no endless loops happen
+        D = np.hypot(X[:, 0] - y[groups, 0], X[:, 1] - y[groups, 1])
+        nonzeros = D != 0
+
+        Dinv = np.zeros_like(D)
+        Dinv[nonzeros] = 1 / D[nonzeros]
+        Dinvs = np.bincount(groups, Dinv, count)
+        num_zeros = sizes - np.bincount(groups, nonzeros, count)
+
+        # All points of the group are at the median
+        done = active & (num_zeros == sizes)
+        result[done] = y[done]
+        active &= ~done
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            T = np.stack((np.bincount(groups, Dinv * X[:, 0], count), np.bincount(groups, Dinv * X[:, 1], count)), -1)
+            T /= Dinvs[:, np.newaxis]
+            R = (T - y) * Dinvs[:, np.newaxis]
+            r = np.hypot(R[:, 0], R[:, 1])
+            rinv = np.where(r == 0, 0, num_zeros / r)
+
+        y1 = np.where(
+            (num_zeros == 0)[:, np.newaxis],
+            T,
+            np.maximum(0, 1 - rinv)[:, np.newaxis] * T + np.minimum(1, rinv)[:, np.newaxis] * y,
+        )
+
+        converged = active & (np.hypot(y[:, 0] - y1[:, 0], y[:, 1] - y1[:, 1]) < eps)
+        result[converged] = y1[converged]
+        active &= ~converged
+
+        if not active.any():
+            return result
+
+        y = np.where(active[:, np.newaxis], y1, y)
+
+    result[active] = y[active]
+    return result
+
+
 def two_opt(cities, improvement_threshold):
     """2-opt Algorithm adapted from https://en.wikipedia.org/wiki/2-opt"""
 
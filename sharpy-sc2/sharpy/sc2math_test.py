@@ -1,7 +1,18 @@
+import numpy as np
+
 from sc2.position import Point2
 
 from sharpy.managers import UnitValue
-from .sc2math import points_on_circumference, points_on_circumference_sorted
+from .sc2math import (
+    distance_matrix,
+    normalize_all,
+    point_normalize,
+    points_on_circumference,
+    points_on_circumference_sorted,
+    to_array,
+    to_points,
+    towards_all,
+)
 from sc2 import UnitTypeId
 
 unit_values = UnitValue()
@@ -74,3 +85,33 @@ class TestMath:
         assert points[1] == Point2((-1, 0))
         assert points[2] == Point2((0, -1))
         assert points[3] == Point2((1, 0))
+
+    def test_towards_all_returns_same_points_as_towards(self):
+        starts = [Point2((0, 0)), Point2((5, 5)), Point2((10.5, 3.25)), Point2((2, 8))]
+        target = Point2((5, 5))
+
+        for distance in (-3, 2, 20):
+            for limit in (False, True):
+                results = to_points(towards_all(to_array(starts), target, distance, limit))
+                assert results == [start.towards(target, distance, limit) for start in starts]
+
+        targets = [Point2((1, 2)), Point2((5, 5)), Point2((0, 0)), Point2((2, 8))]
+        distances = [1, 2, 3, 4]
+        results = to_points(towards_all(to_array(starts), to_array(targets), np.array(distances)))
+        assert results == [start.towards(target, d) for start, target, d in zip(starts, targets, distances)]
+
+    def test_normalize_all_returns_same_points_as_point_normalize(self):
+        points = [Point2((0, 0)), Point2((3, 4)), Point2((-2, 0.5))]
+
+        assert to_points(normalize_all(to_array(points))) == [point_normalize(point) for point in points]
+
+    def test_distance_matrix_with_points(self):
+        points = [Point2((0, 0)), Point2((3, 4))]
+        others = [Point2((0, 0)), Point2((6, 8)), Point2((3, 0))]
+
+        distances = distance_matrix(to_array(points), to_array(others))
+
+        assert distances.shape == (2, 3)
+        for i, point in enumerate(points):
+            for j, other in enumerate(others):
+                assert abs(distances[i, j] - point.distance_to(other)) < 1e-9
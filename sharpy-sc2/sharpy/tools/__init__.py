@@ -1,2 +1,4 @@
 from .interval_func import IntervalFunc
 from .logging_utility import LoggingUtility
+from .step_profiler import StepProfiler
+from .import_report import ImportReport
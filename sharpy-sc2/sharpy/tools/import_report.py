@@ -0,0 +1,79 @@
+import os
+import re
+import subprocess
+import sys
+from typing import List, NamedTuple
+
+IMPORT_TIME_PATTERN = re.compile(r"import time:\s*(\d+) \|\s*(\d+) \|( *)(\S+)")
+
+
+class ImportTime(NamedTuple):
+    module: str
+    # Time spent in the module itself in microseconds
+    self_us: int
+    # Time spent in the module and all modules it imported in microseconds
+    cumulative_us: int
+    depth: int
+
+
+class ImportReport:
+    """
+    Measures import time of each module with python -X importtime.
+
+    Imports are measured in a new interpreter, so that modules that have already been imported
+    in the current process are measured too.
+    """
+
+    def __init__(self, modules: List[str]):
+        self.modules = modules
+        self.times: List[ImportTime] = []
+
+    @property
+    def total_ms(self) -> float:
+        return sum(item.cumulative_us for item in self.times if item.depth == 0) / 1000
+
+    def measure(self) -> List[ImportTime]:
+        code = "; ".join(f"import {module}" for module in self.modules)
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+            universal_newlines=True,
+        )
+        self.times = self.parse(process.stderr)
+        return self.times
+
+    @staticmethod
+    def parse(text: str) -> List[ImportTime]:
+        times = []
+        for line in text.splitlines():
+            match = IMPORT_TIME_PATTERN.match(line)
+            if match:
+                depth = len(match.group(3)) // 2
+                times.append(ImportTime(match.group(4), int(match.group(1)), int(match.group(2)), depth))
+        return times
+
+    def lines(self, count: int = 40) -> List[str]:
+        """Creates the report with the slowest modules by cumulative and by self time."""
+        result = [f"Importing {', '.join(self.modules)} took {self.total_ms:.0f} ms"]
+
+        result.append("Slowest modules including their imports, ms:")
+        for item in sorted(self.times, key=lambda x: x.cumulative_us, reverse=True)[:count]:
+            result.append(f"{item.cumulative_us / 1000:8.1f} {item.module}")
+
+        result.append("Slowest modules by self time, ms:")
+        for item in sorted(self.times, key=lambda x: x.self_us, reverse=True)[:count]:
+            result.append(f"{item.self_us / 1000:8.1f} {item.module}")
+        return result
+
+    def write(self, file_name: str, count: int = 40):
+        folder = os.path.dirname(file_name)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        with open(file_name, "w") as handle:
+            handle.write("\n".join(self.lines(count)))
+            handle.write("\n")
@@ -0,0 +1,23 @@
+from .import_report import ImportReport
+
+IMPORT_TIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       150 |        150 |     _io
+import time:       300 |        700 |   sharpy.tools.step_profiler
+import time:       250 |       1000 | sharpy.tools
+"""
+
+
+class TestImportReport:
+    def test_parse_returns_times_with_depth(self):
+        times = ImportReport.parse(IMPORT_TIME_OUTPUT)
+
+        assert [item.module for item in times] == ["_io", "sharpy.tools.step_profiler", "sharpy.tools"]
+        assert [item.depth for item in times] == [2, 1, 0]
+        assert times[1].self_us == 300
+        assert times[1].cumulative_us == 700
+
+    def test_total_counts_only_top_level_imports(self):
+        report = ImportReport(["sharpy.tools"])
+        report.times = ImportReport.parse(IMPORT_TIME_OUTPUT)
+
+        assert report.total_ms == 1
@@ -0,0 +1,133 @@
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, List, Callable, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from sharpy.plans.acts import ActBase
+
+
+class StepProfiler:
+    """
+    Opt-in profiler that records wall time per manager and per act for each frame.
+
+    Timings are accumulated during the frame and pushed to a ring buffer per key when the frame ends.
+    Keys are paths separated with "/" such as "update/PathingManager" or "execute/BuildOrder/SequentialList",
+    which allows the collected data to be written as a flame graph compatible folded stack file.
+    """
+
+    def __init__(self, enabled: bool = False, max_frames: int = 2000):
+        self.enabled = enabled
+        self.max_frames = max_frames
+        self.frames = 0
+        self._current: Dict[str, int] = {}
+        self._buffers: Dict[str, Deque[float]] = {}
+        # Total time in nanoseconds for the whole game, used for the flame graph breakdown
+        self._totals: Dict[str, int] = {}
+
+    def add(self, key: str, ns: int):
+        """Adds elapsed time in nanoseconds to the key in current frame."""
+        self._current[key] = self._current.get(key, 0) + ns
+
+    @contextmanager
+    def measure(self, key: str):
+        """Context manager that adds the elapsed time of the block to the key."""
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(key, time.perf_counter_ns() - start)
+
+    def instrument(self, act: "ActBase"):
+        """Replaces execute of the act with a version that records its execution time."""
+        if not self.enabled or getattr(act, "_profiled", False):
+            return
+
+        act._profiled = True
+        execute = act.execute
+        key = "execute/" + act.key
+
+        async def timed_execute() -> bool:
+            start = time.perf_counter_ns()
+            try:
+                return await execute()
+            finally:
+                self.add(key, time.perf_counter_ns() - start)
+
+        act.execute = timed_execute
+
+    def end_frame(self):
+        """Stores timings of the current frame into the ring buffers."""
+        if not self.enabled:
+            return
+
+        for key, ns in self._current.items():
+            buffer = self._buffers.get(key)
+            if buffer is None:
+                buffer = deque(maxlen=self.max_frames)
+                self._buffers[key] = buffer
+            buffer.append(ns / 1000000)
+            self._totals[key] = self._totals.get(key, 0) + ns
+
+        self._current.clear()
+        self.frames += 1
+
+    def stats(self) -> List[Tuple[str, float, float, float]]:
+        """
+        Returns list of (key, p50 ms, p95 ms, max ms) for all recorded keys, sorted by p95 descending.
+        Percentiles are calculated from the frames stored in the ring buffer.
+        """
+        result = []
+        for key, buffer in self._buffers.items():
+            values = np.fromiter(buffer, dtype=np.float64, count=len(buffer))
+            p50, p95 = np.percentile(values, (50, 95))
+            result.append((key, float(p50), float(p95), float(values.max())))
+
+        result.sort(key=lambda x: x[2], reverse=True)
+        return result
+
+    def report(self, print_func: Callable[[str], None], count: int = 30):
+        """Prints the slowest keys with print_func."""
+        if not self.enabled:
+            return
+
+        print_func(f"Profiled {self.frames} frames, key: p50 / p95 / max ms")
+        for key, p50, p95, max_ms in self.stats()[:count]:
+            print_func(f"{key}: {p50:.2f} / {p95:.2f} / {max_ms:.2f}")
+
+    def folded_stacks(self) -> List[str]:
+        """
+        Creates a flame graph compatible folded stack breakdown of total time spent in each key.
+        Each line contains the stack separated with ";" and self time in microseconds.
+        """
+        self_times = dict(self._totals)
+        for key, ns in self._totals.items():
+            # Not every level of the tree is measured (e.g. Step), find the closest measured parent
+            parent = key
+            while "/" in parent:
+                parent = parent.rsplit("/", 1)[0]
+                if parent in self_times:
+                    self_times[parent] -= ns
+                    break
+
+        lines = []
+        for key, ns in sorted(self_times.items()):
+            lines.append(f"{key.replace('/', ';')} {max(0, ns // 1000)}")
+        return lines
+
+    def dump(self, file_name: str):
+        """Writes the folded stack breakdown to file_name."""
+        folder = os.path.dirname(file_name)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        with open(file_name, "w") as handle:
+            handle.write("\n".join(self.folded_stacks()))
+            handle.write("\n")
@@ -0,0 +1,70 @@
+import pytest
+
+from .step_profiler import StepProfiler
+
+
+class TestStepProfiler:
+    def test_end_frame_does_nothing_when_disabled(self):
+        profiler = StepProfiler()
+        with profiler.measure("update"):
+            pass
+
+        profiler.end_frame()
+
+        assert profiler.frames == 0
+        assert profiler.stats() == []
+
+    def test_stats_returns_percentiles_in_milliseconds(self):
+        profiler = StepProfiler(enabled=True)
+        for i in range(1, 101):
+            profiler.add("update/PathingManager", i * 1000000)
+            profiler.end_frame()
+
+        key, p50, p95, max_ms = profiler.stats()[0]
+
+        assert key == "update/PathingManager"
+        assert p50 == pytest.approx(50.5)
+        assert p95 == pytest.approx(95.05)
+        assert max_ms == 100
+
+    def test_ring_buffer_only_keeps_max_frames(self):
+        profiler = StepProfiler(enabled=True, max_frames=10)
+        for i in range(100):
+            profiler.add("update", i * 1000000)
+            profiler.end_frame()
+
+        key, p50, p95, max_ms = profiler.stats()[0]
+
+        assert profiler.frames == 100
+        assert p50 == pytest.approx(94.5)
+
+    def test_folded_stacks_subtracts_children_from_parents(self):
+        profiler = StepProfiler(enabled=True)
+        profiler.add("update", 10000)
+        profiler.add("update/ZoneManager", 3000)
+        profiler.add("execute/BuildOrder", 5000)
+        profiler.add("execute/BuildOrder/Step/GridBuilding", 4000)
+        profiler.end_frame()
+
+        lines = profiler.folded_stacks()
+
+        assert "update 7" in lines
+        assert "update;ZoneManager 3" in lines
+        assert "execute;BuildOrder 1" in lines
+        assert "execute;BuildOrder;Step;GridBuilding 4" in lines
+
+    @pytest.mark.asyncio
+    async def test_instrument_records_act_execution(self):
+        class Act:
+            key = "BuildOrder"
+
+            async def execute(self) -> bool:
+                return True
+
+        profiler = StepProfiler(enabled=True)
+        act = Act()
+        profiler.instrument(act)
+
+        assert await act.execute()
+        profiler.end_frame()
+        assert profiler.stats()[0][0] == "execute/BuildOrder"
@@ -0,0 +1,72 @@
+"""
+Compares UnitClustering to sklearn DBSCAN that was used for grouping units before.
+
+Units are placed in random clumps and moved slightly between frames, like armies moving on the map.
+KD-trees are built beforehand, as UnitCacheManager has already built them when units are grouped.
+Run this file using
+pytest test/benchmark_clustering.py --benchmark-compare
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from scipy.spatial import cKDTree
+from sharpy.general.unit_clustering import UnitClustering
+
+DISTANCE = 7
+FRAMES = 20
+# Maximum movement per axis between frames, most known enemy units are structures or standing still
+FRAME_MOVE = 0.1
+
+
+def create_frames(count: int):
+    random = np.random.RandomState(count)
+    centers = random.uniform(0, 150, (max(1, count // 10), 2))
+    positions = centers[random.randint(0, len(centers), count)] + random.normal(0, 4, (count, 2))
+    frames = []
+    for _ in range(FRAMES):
+        positions = positions + random.uniform(-FRAME_MOVE, FRAME_MOVE, positions.shape)
+        frame = positions.astype(np.float32)
+        frames.append((frame, cKDTree(frame)))
+    return frames
+
+
+@pytest.mark.parametrize("count", [20, 100, 300])
+def test_clustering_dbscan(benchmark, count):
+    cluster = pytest.importorskip("sklearn.cluster")
+    frames = create_frames(count)
+
+    def dbscan():
+        for positions, _ in frames:
+            cluster.DBSCAN(eps=DISTANCE, min_samples=1).fit(positions)
+
+    benchmark(dbscan)
+
+
+@pytest.mark.parametrize("count", [20, 100, 300])
+def test_clustering_full(benchmark, count):
+    frames = create_frames(count)
+
+    def full():
+        clustering = UnitClustering(DISTANCE)
+        for positions, tree in frames:
+            clustering.labels(positions, None, tree)
+
+    benchmark(full)
+
+
+@pytest.mark.parametrize("count", [20, 100, 300])
+def test_clustering_incremental(benchmark, count):
+    frames = create_frames(count)
+    tags = np.arange(count, dtype=np.int64)
+
+    def incremental():
+        clustering = UnitClustering(DISTANCE)
+        for positions, tree in frames:
+            clustering.labels(positions, tags, tree)
+
+    benchmark(incremental)
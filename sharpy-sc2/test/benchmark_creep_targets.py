@@ -0,0 +1,64 @@
+"""
+Compares CreepTargets to filtering every creep tumor target location with closest distances on every frame,
+like SpreadCreepV2 did before.
+
+A few tumors spawn and die on each frame, like when creep is spreading.
+Run this file using
+pytest test/benchmark_creep_targets.py --benchmark-compare
+"""
+import os
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sc2.position import Point2
+from sharpy.plans.tactics.zerg.creep_targets import CreepTargets
+from sharpy.plans.tactics.zerg.creep_targets_test import TOWNHALL_DISTANCE, TUMOR_DISTANCE, available_reference
+
+FRAMES = 20
+
+
+def create_frames(tumor_count: int):
+    random = np.random.RandomState(tumor_count)
+    pathing_grid = (random.rand(176, 184) < 0.7).astype(np.uint8)
+    townhalls = [SimpleNamespace(tag=index, position=Point2(random.uniform(0, 176, 2).tolist())) for index in range(4)]
+    tumors = []
+    frames = []
+    for frame in range(FRAMES):
+        tumors = tumors[2:] if len(tumors) >= tumor_count else tumors
+        tumors = tumors + [
+            SimpleNamespace(tag=1000 + frame * 10 + index, position=Point2(random.uniform(0, 176, 2).tolist()))
+            for index in range(3)
+        ]
+        frames.append((townhalls, tumors, {tumors[-1].position.rounded}))
+    return pathing_grid, frames
+
+
+@pytest.mark.parametrize("interval", [10, 5])
+@pytest.mark.parametrize("tumor_count", [10, 40])
+def test_creep_targets_per_location(benchmark, interval, tumor_count):
+    pathing_grid, frames = create_frames(tumor_count)
+
+    def per_location():
+        for townhalls, tumors, used in frames:
+            available_reference(pathing_grid, interval, townhalls, tumors, used)
+
+    benchmark(per_location)
+
+
+@pytest.mark.parametrize("interval", [10, 5])
+@pytest.mark.parametrize("tumor_count", [10, 40])
+def test_creep_targets_grid(benchmark, interval, tumor_count):
+    pathing_grid, frames = create_frames(tumor_count)
+
+    def grid():
+        targets = CreepTargets(pathing_grid, interval, TOWNHALL_DISTANCE, TUMOR_DISTANCE)
+        for townhalls, tumors, used in frames:
+            targets.update(townhalls, tumors, used)
+            targets.available
+
+    benchmark(grid)
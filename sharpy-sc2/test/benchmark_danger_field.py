@@ -0,0 +1,61 @@
+"""
+Compares batched EnemyUnitsManager.danger_values to scoring each unit and position with the single unit loop.
+
+Scores 100 known enemy units for 50 own units at 50 candidate positions, like micro picking the safest
+position to move to for each unit.
+Run this file using
+pytest test/benchmark_danger_field.py --benchmark-compare
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sc2.position import Point2
+from sharpy.managers.enemy_units_manager_test import danger_value_reference, mock_manager, mock_units
+
+ENEMIES = 100
+QUERIES = 50
+
+
+def create_query():
+    random = np.random.RandomState(ENEMIES)
+    manager = mock_manager(mock_units(ENEMIES, random))
+    own_units = mock_units(QUERIES, random)
+    positions = [Point2(position) for position in random.uniform(0, 40, (QUERIES, 2)).tolist()]
+    return manager, own_units, positions
+
+
+def test_danger_value_loop(benchmark):
+    manager, own_units, positions = create_query()
+
+    def loop():
+        for unit in own_units:
+            for position in positions:
+                danger_value_reference(manager, unit, position)
+
+    benchmark(loop)
+
+
+def test_danger_value_single(benchmark):
+    manager, own_units, positions = create_query()
+
+    def single():
+        for unit in own_units:
+            for position in positions:
+                manager.danger_value(unit, position)
+
+    benchmark(single)
+
+
+def test_danger_values_batched(benchmark):
+    manager, own_units, positions = create_query()
+
+    def batched():
+        # Field is rebuilt on every round as it would be on a new frame
+        manager.ai.state.game_loop += 1
+        manager.danger_values(own_units, positions)
+
+    benchmark(batched)
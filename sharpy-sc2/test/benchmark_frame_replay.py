@@ -0,0 +1,36 @@
+"""
+Regression gate for manager update times, using the offline frame replay on every pickled map.
+
+Run this file using
+pytest test/benchmark_frame_replay.py --benchmark-autosave
+pytest test/benchmark_frame_replay.py --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.dirname(__file__))
+
+from frame_replay import FrameReplay
+from pickled_maps import pickled_map_files
+from sharpy.tools import StepProfiler
+
+FRAMES = 20
+
+
+@pytest.mark.parametrize("file", pickled_map_files(), ids=os.path.basename)
+def test_frame_replay(benchmark, file):
+    pytest.importorskip("sc2pathlibp.sc2pathlib")
+    loop = asyncio.get_event_loop()
+
+    def setup():
+        replay = FrameReplay(file, StepProfiler(True, FRAMES))
+        loop.run_until_complete(replay.start())
+        return (replay,), {}
+
+    def run(replay: FrameReplay):
+        loop.run_until_complete(replay.run(FRAMES))
+
+    benchmark.pedantic(run, setup=setup, rounds=3)
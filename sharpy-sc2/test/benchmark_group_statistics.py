@@ -0,0 +1,77 @@
+"""
+Compares GroupStatistics to calculating centers and speeds for each group separately, like CombatUnits did before.
+
+Units are placed in random clumps and moved slightly between frames, like armies moving on the map.
+Run this file using
+pytest test/benchmark_group_statistics.py --benchmark-compare
+"""
+import os
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sc2.position import Point2
+from sharpy import sc2math
+from sharpy.general.group_statistics import GroupStatistics
+from sharpy.general.unit_clustering import UnitClustering
+
+FRAMES = 20
+FRAME_MOVE = 0.1
+
+unit_values = SimpleNamespace(real_speed=lambda unit: unit.speed)
+
+
+def create_frames(count: int):
+    random = np.random.RandomState(count)
+    centers = random.uniform(0, 150, (max(1, count // 10), 2))
+    positions = centers[random.randint(0, len(centers), count)] + random.normal(0, 4, (count, 2))
+    flying = random.rand(count) < 0.2
+    frames = []
+    for _ in range(FRAMES):
+        positions = positions + random.uniform(-FRAME_MOVE, FRAME_MOVE, positions.shape)
+        units = [
+            SimpleNamespace(
+                position=Point2(position),
+                tag=index,
+                is_flying=bool(flying[index]),
+                energy_percentage=0,
+                radius=0.5,
+                speed=3.15,
+            )
+            for index, position in enumerate(positions.tolist())
+        ]
+        frames.append((units, UnitClustering(7).labels(positions)))
+    return frames
+
+
+@pytest.mark.parametrize("count", [20, 100, 300])
+def test_group_statistics_per_group(benchmark, count):
+    frames = create_frames(count)
+
+    def per_group():
+        for units, labels in frames:
+            for group in range(int(labels.max()) + 1):
+                group_units = [unit for unit, label in zip(units, labels) if label == group]
+                median = Point2(sc2math.geometric_median(np.array([unit.position for unit in group_units]), 0.5))
+                ground_units = [unit for unit in group_units if not unit.is_flying]
+                if ground_units:
+                    min(ground_units, key=lambda unit: unit.position.distance_to(median))
+                sum(unit_values.real_speed(unit) for unit in group_units) / len(group_units)
+
+    benchmark(per_group)
+
+
+@pytest.mark.parametrize("count", [20, 100, 300])
+def test_group_statistics_batched(benchmark, count):
+    frames = create_frames(count)
+
+    def batched():
+        statistics = GroupStatistics()
+        for units, labels in frames:
+            statistics.calculate(units, labels, unit_values)
+
+    benchmark(batched)
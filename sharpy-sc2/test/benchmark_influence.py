@@ -0,0 +1,74 @@
+"""
+Compares numpy influence stamping in InfluenceGrid to the sc2pathlib Sc2Map influence calls.
+
+Enemy positions are picked randomly from the pathable cells of the pickled maps.
+Run this file using
+pytest test/benchmark_influence.py --benchmark-compare
+"""
+import os
+import random
+import sys
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.dirname(__file__))
+
+from pickled_maps import load_bots
+from sharpy.mapping.influence_grid import InfluenceGrid
+
+ENEMY_COUNT = 100
+# (ground range, fade range, influence) for a few typical unit types
+UNIT_TYPES = [(0, 7, 10), (5, 8, 14), (6, 9, 20), (1, 7, 8)]
+
+random.seed(1)
+maps = []
+for bot in load_bots():
+    grid = bot.game_info.pathing_grid.data_numpy
+    ys, xs = np.nonzero(grid)
+    picks = [random.randrange(len(xs)) for _ in range(ENEMY_COUNT)]
+    positions = [(float(xs[i]) + 0.5, float(ys[i]) + 0.5) for i in picks]
+    maps.append((bot.game_info, positions))
+
+
+def stamp_groups(positions: List[Tuple[float, float]]):
+    step = len(positions) // len(UNIT_TYPES)
+    for index, (full_range, fade_range, influence) in enumerate(UNIT_TYPES):
+        yield positions[index * step : (index + 1) * step], full_range, fade_range, influence
+
+
+def influence_numpy():
+    for game_info, positions in maps:
+        grid = InfluenceGrid(game_info.pathing_grid.width, game_info.pathing_grid.height)
+        for group, full_range, fade_range, influence in stamp_groups(positions):
+            grid.add(group, influence, full_range, fade_range, True, False)
+            grid.add(group, influence, full_range, fade_range + 3, False, True)
+        _ = grid.ground
+        _ = grid.air
+
+
+def test_influence_numpy(benchmark):
+    benchmark(influence_numpy)
+
+
+def test_influence_sc2map(benchmark):
+    sc2pathlibp = pytest.importorskip("sc2pathlibp")
+    sc2maps = []
+    for game_info, positions in maps:
+        sc2map = sc2pathlibp.Sc2Map(
+            game_info.pathing_grid.data_numpy,
+            game_info.placement_grid.data_numpy,
+            game_info.terrain_height.data_numpy,
+            game_info.playable_area,
+        )
+        sc2maps.append((sc2map, positions))
+
+    def influence_sc2map():
+        for sc2map, positions in sc2maps:
+            sc2map.normalize_influence(20)
+            for group, full_range, fade_range, influence in stamp_groups(positions):
+                sc2map.add_pure_ground_influence(group, influence, full_range, fade_range)
+                sc2map.add_air_influence(group, influence, full_range, fade_range + 3)
+
+    benchmark(influence_sc2map)
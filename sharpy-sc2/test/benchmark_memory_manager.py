@@ -0,0 +1,91 @@
+"""
+Compares MemoryManager to checking visibility of each remembered unit with four grid points and rebuilding
+ghost units on every access, like MemoryManager did before.
+
+Hundreds of enemy units are remembered, some of them are visible and ghost units are accessed a few times
+on every frame, like late in the game.
+Run this file using
+pytest test/benchmark_memory_manager.py --benchmark-compare
+"""
+import asyncio
+import os
+import sys
+from typing import Dict, List
+
+import numpy as np
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sc2.position import Point2
+from sc2.units import Units
+from sharpy.managers.memory_manager import MemoryManager
+from sharpy.managers.memory_manager_test import MockAI, mock_unit
+
+FRAMES = 20
+GHOST_ACCESSES = 4
+
+
+def create_frames(count: int):
+    random = np.random.RandomState(count)
+    positions = random.uniform(0, 50, (count, 2))
+    units = [mock_unit(tag, x, y) for tag, (x, y) in enumerate(positions.tolist())]
+    frames = [(units, None)]
+    for _ in range(FRAMES):
+        visible = random.rand(count) < 0.2
+        frames.append(([unit for unit, seen in zip(units, visible) if seen], ((0, 0), (10, 10))))
+    return frames
+
+
+def run_per_unit(frames):
+    """Visibility and ghost units with the single unit loops."""
+    ai = MockAI()
+    memory: Dict[int, object] = {}
+    for enemy_units, visible_area in frames:
+        ai.next_frame(enemy_units, visible_area)
+        by_tag = {unit.tag: unit for unit in enemy_units}
+        for unit in enemy_units:
+            memory[unit.tag] = unit
+
+        for _ in range(GHOST_ACCESSES):
+            Units([unit for tag, unit in memory.items() if tag not in by_tag], ai)
+
+        visibility = ai.state.visibility.data_numpy
+        removed: List[int] = []
+        for tag, unit in memory.items():
+            if tag in by_tag:
+                continue
+            points = [
+                Point2((int(unit.position.x), int(unit.position.y))),
+                Point2((int(unit.position.x + 1), int(unit.position.y))),
+                Point2((int(unit.position.x), int(unit.position.y + 1))),
+                Point2((int(unit.position.x + 1), int(unit.position.y + 1))),
+            ]
+            if all(visibility[point.rounded[1], point.rounded[0]] == 2 for point in points):
+                removed.append(tag)
+        for tag in removed:
+            memory.pop(tag)
+
+
+def run_manager(frames):
+    manager = MemoryManager()
+    manager.ai = MockAI()
+    loop = asyncio.new_event_loop()
+    for enemy_units, visible_area in frames:
+        manager.ai.next_frame(enemy_units, visible_area)
+        for _ in range(GHOST_ACCESSES):
+            manager.ghost_units
+        loop.run_until_complete(manager.update())
+    loop.close()
+
+
+@pytest.mark.parametrize("count", [100, 500])
+def test_memory_per_unit(benchmark, count):
+    frames = create_frames(count)
+    benchmark(run_per_unit, frames)
+
+
+@pytest.mark.parametrize("count", [100, 500])
+def test_memory_manager(benchmark, count):
+    frames = create_frames(count)
+    benchmark(run_manager, frames)
@@ -0,0 +1,304 @@
+"""
+Offline frame replay benchmark for sharpy managers.
+
+Boots Knowledge with all default managers on the pickled maps in python-sc2/test/pickle_data and drives
+synthetic update frames without SC2. Own units wander around their position and a group of enemy units
+marches from the enemy start location towards our base. Reports start time and per frame
+update / post_update time of every manager, and optionally the memory allocated by each manager.
+
+Run this file using
+python test/frame_replay.py --frames 100
+python test/frame_replay.py --frames 50 --maps Acropolis EverDream --allocations --output data/replay.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+
+sys.path.append(os.path.dirname(__file__))
+
+from pickled_maps import load_raw, pickled_map_files
+from sc2.data import Alliance
+from sc2.game_data import GameData
+from sc2.game_info import GameInfo
+from sc2.game_state import GameState
+from sc2.position import Point2
+from s2clientprotocol import sc2api_pb2 as sc_pb
+from sharpy.knowledges import KnowledgeBot
+from sharpy.managers import ManagerBase
+from sharpy.plans import BuildOrder
+from sharpy.tools import StepProfiler
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+ENEMY_TAG_OFFSET = 0x30000000
+
+
+class ReplayClient:
+    """Stands in for sc2.client.Client and answers the queries managers make without SC2."""
+
+    def __init__(self):
+        self.game_step = 4
+
+    async def ping(self):
+        # Older versions make VersionManager remap the global id enums, which would break the following maps
+        return SimpleNamespace(ping=SimpleNamespace(game_version="5.0.6.83830", base_build=83830))
+
+    async def query_pathing(self, start, end) -> float:
+        return Point2(start).distance_to(Point2(end))
+
+    async def query_pathings(self, zipped_list) -> List[float]:
+        return [Point2(start).distance_to(Point2(end)) for start, end in zipped_list]
+
+    async def query_available_abilities(self, units, ignore_resource_requirements: bool = False):
+        return [[] for _ in units]
+
+    async def chat_send(self, message: str, team_only: bool):
+        pass
+
+    def __getattr__(self, name: str):
+        if name.startswith("debug_"):
+            return lambda *args, **kwargs: None
+        raise AttributeError(name)
+
+
+class ReplayBot(KnowledgeBot):
+    def __init__(self):
+        # KnowledgeBot reads config.ini from the working directory
+        cwd = os.getcwd()
+        os.chdir(ROOT)
+        try:
+            super().__init__("Replay")
+        finally:
+            os.chdir(cwd)
+
+        general = self.config["general"]
+        # Nothing is written to disk and nothing is cached between maps, so that runs are reproducible
+        general["debug"] = "no"
+        general["chat"] = "no"
+        general["write_data"] = "no"
+        general["map_cache"] = "no"
+        general["profile"] = "no"
+
+    async def create_plan(self) -> BuildOrder:
+        return BuildOrder([])
+
+
+class FrameReplay:
+    """
+    Runs Knowledge update on synthetic frames created from a pickled game state.
+    """
+
+    def __init__(self, file: str, profiler: StepProfiler, enemy_count: int = 20, seed: int = 1):
+        self.file = file
+        self.profiler = profiler
+        self.enemy_count = enemy_count
+        self.random = random.Random(seed)
+        self.iteration = 0
+        self.start_times: Dict[str, float] = {}
+        self.allocations: Dict[str, List[int]] = {}
+
+        raw_game_data, self.raw_game_info, raw_observation = load_raw(file)
+        # Copy the observation as units are moved in it
+        self.observation = sc_pb.ResponseObservation()
+        self.observation.CopyFrom(raw_observation)
+
+        self.bot = ReplayBot()
+        self.bot._initialize_variables()
+        self.bot._prepare_start(
+            client=ReplayClient(),
+            player_id=1,
+            game_info=GameInfo(self.raw_game_info.game_info),
+            game_data=GameData(raw_game_data.data),
+        )
+        self.bot._prepare_step(GameState(self.observation), self.raw_game_info)
+        self.bot._prepare_first_step()
+        self.map_name = self.bot.game_info.map_name
+        self.structure_tags = set(self.bot.structures.tags)
+
+        self.knowledge = self.bot.knowledge
+        self.knowledge.profiler = profiler
+        self._add_enemies()
+
+    async def start(self):
+        """Starts all managers and records how long each start took."""
+        self.knowledge.pre_start(self.bot, None)
+        for manager in self.knowledge.managers:
+            self._instrument_start(manager)
+        await self.knowledge.start()
+
+    def record_allocations(self):
+        """Records memory allocated by each manager update, tracemalloc must be started for this."""
+        for manager in self.knowledge.managers:
+            self._instrument_allocations(manager, "update")
+            self._instrument_allocations(manager, "post_update")
+
+    async def run(self, frames: int):
+        for _ in range(frames):
+            self._next_state()
+            with self.profiler.measure("update"):
+                await self.knowledge.update(self.iteration)
+            with self.profiler.measure("post_update"):
+                await self.knowledge.post_update()
+            self.profiler.end_frame()
+            self.iteration += 1
+
+    def _add_enemies(self):
+        units = self.observation.observation.raw_data.units
+        own = [unit for unit in units if unit.alliance == Alliance.Self.value]
+        if not own or not self.bot.enemy_start_locations:
+            return
+
+        enemy_start = self.bot.enemy_start_locations[0]
+        for index in range(self.enemy_count):
+            enemy = units.add()
+            enemy.CopyFrom(own[index % len(own)])
+            enemy.tag = ENEMY_TAG_OFFSET + index
+            enemy.alliance = Alliance.Enemy.value
+            enemy.owner = 3 - self.bot.player_id
+            enemy.pos.x = enemy_start.x + self.random.uniform(-6, 6)
+            enemy.pos.y = enemy_start.y + self.random.uniform(-6, 6)
+
+    def _next_state(self):
+        observation = self.observation.observation
+        observation.game_loop += self.bot.client.game_step
+        target = self.bot.start_location
+        area = self.bot.game_info.playable_area
+
+        for unit in observation.raw_data.units:
+            if unit.alliance == Alliance.Self.value:
+                if unit.tag in self.structure_tags:
+                    continue
+                unit.pos.x += self.random.uniform(-0.3, 0.3)
+                unit.pos.y += self.random.uniform(-0.3, 0.3)
+            elif unit.alliance == Alliance.Enemy.value:
+                # March towards our start location
+                position = Point2((unit.pos.x, unit.pos.y)).towards(target, 0.5)
+                unit.pos.x = position.x + self.random.uniform(-0.2, 0.2)
+                unit.pos.y = position.y + self.random.uniform(-0.2, 0.2)
+            else:
+                continue
+
+            unit.pos.x = min(max(unit.pos.x, area.x), area.right - 1)
+            unit.pos.y = min(max(unit.pos.y, area.y), area.top - 1)
+
+        self.bot._prepare_step(GameState(self.observation), self.raw_game_info)
+
+    def _instrument_start(self, manager: ManagerBase):
+        start = manager.start
+        name = type(manager).__name__
+
+        async def timed_start(knowledge):
+            ns = time.perf_counter_ns()
+            try:
+                return await start(knowledge)
+            finally:
+                self.start_times[name] = self.start_times.get(name, 0) + (time.perf_counter_ns() - ns) / 1000000
+
+        manager.start = timed_start
+
+    def _instrument_allocations(self, manager: ManagerBase, method_name: str):
+        method = getattr(manager, method_name)
+        key = f"{method_name}/{type(manager).__name__}"
+        allocations = self.allocations.setdefault(key, [])
+
+        async def traced():
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            try:
+                return await method()
+            finally:
+                current, peak = tracemalloc.get_traced_memory()
+                # Without reset_peak (Python < 3.9), only the memory that is still in use can be measured
+                allocations.append((peak if hasattr(tracemalloc, "reset_peak") else current) - before)
+
+        setattr(manager, method_name, traced)
+
+
+def replay_maps(
+    files: List[str], frames: int, enemy_count: int, allocations: bool
+) -> Tuple[StepProfiler, Dict[str, List[float]], Dict[str, List[int]]]:
+    """Runs the frame replay on each map file, returns profiler, start times and allocations of managers."""
+    profiler = StepProfiler(True, max_frames=frames * len(files))
+    start_times: Dict[str, List[float]] = {}
+    all_allocations: Dict[str, List[int]] = {}
+    loop = asyncio.get_event_loop()
+
+    if allocations:
+        tracemalloc.start()
+
+    for file in files:
+        replay = FrameReplay(file, profiler, enemy_count)
+        loop.run_until_complete(replay.start())
+        if allocations:
+            replay.record_allocations()
+        loop.run_until_complete(replay.run(frames))
+
+        for name, ms in replay.start_times.items():
+            start_times.setdefault(name, []).append(ms)
+        for key, values in replay.allocations.items():
+            all_allocations.setdefault(key, []).extend(values)
+
+    if allocations:
+        tracemalloc.stop()
+    return profiler, start_times, all_allocations
+
+
+def report(
+    profiler: StepProfiler, start_times: Dict[str, List[float]], allocations: Dict[str, List[int]], map_count: int
+) -> dict:
+    start = {name: sum(values) / len(values) for name, values in start_times.items()}
+    frames = {key: {"p50": p50, "p95": p95, "max": max_ms} for key, p50, p95, max_ms in profiler.stats()}
+    allocated = {key: sum(values) / len(values) / 1024 for key, values in allocations.items() if values}
+    return {"maps": map_count, "frames": profiler.frames, "start": start, "update": frames, "allocations": allocated}
+
+
+def print_report(result: dict):
+    print(f"Replayed {result['frames']} frames on {result['maps']} maps")
+    print("Manager start, mean ms:")
+    for name, ms in sorted(result["start"].items(), key=lambda x: x[1], reverse=True):
+        print(f"{ms:10.2f} {name}")
+
+    print("Frame update, p50 / p95 / max ms:")
+    for key, values in result["update"].items():
+        print(f"{values['p50']:10.3f} {values['p95']:10.3f} {values['max']:10.3f} {key}")
+
+    if result["allocations"]:
+        print("Allocated per frame, mean KiB:")
+        for key, kib in sorted(result["allocations"].items(), key=lambda x: x[1], reverse=True):
+            print(f"{kib:10.1f} {key}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replays synthetic frames on pickled maps and times managers.")
+    parser.add_argument("--frames", type=int, default=100, help="Frames to run on each map")
+    parser.add_argument("--enemies", type=int, default=20, help="Enemy units added to each map")
+    parser.add_argument("--maps", nargs="*", help="Only run maps whose file name contains one of these")
+    parser.add_argument("--allocations", action="store_true", help="Record allocations, slows down timings")
+    parser.add_argument("--output", type=str, help="Write the results as json to this file")
+    args = parser.parse_args()
+
+    files = pickled_map_files()
+    if args.maps:
+        files = [f for f in files if any(name.lower() in os.path.basename(f).lower() for name in args.maps)]
+
+    profiler, start_times, allocations = replay_maps(files, args.frames, args.enemies, args.allocations)
+    result = report(profiler, start_times, allocations, len(files))
+    print_report(result)
+
+    if args.output:
+        folder = os.path.dirname(args.output)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(args.output, "w") as handle:
+            json.dump(result, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Helpers for loading the lzma pickled game states in python-sc2/test/pickle_data without a running SC2 client.
+"""
+import lzma
+import os
+import pickle
+import sys
+from typing import Iterable, List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "python-sc2"))
+
+from sc2.bot_ai import BotAI
+from sc2.game_data import GameData
+from sc2.game_info import GameInfo
+from sc2.game_state import GameState
+
+PICKLE_FOLDER = os.path.join(os.path.dirname(__file__), "..", "python-sc2", "test", "pickle_data")
+
+
+def pickled_map_files() -> List[str]:
+    """Returns full paths to all pickled map files."""
+    return sorted(os.path.join(PICKLE_FOLDER, f) for f in os.listdir(PICKLE_FOLDER) if f.endswith(".xz"))
+
+
+def load_raw(file: str) -> tuple:
+    """Loads pickled raw game data, game info and observation responses."""
+    with lzma.open(file, "rb") as f:
+        return pickle.load(f)
+
+
+def load_bot(file: str, bot: BotAI = None) -> BotAI:
+    """Loads pickled game state into a fresh bot object."""
+    raw_game_data, raw_game_info, raw_observation = load_raw(file)
+
+    if bot is None:
+        bot = BotAI()
+    game_data = GameData(raw_game_data.data)
+    game_info = GameInfo(raw_game_info.game_info)
+    game_state = GameState(raw_observation)
+    bot._initialize_variables()
+    bot._prepare_start(client=None, player_id=1, game_info=game_info, game_data=game_data)
+    bot._prepare_step(state=game_state, proto_game_info=raw_game_info)
+    return bot
+
+
+def load_bots() -> Iterable[BotAI]:
+    for file in pickled_map_files():
+        yield load_bot(file)
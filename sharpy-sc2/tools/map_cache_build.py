@@ -0,0 +1,71 @@
+"""
+Prebuilds map cache in data/maps for known melee maps, so that bots load map analysis, zone paths and
+building layouts from disk instead of calculating them at game start.
+
+Plays a short game against the built-in ai on each installed map. Spawn locations are random and
+every spawn has its own cache, so use --games to play more games on each map.
+
+Run this file from the sharpy-sc2 folder using
+python tools/map_cache_build.py
+python tools/map_cache_build.py --maps AcropolisLE ZenLE --games 4 --races protoss terran
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+sys.path.insert(1, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "python-sc2")))
+
+import sc2
+from sc2 import Difficulty, Race, maps
+from sc2.player import Bot, Computer
+from bot_loader.game_starter import GameStarter, known_melee_maps
+from sharpy.knowledges import KnowledgeBot
+from sharpy.plans import BuildOrder
+
+races = {"protoss": Race.Protoss, "terran": Race.Terran, "zerg": Race.Zerg}
+
+
+class MapCacheBot(KnowledgeBot):
+    """Fills map cache at game start and leaves the game after the first frame."""
+
+    def __init__(self):
+        super().__init__("MapCache")
+        general = self.config["general"]
+        general["map_cache"] = "yes"
+        general["chat"] = "no"
+        general["write_data"] = "no"
+
+    async def create_plan(self) -> BuildOrder:
+        return BuildOrder([])
+
+    async def on_step(self, iteration: int):
+        await super().on_step(iteration)
+        if iteration > 0:
+            # Building layout is solved on the first frame
+            await self._client.leave()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prebuild map cache for known melee maps.")
+    parser.add_argument("--maps", nargs="*", help="Maps to build, defaults to installed known melee maps")
+    parser.add_argument("--games", type=int, default=2, help="Games to play on each map and race for spawns")
+    parser.add_argument("--races", nargs="*", default=["protoss"], choices=races.keys(), help="Races of our bot")
+    args = parser.parse_args()
+
+    installed = GameStarter.installed_maps()
+    map_names = args.maps or [name for name in known_melee_maps if name in installed]
+
+    for map_name in map_names:
+        for race_name in args.races:
+            for _ in range(args.games):
+                print(f"Building map cache for {map_name} as {race_name}")
+                sc2.run_game(
+                    maps.get(map_name),
+                    [Bot(races[race_name], MapCacheBot()), Computer(Race.Random, Difficulty.VeryEasy)],
+                    realtime=False,
+                )
+
+
+if __name__ == "__main__":
+    main()